@@ -0,0 +1,73 @@
+"""
+Benchmarks reuse the Django settings of the test suite.
+
+Run them from the project root:
+
+    python -m pytest benchmarks
+
+Besides the timing table of pytest-benchmark, the peak traced memory of one call and
+the number of memory blocks still allocated after it are reported for each benchmark,
+and saved in `extra_info` of the JSON report (--benchmark-json).
+"""
+
+import gc
+import sys
+import tracemalloc
+
+import pytest
+
+from django_viewcomponent import component
+from tests.conftest import pytest_configure  # noqa: F401
+
+_allocations = {}
+
+
+@pytest.fixture(autouse=True)
+def cleanup_after_each_benchmark():
+    yield
+
+    # NOTE: component.registry is global, so need to clear after each benchmark
+    component.registry.clear()
+
+
+@pytest.fixture
+def measure(benchmark, request):
+    """
+    Benchmark the function, then call it once more to measure the allocations
+    """
+
+    def run(func, *args, **kwargs):
+        result = benchmark(func, *args, **kwargs)
+
+        gc.collect()
+        blocks_before = sys.getallocatedblocks()
+        tracemalloc.start()
+        try:
+            func(*args, **kwargs)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        gc.collect()
+        blocks = sys.getallocatedblocks() - blocks_before
+
+        benchmark.extra_info["peak_memory_kb"] = round(peak / 1024, 1)
+        benchmark.extra_info["retained_blocks"] = blocks
+        _allocations[request.node.name] = (peak, blocks)
+        return result
+
+    return run
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _allocations:
+        return
+
+    terminalreporter.section("allocations")
+    width = max(len(name) for name in _allocations)
+    terminalreporter.write_line(
+        f"{'Name':<{width}}  {'Peak memory (KB)':>16}  {'Retained blocks':>16}",
+    )
+    for name, (peak, blocks) in sorted(_allocations.items()):
+        terminalreporter.write_line(
+            f"{name:<{width}}  {peak / 1024:>16.1f}  {blocks:>16}",
+        )
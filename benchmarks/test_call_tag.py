@@ -0,0 +1,34 @@
+"""
+Cost of many {% call %} tags in a single component.
+"""
+
+import pytest
+from django.template import Context, Template
+
+from django_viewcomponent import component
+from django_viewcomponent.fields import RendersManyField
+
+
+class ListComponent(component.Component):
+    items = RendersManyField()
+
+    template = """
+    <ul>{% for item in self.items.value %}<li>{{ item }}</li>{% endfor %}</ul>
+    """
+
+
+@pytest.mark.benchmark(group="call-tag")
+def test_call_tag_300_items(measure):
+    component.registry.register("list", ListComponent)
+    template = Template(
+        """
+        {% load viewcomponent_tags %}
+        {% component "list" as c %}
+            {% for i in items %}{% call c.items %}{{ i }}{% endcall %}{% endfor %}
+        {% endcomponent %}
+        """,
+    )
+    context = Context({"items": range(300)})
+
+    rendered = measure(template.render, context)
+    assert rendered.count("<li>") == 300
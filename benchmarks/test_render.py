@@ -0,0 +1,294 @@
+"""
+Rendering hot paths of components.
+"""
+
+import pytest
+from django.template import Context, Template
+from django.test import Client
+from django.urls import reverse
+from django.utils.safestring import mark_safe
+
+from django_viewcomponent import component
+from django_viewcomponent.compiler import render_compiled
+from django_viewcomponent.fields import RendersManyField, RendersOneField
+from tests.testapp.layout import HTML, Button, Div
+
+
+class ItemComponent(component.Component):
+    template = '<span class="item">{{ self.name }}</span>'
+
+    def __init__(self, name="", **kwargs):
+        self.name = name
+
+
+class NestedComponent(component.Component):
+    template = """
+    {% load viewcomponent_tags %}
+    <div>{% if self.depth %}{% component "nested" depth=self.depth|add:"-1" %}{% endcomponent %}{% endif %}</div>
+    """
+
+    def __init__(self, depth, **kwargs):
+        self.depth = depth
+
+
+class ListComponent(component.Component):
+    items = RendersManyField(component="item")
+
+    template = """
+    <ul>{% for item in self.items.value %}<li>{{ item }}</li>{% endfor %}</ul>
+    """
+
+
+class AvatarComponent(component.Component):
+    template = '<img src="{{ self.src }}" alt="{{ self.alt }}">'
+
+    def __init__(self, src, alt, **kwargs):
+        self.src = src
+        self.alt = alt
+
+
+class ListItemComponent(component.Component):
+    item = RendersOneField(
+        required=True,
+        types={
+            "avatar": "avatar",
+            "span": lambda content, **kwargs: mark_safe(f"<span>{content}</span>"),
+        },
+    )
+
+    template = "<li>{{ self.item.value }}</li>"
+
+
+class CallableListComponent(component.Component):
+    items = RendersManyField(
+        component=lambda self, content, name, **kwargs: ItemComponent(name=name),
+    )
+
+    template = """
+    <ul>{% for item in self.items.value %}<li>{{ item }}</li>{% endfor %}</ul>
+    """
+
+
+class BadgeComponent(component.Component):
+    template = """
+    <span class="badge badge-{{ self.variant }}{% if self.pill %} badge-pill{% endif %}">
+      {% if self.icon %}<i class="icon-{{ self.icon }}"></i>{% endif %}
+      {{ self.label }}{% if self.count %} <b>{{ self.count }}</b>{% endif %}
+    </span>
+    """
+
+    def __init__(
+        self,
+        label,
+        variant="primary",
+        pill=False,
+        icon=None,
+        count=0,
+        **kwargs,
+    ):
+        self.label = label
+        self.variant = variant
+        self.pill = pill
+        self.icon = icon
+        self.count = count
+
+
+class CompiledBadgeComponent(BadgeComponent):
+    compile_template = True
+
+
+@pytest.fixture(autouse=True)
+def register_components():
+    component.registry.register("item", ItemComponent)
+    component.registry.register("nested", NestedComponent)
+    component.registry.register("list", ListComponent)
+    component.registry.register("avatar", AvatarComponent)
+    component.registry.register("list_item", ListItemComponent)
+    component.registry.register("callable_list", CallableListComponent)
+    component.registry.register("badge", BadgeComponent)
+    component.registry.register("compiled_badge", CompiledBadgeComponent)
+
+
+@pytest.mark.benchmark(group="component-tag")
+def test_flat_component(measure):
+    template = Template(
+        """
+        {% load viewcomponent_tags %}
+        {% component "item" name="test" %}{% endcomponent %}
+        """,
+    )
+    measure(template.render, Context({}))
+
+
+@pytest.mark.benchmark(group="component-tag")
+def test_flat_components_100(measure):
+    template = Template(
+        """
+        {% load viewcomponent_tags %}
+        {% for name in names %}{% component "item" name=name %}{% endcomponent %}{% endfor %}
+        """,
+    )
+    rendered = measure(template.render, Context({"names": range(100)}))
+    assert rendered.count('class="item"') == 100
+
+
+@pytest.mark.benchmark(group="component-tag")
+def test_component_collection_100(measure):
+    template = Template(
+        """
+        {% load viewcomponent_tags %}
+        {% component_collection "item" names as_var="name" %}
+        """,
+    )
+    rendered = measure(template.render, Context({"names": range(100)}))
+    assert rendered.count('class="item"') == 100
+
+
+@pytest.mark.benchmark(group="component-tag")
+def test_deep_nesting_20(measure):
+    template = Template(
+        """
+        {% load viewcomponent_tags %}
+        {% component "nested" depth=20 %}{% endcomponent %}
+        """,
+    )
+    rendered = measure(template.render, Context({}))
+    assert rendered.count("<div>") == 21
+
+
+@pytest.mark.benchmark(group="component-name")
+@pytest.mark.parametrize(
+    "tag",
+    [
+        '{% component "item" name=name %}{% endcomponent %}',
+        "{% component component_name name=name %}{% endcomponent %}",
+    ],
+    ids=["literal", "variable"],
+)
+def test_component_name_2k(measure, tag):
+    template = Template(
+        "{% load viewcomponent_tags %}"
+        "{% for name in names %}" + tag + "{% endfor %}",
+    )
+    rendered = measure(
+        template.render,
+        Context({"names": range(2000), "component_name": "item"}),
+    )
+    assert rendered.count('class="item"') == 2000
+
+
+@pytest.mark.benchmark(group="slots")
+def test_renders_many_field_1k(measure):
+    template = Template(
+        """
+        {% load viewcomponent_tags %}
+        {% component "list" as c %}
+            {% for name in names %}{% call c.items name=name %}{% endcall %}{% endfor %}
+        {% endcomponent %}
+        """,
+    )
+    rendered = measure(template.render, Context({"names": range(1000)}))
+    assert rendered.count("<li>") == 1000
+
+
+@pytest.mark.benchmark(group="slots")
+def test_polymorphic_slots_100(measure):
+    template = Template(
+        """
+        {% load viewcomponent_tags %}
+        {% for i in items %}
+            {% component "list_item" as c %}
+                {% if forloop.counter|divisibleby:2 %}
+                    {% call c.item_avatar src="/avatar.png" alt=i %}{% endcall %}
+                {% else %}
+                    {% call c.item_span %}{{ i }}{% endcall %}
+                {% endif %}
+            {% endcomponent %}
+        {% endfor %}
+        """,
+    )
+    rendered = measure(template.render, Context({"items": range(100)}))
+    assert rendered.count("<li>") == 100
+
+
+@pytest.mark.benchmark(group="slots")
+def test_callable_slot_components_100(measure):
+    template = Template(
+        """
+        {% load viewcomponent_tags %}
+        {% component "callable_list" as c %}
+            {% for name in names %}{% call c.items name=name %}{% endcall %}{% endfor %}
+        {% endcomponent %}
+        """,
+    )
+    rendered = measure(template.render, Context({"names": range(100)}))
+    assert rendered.count('class="item"') == 100
+
+
+@pytest.mark.benchmark(group="compiled-template")
+@pytest.mark.parametrize("name", ["badge", "compiled_badge"])
+def test_leaf_components_100(measure, name):
+    template = Template(
+        """
+        {% load viewcomponent_tags %}
+        {% for i in items %}
+            {% component name label=i pill=forloop.first icon="star" count=i %}{% endcomponent %}
+        {% endfor %}
+        """,
+    )
+    items = [str(i) for i in range(100)]
+    rendered = measure(template.render, Context({"items": items, "name": name}))
+    assert rendered.count("badge-primary") == 100
+
+
+@pytest.mark.benchmark(group="compiled-template")
+@pytest.mark.parametrize("compiled", [False, True])
+def test_leaf_template(measure, compiled):
+    badge = BadgeComponent(label="new", pill=True, icon="star", count="3")
+    template = badge.get_template()
+    context_data = {"self": badge}
+
+    def render():
+        if compiled:
+            return render_compiled(template, Context(context_data))
+        return template.render(Context(context_data))
+
+    rendered = measure(render)
+    assert "badge-pill" in rendered
+
+
+@pytest.mark.benchmark(group="python-layout")
+def test_python_layout(measure):
+    def render():
+        return Div(
+            *[
+                Div(
+                    HTML("<p>{{ value }}</p>"),
+                    Button("{{ value }}", css_class="btn-primary"),
+                    css_class="row",
+                )
+                for _ in range(20)
+            ],
+            dom_id="main",
+        ).render_from_parent_context({"value": "test"})
+
+    rendered = measure(render)
+    assert rendered.count("<button") == 20
+
+
+@pytest.mark.benchmark(group="preview")
+def test_preview_view(measure):
+    from tests.previews.simple_preview import ExampleComponent
+
+    component.registry.register("example", ExampleComponent)
+    client = Client()
+    url = reverse(
+        "django_viewcomponent:preview",
+        kwargs={
+            "preview_name": "simple_example_component",
+            "example_name": "with_template_render",
+        },
+    )
+
+    response = measure(client.get, url, {"title": "hello world"})
+    assert response.status_code == 200
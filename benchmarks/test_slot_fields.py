@@ -0,0 +1,68 @@
+"""
+Per-render overhead of preparing slot fields on a component instance.
+"""
+
+import copy
+
+import pytest
+
+from django_viewcomponent import component
+from django_viewcomponent.fields import BaseSlotField, RendersManyField, RendersOneField
+
+
+class BlogComponent(component.Component):
+    header = RendersOneField()
+    posts = RendersManyField()
+    footer = RendersOneField()
+
+    template = """
+    {{ self.header.value }}
+    {% for post in self.posts.value %}{{ post }}{% endfor %}
+    {{ self.footer.value }}
+    """
+
+    def __init__(self, title=None, **kwargs):
+        self.title = title
+
+    def get_title(self):
+        return self.title
+
+
+def scan_slot_fields(cls):
+    """
+    The slot field lookup before the per-class table, which walked `dir(cls)`
+    every time slot fields were created or checked. Kept here as the baseline.
+    """
+    slot_fields = {}
+    for field_name in dir(cls):
+        field = getattr(cls, field_name)
+        if isinstance(field, BaseSlotField):
+            slot_fields[field_name] = field
+    return slot_fields
+
+
+def prepare_slot_fields_with_scan(instance):
+    for field_name, field in scan_slot_fields(type(instance)).items():
+        new_field = copy.deepcopy(field)
+        new_field.parent_component = instance
+        setattr(instance, field_name, new_field)
+
+    for key in scan_slot_fields(type(instance)):
+        field = getattr(instance, key)
+        if field.required and not field.filled:
+            raise ValueError(f"Field {key} is required")
+
+
+def prepare_slot_fields(instance):
+    instance.create_slot_fields()
+    instance.check_slot_fields()
+
+
+@pytest.mark.benchmark(group="slot-fields")
+def test_slot_fields_dir_scan(measure):
+    measure(lambda: prepare_slot_fields_with_scan(BlogComponent(title="test")))
+
+
+@pytest.mark.benchmark(group="slot-fields")
+def test_slot_fields_class_table(measure):
+    measure(lambda: prepare_slot_fields(BlogComponent(title="test")))
@@ -1,38 +1,90 @@
 import glob
 import importlib
 import importlib.util
+import os
 import sys
+import warnings
 from pathlib import Path
 
 from django.template.engine import Engine
 
+from django_viewcomponent.component_registry import registry
+from django_viewcomponent.discovery import get_module_name, precompile_files
 from django_viewcomponent.loaders import ComponentLoader
 
 
 def autodiscover_components():
+    from django_viewcomponent.app_settings import app_settings
+    from django_viewcomponent.manifest import register_manifest
+
+    if app_settings.LAZY_AUTODISCOVER:
+        if register_manifest(app_settings.COMPONENT_MANIFEST):
+            return
+        warnings.warn(
+            f"Component manifest {app_settings.COMPONENT_MANIFEST} not found, "
+            "run `python manage.py viewcomponent_manifest` to generate it",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+
+    import_component_files(iter_component_files())
+
+
+def iter_component_files():
     # Autodetect a <component>.py file in a components dir
     current_engine = Engine.get_default()
     loader = ComponentLoader(current_engine)
     dirs = loader.get_dirs()
+    return iter_unique_files(dirs)
+
+
+def iter_unique_files(dirs):
+    """
+    Yield the resolved path of the .py files in the dirs, the same file reached
+    through overlapping dirs (or symlinks) is yielded once
+    """
+    seen = set()
     for directory in dirs:
-        for path in glob.iglob(str(directory / "**/*.py"), recursive=True):
-            import_component_file(path)
+        for path in glob.iglob(str(Path(directory) / "**/*.py"), recursive=True):
+            resolved = os.path.realpath(path)
+            if resolved not in seen:
+                seen.add(resolved)
+                yield resolved
+
+
+def import_component_files(paths):
+    from django_viewcomponent.app_settings import app_settings
+
+    paths = list(paths)
+    precompile_files(paths, workers=app_settings.PRECOMPILE_WORKERS)
+    for path in paths:
+        import_component_file(path)
 
 
 def autodiscover_previews():
     from django_viewcomponent.app_settings import app_settings
 
     if app_settings.SHOW_PREVIEWS:
-        preview_base_ls = [Path(p) for p in app_settings.PREVIEW_BASE]
-        for directory in preview_base_ls:
-            for path in glob.iglob(str(directory / "**/*.py"), recursive=True):
-                import_component_file(path)
+        import_component_files(iter_unique_files(app_settings.PREVIEW_BASE))
 
 
 def import_component_file(path):
-    MODULE_PATH = path
-    MODULE_NAME = Path(path).stem
+    MODULE_PATH = os.path.realpath(path)
+    MODULE_NAME = get_module_name(MODULE_PATH)
+
+    # the file is already imported, by a regular import or a previous discovery
+    existing = sys.modules.get(MODULE_NAME)
+    existing_path = getattr(existing, "__file__", None)
+    if existing_path and os.path.realpath(existing_path) == MODULE_PATH:
+        registry.restore(MODULE_NAME)
+        return existing
+
     spec = importlib.util.spec_from_file_location(MODULE_NAME, MODULE_PATH)
     module = importlib.util.module_from_spec(spec)
     sys.modules[spec.name] = module
-    spec.loader.exec_module(module)
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[spec.name]
+        raise
+    return module
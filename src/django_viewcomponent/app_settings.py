@@ -1,3 +1,5 @@
+from pathlib import Path
+
 from django.conf import settings
 
 
@@ -13,5 +15,44 @@ class AppSettings:
     def SHOW_PREVIEWS(self):
         return self.settings.setdefault("show_previews", True)
 
+    @property
+    def TEMPLATE_CACHE_SIZE(self):
+        return self.settings.setdefault("template_cache_size", 256)
+
+    @property
+    def CACHE_BACKEND(self):
+        return self.settings.setdefault("cache_backend", "default")
+
+    @property
+    def PROFILER_SAMPLE_RATE(self):
+        return self.settings.setdefault("profiler_sample_rate", 1.0)
+
+    @property
+    def PROFILER_SHOW_PANEL(self):
+        return self.settings.setdefault("profiler_show_panel", settings.DEBUG)
+
+    @property
+    def LAZY_AUTODISCOVER(self):
+        return self.settings.setdefault("lazy_autodiscover", False)
+
+    @property
+    def COMPONENT_MANIFEST(self):
+        default = None
+        if hasattr(settings, "BASE_DIR"):
+            default = Path(settings.BASE_DIR) / "viewcomponent_manifest.json"
+        return self.settings.setdefault("component_manifest", default)
+
+    @property
+    def WARMUP_ON_READY(self):
+        return self.settings.setdefault("warmup_on_ready", False)
+
+    @property
+    def TWO_PHASE_RENDER(self):
+        return self.settings.setdefault("two_phase_render", False)
+
+    @property
+    def PRECOMPILE_WORKERS(self):
+        return self.settings.setdefault("precompile_workers", 0)
+
 
 app_settings = AppSettings()
@@ -5,5 +5,12 @@ class ComponentsConfig(AppConfig):
     name = "django_viewcomponent"
 
     def ready(self):
+        from django_viewcomponent.app_settings import app_settings
+
         self.module.autodiscover_components()
         self.module.autodiscover_previews()
+
+        if app_settings.WARMUP_ON_READY:
+            from django_viewcomponent.warmup import log_results, warmup_components
+
+            log_results(warmup_components())
@@ -0,0 +1,280 @@
+"""
+Compile the nodelist of a template into a Python render function.
+
+Django renders a template by walking the Node tree, for small components (badges,
+buttons, icons) the overhead of the walk can be bigger than the work. The compiler
+generates Python code for the common nodes (text, variables, `if`, `for`, `with`,
+`component` and `call`), other nodes are rendered by `node.render_annotated`.
+"""
+
+import html
+from typing import Any, Callable, Dict, List
+
+from django.template.base import (
+    NodeList,
+    TextNode,
+    Variable,
+    VariableDoesNotExist,
+    VariableNode,
+    render_value_in_context,
+)
+from django.template.defaulttags import ForNode, IfNode, WithNode
+from django.utils.safestring import SafeString
+
+
+class CompiledNodeList(NodeList):
+    """
+    NodeList rendered by the compiled function, the nodes are kept so the nodelist
+    can still be walked (for example, by the streaming and async APIs)
+    """
+
+    def __init__(self, nodes, render_func):
+        super().__init__(nodes)
+        self.render_func = render_func
+
+    def render(self, context):
+        return self.render_func(context)
+
+
+def _unpack_loopvars(context, loopvars, item):
+    try:
+        len_item = len(item)
+    except TypeError:  # not an iterable
+        len_item = 1
+    if len(loopvars) != len_item:
+        raise ValueError(
+            f"Need {len(loopvars)} values to unpack in for loop; got {len_item}. ",
+        )
+    context.update(dict(zip(loopvars, item)))
+
+
+class _CodeGenerator:
+    def __init__(self):
+        from django_viewcomponent.templatetags.viewcomponent_tags import (
+            CallNode,
+            ComponentNode,
+        )
+
+        self.component_node_types = (ComponentNode, CallNode)
+        self.lines: List[str] = []
+        self.constants: Dict[str, Any] = {
+            "SafeString": SafeString,
+            "escape": html.escape,
+            "VariableDoesNotExist": VariableDoesNotExist,
+            "render_value_in_context": render_value_in_context,
+            "unpack_loopvars": _unpack_loopvars,
+        }
+        self.counter = 0
+
+    def name(self, prefix):
+        self.counter += 1
+        return f"{prefix}{self.counter}"
+
+    def constant(self, value):
+        name = self.name("c")
+        self.constants[name] = value
+        return name
+
+    def emit(self, level, line):
+        self.lines.append("    " * level + line)
+
+    def nodelist(self, nodelist, level):
+        start = len(self.lines)
+        text = []
+        for node in nodelist:
+            if type(node) is TextNode:
+                text.append(node.s)
+                continue
+            if text:
+                self.emit(level, f"append({''.join(text)!r})")
+                text = []
+            self.node(node, level)
+        if text:
+            self.emit(level, f"append({''.join(text)!r})")
+        if len(self.lines) == start:
+            self.emit(level, "pass")
+
+    def node(self, node, level):
+        node_type = type(node)
+        if node_type is VariableNode:
+            self.variable_node(node, level)
+        elif node_type is IfNode:
+            self.if_node(node.conditions_nodelists, level)
+        elif node_type is ForNode:
+            self.for_node(node, level)
+        elif node_type is WithNode:
+            self.with_node(node, level)
+        elif node_type in self.component_node_types:
+            # the content and slot fields are rendered by the component,
+            # compile the nested nodelist, and call the node directly
+            node.nodelist = compile_nodelist(node.nodelist)
+            self.emit(level, f"append({self.constant(node)}.render(context))")
+        else:
+            self.emit(level, f"append({self.constant(node)}.render_annotated(context))")
+
+    def variable_node(self, node, level):
+        fexp = node.filter_expression
+        self.emit(level, "try:")
+        self.resolve_variable(fexp, level + 1)
+        self.emit(level, "except UnicodeDecodeError:")
+        self.emit(level + 1, "pass")
+        # same as render_value_in_context, with shortcuts for strings
+        self.emit(level, "else:")
+        self.emit(level + 1, "if type(value) is str:")
+        self.emit(level + 2, "append(escape(value) if context.autoescape else value)")
+        self.emit(level + 1, "elif type(value) is SafeString:")
+        self.emit(level + 2, "append(value)")
+        self.emit(level + 1, "else:")
+        self.emit(level + 2, "append(render_value_in_context(value, context))")
+
+    def resolve_variable(self, fexp, level):
+        """
+        Resolve the filter expression into `value`, variables without filters skip
+        FilterExpression.resolve, which is called for anything unusual
+        """
+        var = fexp.var
+        name = self.constant(fexp)
+        if fexp.filters or not (
+            isinstance(var, Variable) and var.lookups and not var.translate
+        ):
+            self.emit(level, f"value = {name}.resolve(context)")
+        elif len(var.lookups) == 1:
+            self.emit(level, "try:")
+            self.emit(level + 1, f"value = context[{var.lookups[0]!r}]")
+            self.emit(level, "except KeyError:")
+            self.emit(level + 1, f"value = {name}.resolve(context)")
+            self.emit(level, "else:")
+            self.emit(level + 1, "if callable(value):")
+            self.emit(level + 2, f"value = {name}.resolve(context)")
+        else:
+            self.emit(level, "try:")
+            self.emit(level + 1, f"value = {name}.var._resolve_lookup(context)")
+            self.emit(level, "except VariableDoesNotExist:")
+            self.emit(level + 1, f"value = {name}.resolve(context)")
+
+    def if_node(self, conditions_nodelists, level):
+        if not conditions_nodelists:
+            self.emit(level, "pass")
+            return
+
+        (condition, nodelist), rest = conditions_nodelists[0], conditions_nodelists[1:]
+        if condition is None:
+            # {% else %}
+            self.nodelist(nodelist, level)
+            return
+
+        self.emit(level, "try:")
+        self.emit(level + 1, f"match = {self.constant(condition)}.eval(context)")
+        self.emit(level, "except VariableDoesNotExist:")
+        self.emit(level + 1, "match = None")
+        self.emit(level, "if match:")
+        self.nodelist(nodelist, level + 1)
+        if rest:
+            self.emit(level, "else:")
+            self.if_node(rest, level + 1)
+
+    def for_node(self, node, level):
+        values, loop_dict, index = self.name("v"), self.name("d"), self.name("i")
+        item, length = self.name("item"), self.name("n")
+
+        self.emit(level, "if 'forloop' in context:")
+        self.emit(level + 1, "parentloop = context['forloop']")
+        self.emit(level, "else:")
+        self.emit(level + 1, "parentloop = {}")
+        self.emit(level, "with context.push():")
+        level += 1
+        self.emit(
+            level,
+            f"{values} = {self.constant(node.sequence)}.resolve(context, ignore_failures=True)",
+        )
+        self.emit(level, f"if {values} is None:")
+        self.emit(level + 1, f"{values} = []")
+        self.emit(level, f"if not hasattr({values}, '__len__'):")
+        self.emit(level + 1, f"{values} = list({values})")
+        self.emit(level, f"{length} = len({values})")
+        self.emit(level, f"if {length} < 1:")
+        self.nodelist(node.nodelist_empty, level + 1)
+        self.emit(level, "else:")
+        level += 1
+        if node.is_reversed:
+            self.emit(level, f"{values} = reversed({values})")
+        self.emit(
+            level,
+            f"{loop_dict} = context['forloop'] = {{'parentloop': parentloop}}",
+        )
+        self.emit(level, f"for {index}, {item} in enumerate({values}):")
+        level += 1
+        self.emit(level, f"{loop_dict}['counter0'] = {index}")
+        self.emit(level, f"{loop_dict}['counter'] = {index} + 1")
+        self.emit(level, f"{loop_dict}['revcounter'] = {length} - {index}")
+        self.emit(level, f"{loop_dict}['revcounter0'] = {length} - {index} - 1")
+        self.emit(level, f"{loop_dict}['first'] = {index} == 0")
+        self.emit(level, f"{loop_dict}['last'] = {index} == {length} - 1")
+        if len(node.loopvars) > 1:
+            loopvars = self.constant(list(node.loopvars))
+            self.emit(level, f"unpack_loopvars(context, {loopvars}, {item})")
+            self.nodelist(node.nodelist_loop, level)
+            self.emit(level, "context.pop()")
+        else:
+            self.emit(level, f"context[{node.loopvars[0]!r}] = {item}")
+            self.nodelist(node.nodelist_loop, level)
+
+    def with_node(self, node, level):
+        extra_context = self.constant(node.extra_context)
+        self.emit(
+            level,
+            f"with context.push(**{{key: val.resolve(context) for key, val in {extra_context}.items()}}):",
+        )
+        self.nodelist(node.nodelist, level + 1)
+
+
+def compile_nodelist(nodelist: NodeList) -> CompiledNodeList:
+    """
+    Compile the nodelist into a CompiledNodeList, which renders the same output
+    """
+    if isinstance(nodelist, CompiledNodeList):
+        return nodelist
+
+    generator = _CodeGenerator()
+    generator.nodelist(nodelist, 2)
+    source = "\n".join(
+        [
+            "def make_render():",
+            "    def render(context):",
+            "        output = []",
+            "        append = output.append",
+            *generator.lines,
+            "        return SafeString(''.join(output))",
+            "    return render",
+        ],
+    )
+    namespace = dict(generator.constants)
+    exec(compile(source, "<viewcomponent compiled template>", "exec"), namespace)
+    return CompiledNodeList(nodelist, namespace["make_render"]())
+
+
+def get_compiled_render(template) -> Callable[[Any], str]:
+    compiled = getattr(template, "_viewcomponent_compiled", None)
+    if compiled is None:
+        # compiling the same template twice in two threads is harmless
+        compiled = template._viewcomponent_compiled = compile_nodelist(
+            template.nodelist,
+        )
+    return compiled.render
+
+
+def render_compiled(template, context) -> str:
+    """
+    Same as Template.render, but the nodelist is rendered by the compiled function
+    """
+    if template.engine.debug:
+        # keep the debug information of the nodes
+        return template.render(context)
+
+    render = get_compiled_render(template)
+    with context.render_context.push_state(template):
+        if context.template is None:
+            with context.bind_template(template):
+                context.template_name = template.name
+                return render(context)
+        return render(context)
@@ -1,11 +1,38 @@
-import copy
 import inspect
-from typing import Any, ClassVar, Dict, Optional, Union
+import os
+import posixpath
+import re
+from concurrent.futures import Future
+from contextlib import contextmanager
+from contextvars import copy_context
+from copy import copy
+from types import MappingProxyType
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
+from asgiref.sync import async_to_sync, sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.cache.utils import make_template_fragment_key
 from django.core.exceptions import ImproperlyConfigured
-from django.template.base import Template
+from django.template import Engine, Origin
+from django.template.base import Template, TextNode, Variable, VariableDoesNotExist
 from django.template.context import Context
 from django.template.loader import get_template
+from django.utils.safestring import mark_safe
 
 from django_viewcomponent.component_registry import (  # NOQA
     AlreadyRegistered,
@@ -14,7 +41,45 @@ from django_viewcomponent.component_registry import (  # NOQA
     register,
     registry,
 )
+from django_viewcomponent.compiler import render_compiled
+from django_viewcomponent.dataloader import get_render_pass, load, render_pass
 from django_viewcomponent.fields import BaseSlotField
+from django_viewcomponent.instrumentation import (
+    arender_instrumented,
+    iter_instrumented,
+    render_instrumented,
+)
+from django_viewcomponent.rendering import (
+    arender_nodelist,
+    arender_template,
+    iter_template,
+)
+from django_viewcomponent.signals import template_compiled
+from django_viewcomponent.template_cache import template_cache
+
+
+class CollectionIteration:
+    """
+    Position of the item in render_collection
+    """
+
+    __slots__ = ("index", "size")
+
+    def __init__(self, index: int, size: int):
+        self.index = index
+        self.size = size
+
+    @property
+    def counter(self) -> int:
+        return self.index + 1
+
+    @property
+    def first(self) -> bool:
+        return self.index == 0
+
+    @property
+    def last(self) -> bool:
+        return self.index == self.size - 1
 
 
 class Component:
@@ -28,21 +93,226 @@ class Component:
     # the variable name of the component in the context
     component_target_var = None
 
-    # the context of the component, generated by get_context_data
-    component_context: Context = Context({})
+    # the context of the component, it is bound to the instance during rendering,
+    # see bind_context
+    component_context: Optional[Context] = None
+
+    # alias of the template engine in settings.TEMPLATES (for example "jinja2") which
+    # renders the template, None means the Django template language
+    template_engine: ClassVar[Optional[str]] = None
+
+    # name of the __init__ argument which receives the item in render_collection
+    collection_parameter: ClassVar[Optional[str]] = None
+
+    # render the template with a compiled Python function instead of walking the nodes,
+    # see django_viewcomponent.compiler
+    compile_template: ClassVar[bool] = False
+
+    # the HTML only depends on the arguments and the content, the same component with
+    # the same arguments is rendered once in a render pass, see get_memo_key
+    pure: ClassVar[bool] = False
+
+    # I/O bound components are rendered in the executor passed to render_children
+    io_bound: ClassVar[bool] = False
+
+    # fragment cache, enabled when cache_key() returns a value
+    # cache_timeout is passed to the cache backend, DEFAULT_TIMEOUT means the backend default
+    cache_timeout: ClassVar[Any] = DEFAULT_TIMEOUT
+    # template variables which are added to the cache key, like {% cache %} tag
+    cache_vary_on: ClassVar[Sequence[str]] = ()
+
+    # True after prefetch() is called, see _ensure_prefetched
+    _prefetched = False
+
+    # True if the component only overrides aget_context_data, set in __init_subclass__
+    _async_context_data_only: ClassVar[bool] = False
+
+    # path of the Python file which defines the class
+    _source_file: ClassVar[Optional[str]] = None
+
+    # template name -> (template, path, mtime) resolved once per class,
+    # see _get_pinned_template
+    _pinned_templates: ClassVar[Dict[str, Tuple[Template, Optional[str], float]]] = {}
+
+    # slot fields of the class, built once in __init_subclass__
+    _slot_fields: ClassVar[Mapping[str, BaseSlotField]] = MappingProxyType({})
+
+    # name used in {% call %} tag -> (slot field name, polymorphic type)
+    _slot_dispatch: ClassVar[
+        Mapping[str, Tuple[str, Optional[str]]]
+    ] = MappingProxyType({})
 
     def __init__(self, *args, **kwargs):
         pass
 
     def __init_subclass__(cls, **kwargs):
-        cls.class_hash = hash(inspect.getfile(cls) + cls.__name__)
+        cls._source_file = inspect.getfile(cls)
+        cls.class_hash = hash(cls._source_file + cls.__name__)
+        cls._pinned_templates = {}
+        cls._slot_fields = cls._collect_slot_fields()
+        cls._slot_dispatch = cls._build_slot_dispatch()
+        cls._async_context_data_only = (
+            cls.aget_context_data is not Component.aget_context_data
+            and cls.get_context_data is Component.get_context_data
+        )
 
     def get_context_data(self, **kwargs) -> Context:
+        if self.component_context is None:
+            # rendered without a parent context, the instance owns a new context
+            self.component_context = Context()
         self.component_context["self"] = self
         if self.component_target_var:
             self.component_context[self.component_target_var] = self
         return self.component_context
 
+    @contextmanager
+    def bind_context(self, context: Context):
+        """
+        Bind the context to the component during rendering, the previous context
+        is restored after, so the instance does not keep the parent context alive
+        """
+        previous_context = self.component_context
+        self.component_context = context
+        try:
+            yield context
+        finally:
+            self.component_context = previous_context
+
+    def _get_bound_context(self) -> Context:
+        """
+        Return the context bound by `bind_context`, the render methods push on it
+        """
+        context = self.component_context
+        if context is None:
+            raise RuntimeError(f"{type(self).__name__} is not bound to a context")
+        return context
+
+    async def aget_context_data(self, **kwargs) -> Context:
+        """
+        Async version of get_context_data, used when the component is rendered asynchronously.
+
+        Override it to load data without blocking the event loop, by default
+        get_context_data is called, in a thread if it is overridden.
+        """
+        if type(self).get_context_data is Component.get_context_data:
+            return self.get_context_data(**kwargs)
+        return await sync_to_async(self.get_context_data)(**kwargs)
+
+    def _load_context_data(self) -> Context:
+        """
+        Call get_context_data in sync rendering, if the component only
+        overrides aget_context_data, it is called with async_to_sync.
+        """
+        if self._async_context_data_only:
+            return async_to_sync(self.aget_context_data)()
+        return self.get_context_data()
+
+    def prefetch(self):
+        """
+        Register the data the component needs with `self.load`, it is called before
+        the component is rendered.
+
+        The keys of the components rendered in the same render pass (render_collection,
+        render_children, nested components) are loaded by one `batch_load` call.
+        """
+
+    def load(self, loader_cls, key):
+        """
+        Return the value of the key loaded by the BatchLoader, the value is lazy,
+        it is loaded with the other pending keys when it is used
+        """
+        return load(loader_cls, key)
+
+    def _ensure_prefetched(self):
+        if not self._prefetched:
+            self._prefetched = True
+            self.prefetch()
+
+    def cache_key(self) -> Optional[str]:
+        """
+        Return a string to cache the rendered HTML of the component, the cached HTML
+        is served without rendering the content and slot fields passed to the component.
+
+        Return None to disable the fragment cache.
+        """
+        return None
+
+    def get_fragment_cache_key(self, context: Context) -> Optional[str]:
+        key = self.cache_key()
+        if key is None:
+            return None
+
+        vary_on: List[Any] = [key]
+        for var in self.cache_vary_on:
+            try:
+                vary_on.append(Variable(var).resolve(context))
+            except VariableDoesNotExist:
+                vary_on.append(None)
+
+        cls = type(self)
+        return make_template_fragment_key(
+            f"viewcomponent.{cls.__module__}.{cls.__qualname__}",
+            vary_on,
+        )
+
+    def _render_with_fragment_cache(self, context: Context, render) -> str:
+        cache_key = self.get_fragment_cache_key(context)
+        if cache_key is None:
+            return render()
+        return self._render_cached(cache_key, render)
+
+    def _render_cached(self, cache_key: str, render) -> str:
+        from django_viewcomponent.app_settings import app_settings
+
+        cache = caches[app_settings.CACHE_BACKEND]
+        html = cache.get(cache_key)
+        if html is None:
+            html = render()
+            cache.set(cache_key, html, self.cache_timeout)
+        return mark_safe(html)
+
+    @classmethod
+    def get_memo_key(cls, args, kwargs, nodelist) -> Optional[Hashable]:
+        """
+        Key of the HTML of a pure component in the render pass, None if the HTML can not
+        be reused: the content has template tags or variables (for example slot calls),
+        the component varies on the context, or an argument is not hashable
+        """
+        if cls.cache_vary_on:
+            return None
+
+        content = []
+        for node in nodelist or ():
+            if type(node) is not TextNode:
+                return None
+            content.append(node.s)
+
+        key = (
+            cls,
+            tuple((type(arg), arg) for arg in args),
+            tuple(sorted((k, type(v), v) for k, v in kwargs.items())),
+            "".join(content),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    @classmethod
+    def render_memoized(cls, args, kwargs, nodelist, render) -> str:
+        """
+        Return the HTML of the pure component rendered with the same arguments and content
+        in the current render pass, or call `render`
+        """
+        current = get_render_pass()
+        if current is None:
+            return render()
+        key = cls.get_memo_key(args, kwargs, nodelist)
+        if key is None:
+            return render()
+        return current.memoize(key, render)
+
     def get_template_name(self) -> Optional[str]:
         return self.template_name
 
@@ -50,19 +320,93 @@ class Component:
         return self.template
 
     def get_template(self) -> Template:
+        """
+        Return the compiled template, a `django.template.base.Template`, or the template
+        of the backend when `template_engine` is set
+        """
         template_string = self.get_template_string()
         if template_string is not None:
-            return Template(template_string)
+            return template_cache.get(
+                type(self),
+                template_string,
+                engine=self.template_engine,
+            )
 
         template_name = self.get_template_name()
         if template_name is not None:
-            return get_template(template_name).template
+            if self.template_engine is not None:
+                return get_template(template_name, using=self.template_engine)
+            return self._get_pinned_template(template_name)
 
         raise ImproperlyConfigured(
             f"Either 'template_name' or 'template' must be set for Component {type(self).__name__}."
             f"Note: this attribute is not required if you are overriding the class's `get_template*()` methods.",
         )
 
+    @classmethod
+    def _get_pinned_template(cls, template_name: str) -> Template:
+        """
+        Resolve the template file once per class and keep it on the class, the template
+        next to the Python file of the class is used without the template loaders.
+
+        In DEBUG, the template is compiled again when the file is modified.
+        """
+        pinned = cls._pinned_templates.get(template_name)
+        if pinned is not None:
+            template, path, mtime = pinned
+            if path is None or not settings.DEBUG:
+                return template
+            try:
+                if os.stat(path).st_mtime == mtime:
+                    return template
+            except OSError:
+                pass
+
+        path = cls._get_colocated_template_path(template_name)
+        if path is not None:
+            engine = Engine.get_default()
+            with open(path, encoding=engine.file_charset) as f:
+                template = Template(
+                    f.read(),
+                    origin=Origin(name=path, template_name=template_name),
+                    name=template_name,
+                    engine=engine,
+                )
+        else:
+            template = get_template(template_name).template
+            path = template.origin.name if template.origin.loader else None
+
+        if template_compiled.receivers:
+            template_compiled.send(
+                sender=cls,
+                template_name=template_name,
+                template_string=template.source,
+            )
+
+        try:
+            mtime = os.stat(path).st_mtime if path else 0.0
+        except OSError:
+            path, mtime = None, 0.0
+        cls._pinned_templates[template_name] = (template, path, mtime)
+        return template
+
+    @classmethod
+    def _get_colocated_template_path(cls, template_name: str) -> Optional[str]:
+        """
+        Return the path of the template next to the Python file of the class,
+        `components/blog/card/card.py` -> `components/blog/card/card.html` if the
+        template name is `card.html`, `card/card.html` or `blog/card/card.html`
+        """
+        if not cls._source_file:
+            return None
+        path = os.path.join(
+            os.path.dirname(os.path.abspath(cls._source_file)),
+            posixpath.basename(template_name),
+        )
+        if not path.endswith(os.sep + os.path.normpath(template_name)):
+            return None
+        return path if os.path.isfile(path) else None
+
     def prepare_context(
         self,
         context_data: Union[Dict[str, Any], Context, None] = None,
@@ -84,8 +428,71 @@ class Component:
         self,
         context_data: Union[Dict[str, Any], Context, None] = None,
     ) -> str:
+        return self._render_template(
+            self.get_template(),
+            self.prepare_context(context_data),
+        )
+
+    def _render_template(self, template, context: Context) -> str:
+        if self.template_engine is not None:
+            flat_context = context.flatten()
+            # `self` is reserved in Jinja2 templates
+            flat_context["component"] = self
+            return mark_safe(template.render(flat_context))
+        if self.compile_template:
+            return render_compiled(template, context)
+        return template.render(context)
+
+    async def arender(
+        self,
+        context_data: Union[Dict[str, Any], Context, None] = None,
+    ) -> str:
+        """
+        Async version of render, child components in the template are rendered concurrently
+        """
+        if self.template_engine is not None:
+            return self.render(context_data)
         template = self.get_template()
-        return template.render(self.prepare_context(context_data))
+        return await arender_template(template, self.prepare_context(context_data))
+
+    def render_iter(
+        self,
+        context_data: Union[Dict[str, Any], Context, None] = None,
+    ) -> Iterator[str]:
+        """
+        Same as render, but yield the HTML in chunks, child components in the template
+        are streamed as they are rendered
+        """
+        if self.template_engine is not None:
+            yield self.render(context_data)
+            return
+        template = self.get_template()
+        yield from iter_template(template, self.prepare_context(context_data))
+
+    def stream(self, parent_context=None) -> Iterator[str]:
+        """
+        Streaming version of render_from_parent_context, the returned iterator can be
+        passed to StreamingHttpResponse
+
+        def dashboard(request):
+            return StreamingHttpResponse(
+                DashboardComponent(user=request.user).stream({"request": request}),
+            )
+        """
+        return iter_instrumented(self, self._stream(parent_context))
+
+    def _stream(self, parent_context=None) -> Iterator[str]:
+        parent_context = parent_context or {}
+        with self.bind_context(self.prepare_context(parent_context)), render_pass():
+            self._ensure_prefetched()
+            cache_key = self.get_fragment_cache_key(self.component_context)
+            if cache_key is not None:
+                yield self._render_cached(cache_key, self._render_from_parent_context)
+                return
+
+            with self._get_bound_context().push():
+                updated_context = self._load_context_data()
+                yield from self.render_iter(updated_context)
 
     def render_from_parent_context(self, parent_context=None):
         """
@@ -105,33 +512,339 @@ class Component:
         )
         """
         parent_context = parent_context or {}
-        self.component_context = self.prepare_context(parent_context)
-        with self.component_context.push():
-            updated_context = self.get_context_data()
+        with self.bind_context(self.prepare_context(parent_context)), render_pass():
+            self._ensure_prefetched()
+            return render_instrumented(
+                self,
+                lambda: self._render_with_fragment_cache(
+                    self.component_context,
+                    self._render_from_parent_context,
+                ),
+            )
+
+    def _render_from_parent_context(self):
+        with self._get_bound_context().push():
+            updated_context = self._load_context_data()
+            return self.render(updated_context)
+
+    @classmethod
+    def render_collection(
+        cls,
+        items,
+        context: Union[Dict[str, Any], Context, None] = None,
+        as_var: Optional[str] = None,
+        **kwargs,
+    ) -> str:
+        """
+        Render the component for each item of the collection, and return the HTML
+
+        The item is passed to __init__ as `as_var` (default is `get_collection_parameter()`),
+        together with `<as_var>_counter` (starting from 1) and `<as_var>_iteration`
+        (CollectionIteration) if __init__ accepts them. `kwargs` are passed to every component.
+
+        PostComponent.render_collection(posts, {"request": request})
+        """
+        as_var = as_var or cls.get_collection_parameter()
+        counter_var, iteration_var = f"{as_var}_counter", f"{as_var}_iteration"
+        accepted = cls._get_init_parameters()
+        pass_counter = accepted is None or counter_var in accepted
+        pass_iteration = accepted is None or iteration_var in accepted
+
+        if not isinstance(context, Context):
+            context = Context(context or {})
+        if not hasattr(items, "__len__"):
+            items = list(items)
+        size = len(items)
+
+        components = []
+        for index, item in enumerate(items):
+            component_kwargs = dict(kwargs)
+            component_kwargs[as_var] = item
+            if pass_counter:
+                component_kwargs[counter_var] = index + 1
+            if pass_iteration:
+                component_kwargs[iteration_var] = CollectionIteration(index, size)
+            components.append(cls(**component_kwargs))
+
+        # the template is fetched once if it does not depend on the instance
+        template = None
+        if components and cls._has_static_template():
+            template = components[0].get_template()
+
+        with render_pass():
+            # the keys of all the items are registered before the first one is rendered
+            for component in components:
+                component._ensure_prefetched()
+            output = [
+                component._render_collection_item(context, template)
+                for component in components
+            ]
+        return mark_safe("".join(output))
+
+    @classmethod
+    def get_collection_parameter(cls) -> str:
+        """
+        Name of the __init__ argument which receives the item in render_collection,
+        `PostCardComponent` -> `post_card`
+        """
+        if cls.collection_parameter:
+            return cls.collection_parameter
+        name = cls.__name__
+        if name.endswith("Component") and name != "Component":
+            name = name[: -len("Component")]
+        return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+    @classmethod
+    def _get_init_parameters(cls) -> Optional[Set[str]]:
+        """
+        Return the keyword arguments accepted by __init__, None if it accepts any
+        """
+        parameters = inspect.signature(cls.__init__).parameters.values()
+        if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters):
+            return None
+        return {p.name for p in parameters}
+
+    @classmethod
+    def _has_static_template(cls) -> bool:
+        return all(
+            getattr(cls, name) is getattr(Component, name)
+            for name in (
+                "get_template",
+                "get_template_name",
+                "get_template_string",
+                "render",
+            )
+        )
+
+    def _render_collection_item(self, context: Context, template=None) -> str:
+        self.component_target_var = None
+        with self.bind_context(context):
+            return render_instrumented(
+                self,
+                lambda: self._render_with_fragment_cache(
+                    context,
+                    lambda: self._render_collection_item_template(template),
+                ),
+            )
+
+    def _render_collection_item_template(self, template=None) -> str:
+        with self._get_bound_context().push():
+            updated_context = self._load_context_data()
+            self.create_slot_fields()
+            # slot fields can not be filled in collection rendering
+            self.check_slot_fields()
+            if template is None:
+                return self.render(updated_context)
+            return self._render_template(template, updated_context)
+
+    async def arender_from_parent_context(self, parent_context=None) -> str:
+        """
+        Async version of render_from_parent_context
+        """
+        parent_context = parent_context or {}
+        with self.bind_context(self.prepare_context(parent_context)), render_pass():
+            self._ensure_prefetched()
+            return await arender_instrumented(
+                self,
+                self._arender_from_parent_context(),
+            )
+
+    async def _arender_from_parent_context(self) -> str:
+        cache_key = self.get_fragment_cache_key(self.component_context)
+        if cache_key is not None:
+            return await sync_to_async(self._render_cached)(
+                cache_key,
+                self._render_from_parent_context,
+            )
+
+        with self._get_bound_context().push():
+            updated_context = await self.aget_context_data()
+            return await self.arender(updated_context)
+
+    def render_children(
+        self,
+        children,
+        context: Union[Dict[str, Any], Context, None] = None,
+        executor=None,
+    ) -> List[str]:
+        """
+        Render child components with render_from_parent_context, and return the HTML in order.
+
+        Each child gets a copy of the context, so pushes of one child are not visible to others.
+        If an executor (for example ThreadPoolExecutor) is passed, children flagged with
+        `io_bound` are rendered in the executor, concurrently with their siblings.
+        """
+        children = list(children)
+        results: List[Any] = [None] * len(children)
+
+        with render_pass():
+            for child in children:
+                child._ensure_prefetched()
+
+            if executor is not None:
+                for index, child in enumerate(children):
+                    if child.io_bound:
+                        # the render pass is shared with the executor thread
+                        results[index] = executor.submit(
+                            copy_context().run,
+                            child.render_from_parent_context,
+                            copy(context),
+                        )
+
+            for index, child in enumerate(children):
+                if results[index] is None:
+                    results[index] = child.render_from_parent_context(copy(context))
+
+            return [
+                result.result() if isinstance(result, Future) else result
+                for result in results
+            ]
+
+    def render_from_nodelist(self, nodelist, context: Context, target_var=None) -> str:
+        """
+        Render the component in the template context, `nodelist` is the content
+        passed to the component, it can fill the slot fields of the component.
+
+        This is used by the {% component %} tag and the slot fields.
+        """
+        self.component_target_var = target_var
+        with self.bind_context(context), render_pass():
+            self._ensure_prefetched()
+            return render_instrumented(
+                self,
+                lambda: self._render_with_fragment_cache(
+                    context,
+                    lambda: self._render_from_nodelist(nodelist),
+                ),
+            )
+
+    async def arender_from_nodelist(
+        self,
+        nodelist,
+        context: Context,
+        target_var=None,
+    ) -> str:
+        """
+        Async version of render_from_nodelist
+        """
+        self.component_target_var = target_var
+        with self.bind_context(context), render_pass():
+            self._ensure_prefetched()
+            return await arender_instrumented(
+                self,
+                self._arender_from_nodelist(nodelist, context),
+            )
+
+    async def _arender_from_nodelist(self, nodelist, context: Context) -> str:
+        cache_key = self.get_fragment_cache_key(context)
+        if cache_key is not None:
+            return await sync_to_async(self._render_cached)(
+                cache_key,
+                lambda: self._render_from_nodelist(nodelist),
+            )
+
+        with self._get_bound_context().push():
+            updated_context = await self.aget_context_data()
+            self.create_slot_fields()
+            self.content = await arender_nodelist(nodelist, updated_context)
+            self.check_slot_fields()
+            return await self.arender(updated_context)
+
+    def render_iter_from_nodelist(
+        self,
+        nodelist,
+        context: Context,
+        target_var=None,
+    ) -> Iterator[str]:
+        """
+        Streaming version of render_from_nodelist, the content and slot fields are
+        rendered first, then the template of the component is yielded in chunks
+        """
+        return iter_instrumented(
+            self,
+            self._render_iter_from_nodelist(nodelist, context, target_var),
+        )
+
+    def _render_iter_from_nodelist(
+        self,
+        nodelist,
+        context: Context,
+        target_var=None,
+    ) -> Iterator[str]:
+        self.component_target_var = target_var
+        with self.bind_context(context), render_pass():
+            self._ensure_prefetched()
+            cache_key = self.get_fragment_cache_key(context)
+            if cache_key is not None:
+                yield self._render_cached(
+                    cache_key,
+                    lambda: self._render_from_nodelist(nodelist),
+                )
+                return
+
+            with self._get_bound_context().push():
+                updated_context = self._load_context_data()
+                self.create_slot_fields()
+                self.content = nodelist.render(updated_context)
+                self.check_slot_fields()
+                yield from self.render_iter(updated_context)
+
+    def _render_from_nodelist(self, nodelist) -> str:
+        # https://docs.djangoproject.com/en/5.1/ref/templates/api/#django.template.Context.push
+        with self._get_bound_context().push():
+            # developer can add extra context data in this method
+            updated_context = self._load_context_data()
+
+            # create slot fields
+            self.create_slot_fields()
+
+            # render content first
+            self.content = nodelist.render(updated_context)
+
+            self.check_slot_fields()
+
             return self.render(updated_context)
 
     def check_slot_fields(self):
         # check required slot fields
-        for key in self._rendered_fields_dict().keys():
+        for key in self._slot_fields:
             field = getattr(self, key)
             if field.required and not field.filled:
                 raise ValueError(f"Field {key} is required")
 
     @classmethod
-    def _rendered_fields_dict(cls):
+    def _collect_slot_fields(cls) -> Mapping[str, BaseSlotField]:
+        """
+        Collect slot fields from the class and its parents, follow the MRO so
+        an attribute in subclass can override or hide the field of the parent
+        """
+        slot_fields = {}
+        for klass in reversed(cls.__mro__):
+            for field_name, field in vars(klass).items():
+                if isinstance(field, BaseSlotField):
+                    slot_fields[field_name] = field
+                else:
+                    slot_fields.pop(field_name, None)
+        return MappingProxyType(slot_fields)
+
+    @classmethod
+    def _build_slot_dispatch(cls) -> Mapping[str, Tuple[str, Optional[str]]]:
         """
-        Get slot fields from the Component class fields
+        Map the name used in {% call %} tag to the slot field, for polymorphic slots,
+        each type is called as `<field_name>_<type>`
         """
-        rendered_fields_dict = {}
-        for field_name in dir(cls):
-            field = getattr(cls, field_name)
-            if isinstance(field, BaseSlotField):
-                rendered_fields_dict[field_name] = field
-        return rendered_fields_dict
+        slot_dispatch = {}
+        for field_name, field in cls._slot_fields.items():
+            if field.types:
+                for polymorphic_type in field.types:
+                    slot_dispatch[f"{field_name}_{polymorphic_type}"] = (
+                        field_name,
+                        polymorphic_type,
+                    )
+            else:
+                slot_dispatch[field_name] = (field_name, None)
+        return MappingProxyType(slot_dispatch)
 
     def create_slot_fields(self):
-        slot_fields = self._rendered_fields_dict()
-        for field_name, field in slot_fields.items():
-            new_field = copy.deepcopy(field)
-            new_field.parent_component = self
-            setattr(self, field_name, new_field)
+        for field_name, field in self._slot_fields.items():
+            setattr(self, field_name, field.create_state(self))
@@ -1,3 +1,6 @@
+import threading
+
+
 class AlreadyRegistered(Exception):
     pass
 
@@ -9,6 +12,15 @@ class NotRegistered(Exception):
 class ComponentRegistry:
     def __init__(self):
         self._registry = {}  # component name -> component_class mapping
+        self._names = {}  # component_class -> component name mapping
+        # component name -> path of the component file, imported on first use
+        self._lazy = {}
+        # module name -> registered (name, component_class), kept after clear()
+        self._modules = {}
+        self._lock = threading.RLock()
+        # incremented when the registry changes, lookups cached by the templates
+        # are invalidated, see ComponentNode.get_component_class
+        self.version = 0
 
     def register(self, name=None, component=None):
         existing_component = self._registry.get(name)
@@ -17,23 +29,79 @@ class ComponentRegistry:
                 'The component "%s" has already been registered' % name,
             )
         self._registry[name] = component
+        self._names[component] = name
+        self.version += 1
+        self._modules.setdefault(component.__module__, {})[name] = component
 
     def unregister(self, name):
-        self.get(name)
+        component = self.get(name)
 
         del self._registry[name]
+        if self._names.get(component) == name:
+            del self._names[component]
+        # restore() should not register it again
+        module_components = self._modules.get(component.__module__, {})
+        if module_components.get(name) is component:
+            del module_components[name]
+        self.version += 1
+
+    def register_lazy(self, name, path):
+        """
+        Register the path of the component file, which is imported when the component is used
+        """
+        if name not in self._registry:
+            self._lazy[name] = path
+
+    def _load_lazy(self, name):
+        with self._lock:
+            path = self._lazy.get(name)
+            if path is None or name in self._registry:
+                return
+
+            from django_viewcomponent import import_component_file
+
+            import_component_file(path)
+            # the file can register multiple components
+            self._lazy = {
+                lazy_name: lazy_path
+                for lazy_name, lazy_path in self._lazy.items()
+                if lazy_path != path
+            }
+
+    def restore(self, module_name):
+        """
+        Register again the components registered by the module, the module is not
+        executed twice when autodiscovery runs after clear()
+        """
+        for name, component in self._modules.get(module_name, {}).items():
+            if name not in self._registry:
+                self.register(name, component)
 
     def get(self, name):
+        if name not in self._registry and name in self._lazy:
+            self._load_lazy(name)
+
         if name not in self._registry:
             raise NotRegistered('The component "%s" is not registered' % name)
 
         return self._registry[name]
 
+    def get_name(self, component):
+        """
+        Return the registered name of the component class, or None
+        """
+        return self._names.get(component)
+
     def all(self):
+        for name in list(self._lazy):
+            self._load_lazy(name)
         return self._registry
 
     def clear(self):
         self._registry = {}
+        self._names = {}
+        self._lazy = {}
+        self.version += 1
 
 
 # This variable represents the global component registry
@@ -0,0 +1,162 @@
+"""
+Batched data loading of components in a render pass.
+
+Components register the keys they need (usually in `Component.prefetch`), the keys of
+the same loader are loaded together by one `batch_load` call, when the first value
+is used in a template.
+
+class UserLoader(BatchLoader):
+    def batch_load(self, keys):
+        return User.objects.in_bulk(keys)
+
+
+class UserCardComponent(component.Component):
+    def __init__(self, user_id, **kwargs):
+        self.user_id = user_id
+
+    def prefetch(self):
+        self.user = self.load(UserLoader, self.user_id)
+"""
+
+import threading
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Hashable, Iterable, Mapping, Optional, Type
+
+from django.utils.functional import SimpleLazyObject
+
+
+class BatchLoader:
+    """
+    Load the values of many keys at once, subclasses implement `batch_load`
+    """
+
+    # value of the keys missing in the mapping returned by batch_load
+    default: Any = None
+
+    def batch_load(self, keys: Iterable[Hashable]) -> Mapping[Hashable, Any]:
+        """
+        Return a mapping of key -> value, or a sequence of values in the order of keys
+        """
+        raise NotImplementedError("You must implement the `batch_load` method.")
+
+
+class _LoaderState:
+    __slots__ = ("loader", "pending", "results")
+
+    def __init__(self, loader: BatchLoader):
+        self.loader = loader
+        self.pending: Dict[Hashable, None] = {}  # ordered set
+        self.results: Dict[Hashable, Any] = {}
+
+
+class RenderPass:
+    """
+    Keys and loaded values of the loaders in a render pass, the values are cached
+    until the end of the pass
+    """
+
+    def __init__(self):
+        self._loaders: Dict[Type[BatchLoader], _LoaderState] = {}
+        self._lock = threading.RLock()
+        self.batches = 0
+        # HTML of the pure components, see Component.pure
+        self.memo: Dict[Hashable, str] = {}
+        self.memo_hits = 0
+
+    def _get_state(self, loader_cls: Type[BatchLoader]) -> _LoaderState:
+        state = self._loaders.get(loader_cls)
+        if state is None:
+            state = self._loaders[loader_cls] = _LoaderState(loader_cls())
+        return state
+
+    def register(self, loader_cls: Type[BatchLoader], key: Hashable):
+        with self._lock:
+            state = self._get_state(loader_cls)
+            if key not in state.results:
+                state.pending[key] = None
+
+    def get(self, loader_cls: Type[BatchLoader], key: Hashable) -> Any:
+        with self._lock:
+            state = self._get_state(loader_cls)
+            if key not in state.results:
+                state.pending[key] = None
+                self.dispatch(state)
+            return state.results[key]
+
+    def dispatch(self, state: _LoaderState):
+        keys = list(state.pending)
+        state.pending = {}
+        values = state.loader.batch_load(keys)
+        self.batches += 1
+
+        if isinstance(values, Mapping):
+            for key in keys:
+                state.results[key] = values.get(key, state.loader.default)
+        else:
+            values = list(values)
+            if len(values) != len(keys):
+                raise ValueError(
+                    f"{type(state.loader).__name__}.batch_load returned {len(values)} values for {len(keys)} keys",
+                )
+            state.results.update(zip(keys, values))
+
+    def memoize(self, key: Hashable, render: Callable[[], str]) -> str:
+        """
+        Return the HTML rendered with the same key in the render pass, or render it
+        """
+        html = self.memo.get(key)
+        if html is None:
+            html = self.memo[key] = render()
+        else:
+            self.memo_hits += 1
+        return html
+
+    def load(self, loader_cls: Type[BatchLoader], key: Hashable) -> Any:
+        """
+        Register the key and return a lazy value, which is loaded in batch when it is used
+        """
+        self.register(loader_cls, key)
+        return SimpleLazyObject(lambda: self.get(loader_cls, key))
+
+
+_current_render_pass: ContextVar[Optional[RenderPass]] = ContextVar(
+    "viewcomponent_render_pass",
+    default=None,
+)
+
+
+def get_render_pass() -> Optional[RenderPass]:
+    return _current_render_pass.get()
+
+
+@contextmanager
+def render_pass():
+    """
+    Start a render pass, if a render pass is already active, it is reused
+    """
+    current = _current_render_pass.get()
+    if current is not None:
+        yield current
+        return
+
+    current = RenderPass()
+    token = _current_render_pass.set(current)
+    try:
+        yield current
+    finally:
+        # the generator might be finalized in another context, which can have its
+        # own render pass, drop the token without touching the variable
+        with suppress(ValueError):
+            _current_render_pass.reset(token)
+
+
+def load(loader_cls: Type[BatchLoader], key: Hashable) -> Any:
+    """
+    Load the value of the key in the current render pass, outside of a render pass
+    the value is loaded immediately
+    """
+    current = _current_render_pass.get()
+    if current is None:
+        return RenderPass().get(loader_cls, key)
+    return current.load(loader_cls, key)
@@ -0,0 +1,118 @@
+"""
+Helpers of component autodiscovery: package-qualified module names and parallel
+bytecode compilation of the component files.
+"""
+
+import hashlib
+import importlib.util
+import os
+import py_compile
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+# spawning worker processes is only worth it when there are enough files to compile
+PARALLEL_COMPILE_THRESHOLD = 16
+
+
+def get_module_name(path) -> str:
+    """
+    Return the package-qualified module name of the file, based on sys.path
+
+    For example, `/app/blog/components/post/post.py` is `blog.components.post.post`
+    if `/app` is in sys.path. If the name can not be derived, a unique name based on
+    the path is returned.
+    """
+    path = Path(path).resolve().with_suffix("")
+    candidates = []
+    for entry in sys.path:
+        try:
+            parts = path.relative_to(Path(entry or os.getcwd()).resolve()).parts
+        except (ValueError, OSError):
+            continue
+        if parts and all(part.isidentifier() for part in parts):
+            candidates.append(".".join(parts))
+
+    # prefer the name whose top-level package is already imported
+    for name in candidates:
+        if name.split(".")[0] in sys.modules:
+            return name
+    if candidates:
+        return candidates[0]
+
+    digest = hashlib.sha1(str(path).encode()).hexdigest()[:8]
+    return f"django_viewcomponent.discovered.{path.name}_{digest}"
+
+
+def is_bytecode_stale(path) -> bool:
+    try:
+        cache_path = importlib.util.cache_from_source(str(path))
+        return os.stat(cache_path).st_mtime < os.stat(path).st_mtime
+    except (OSError, NotImplementedError):
+        return True
+
+
+def can_write_bytecode(path) -> bool:
+    """
+    Whether the bytecode of the file can be written, `__pycache__` is not writable
+    in read-only images, the bytecode would stay stale on every start
+    """
+    try:
+        cache_dir = os.path.dirname(importlib.util.cache_from_source(str(path)))
+    except NotImplementedError:
+        return False
+    if not os.path.isdir(cache_dir):
+        cache_dir = os.path.dirname(cache_dir)
+    return os.access(cache_dir, os.W_OK)
+
+
+def _compile(path) -> bool:
+    try:
+        py_compile.compile(
+            path,
+            cfile=importlib.util.cache_from_source(path),
+            doraise=True,
+        )
+    except (py_compile.PyCompileError, OSError):
+        # the import reports the error
+        return False
+    return True
+
+
+def precompile_files(
+    paths: Iterable[str],
+    workers: Optional[int] = None,
+    threshold: int = PARALLEL_COMPILE_THRESHOLD,
+) -> List[str]:
+    """
+    Compile the stale bytecode of the files in parallel, so the following imports only
+    need to load the bytecode. Return the paths which were compiled.
+
+    `workers` is the number of worker processes, None for the number of CPU cores,
+    nothing is compiled with less than 2 workers.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if sys.dont_write_bytecode or workers < 2:
+        return []
+
+    stale = [
+        str(path)
+        for path in paths
+        if is_bytecode_stale(path) and can_write_bytecode(path)
+    ]
+    if len(stale) < max(threshold, 2):
+        return []
+
+    try:
+        with ProcessPoolExecutor(max_workers=min(workers, len(stale))) as executor:
+            results = executor.map(
+                _compile,
+                stale,
+                chunksize=max(len(stale) // (workers * 4), 1),
+            )
+            return [path for path, compiled in zip(stale, results) if compiled]
+    except (OSError, NotImplementedError, RuntimeError):
+        # multiprocessing is not available, the files are compiled on import
+        return []
@@ -1,4 +1,13 @@
+import bisect
+import copy
+import inspect
+import warnings
+
+from asgiref.sync import sync_to_async
+
 from django_viewcomponent.component_registry import registry as component_registry
+from django_viewcomponent.rendering import arender_nodelist, get_render_position
+from django_viewcomponent.tree import create_component
 
 
 class FieldValue:
@@ -25,13 +34,14 @@ class FieldValue:
     def __str__(self):
         return self.render()
 
-    def render(self):
+    def _get_component_expression(self):
         if self._polymorphic_types:
-            component_expression = self._polymorphic_types[self._polymorphic_type]
-            return self._render(component_expression)
+            return self._polymorphic_types[self._polymorphic_type]
         else:
-            component_expression = self._component
-            return self._render(component_expression)
+            return self._component
+
+    def render(self):
+        return self._render(self._get_component_expression())
 
     def _render(self, target):
         from django_viewcomponent.component import Component
@@ -71,51 +81,124 @@ class FieldValue:
             raise ValueError(f"Invalid component variable {target}")
 
     def _render_for_component_cls(self, component_cls):
-        component = component_cls(
-            **self._dict_data,
-        )
+        if component_cls.pure:
+            return component_cls.render_memoized(
+                (),
+                self._dict_data,
+                self._nodelist,
+                lambda: self._render_for_component_instance(
+                    create_component(component_cls, kwargs=self._dict_data),
+                ),
+            )
+
+        component = create_component(component_cls, kwargs=self._dict_data)
 
         return self._render_for_component_instance(component)
 
     def _render_for_component_instance(self, component):
+        return component.render_from_nodelist(
+            self._nodelist,
+            self._field_context,
+            self._target_var,
+        )
+
+    async def arender(self):
         """
-        The logic should be the same as in the ComponentNode.render method
+        Async version of render
         """
-        component.component_target_var = self._target_var
-        component.component_context = self._field_context
+        from django_viewcomponent.component import Component
 
-        # https://docs.djangoproject.com/en/5.1/ref/templates/api/#django.template.Context.push
-        with component.component_context.push():
-            # developer can add extra context data in this method
-            updated_context = component.get_context_data()
+        target = self._get_component_expression()
+        if isinstance(target, str):
+            return await self._arender_for_component_instance(
+                create_component(
+                    component_registry.get(target),
+                    kwargs=self._dict_data,
+                ),
+            )
+        elif not isinstance(target, type) and callable(target):
+            # target is function
+            content = await arender_nodelist(self._nodelist, self._field_context)
+            result = target(
+                self=self._parent_component,
+                content=content,
+                **self._dict_data,
+            )
 
-            # create slot fields
-            component.create_slot_fields()
+            if isinstance(result, str):
+                return result
+            elif isinstance(result, Component):
+                return await self._arender_for_component_instance(result)
+            else:
+                raise ValueError(
+                    f"Callable slot component must return str or Component instance. Got {result}",
+                )
+        elif isinstance(target, type) and issubclass(target, Component):
+            return await self._arender_for_component_instance(
+                create_component(target, kwargs=self._dict_data),
+            )
+        elif target is None:
+            return await arender_nodelist(self._nodelist, self._field_context)
+        else:
+            raise ValueError(f"Invalid component variable {target}")
 
-            # render content first
-            component.content = self._nodelist.render(updated_context)
+    async def _arender_for_component_instance(self, component):
+        return await component.arender_from_nodelist(
+            self._nodelist,
+            self._field_context,
+            self._target_var,
+        )
 
-            component.check_slot_fields()
 
-            return component.render(updated_context)
+class BaseSlotField:
+    """
+    Slot field declared on the component class, it is shared by all the component
+    instances, so it should not be changed during rendering.
 
+    The value of the slot is stored in the `SlotFieldState` of the component instance.
+    """
 
-class BaseSlotField:
+    # subclasses which override `handle_call(self, nodelist, ...)` without the state
+    # argument keep the value on the field, the field is copied for each instance
+    _legacy_handle_call = False
     parent_component = None
+    _value = None
+    _filled = False
 
     def __init__(self, required=False, component=None, types=None, **kwargs):
-        self._value = None
-        self._filled = False
         self._required = required
         self._component = component
         self._types = types
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        handle_call = cls.__dict__.get("handle_call")
+        if handle_call is None:
+            return
+        params = list(inspect.signature(handle_call).parameters)
+        cls._legacy_handle_call = params[1:2] != ["state"]
+        if cls._legacy_handle_call:
+            warnings.warn(
+                f"{cls.__qualname__}.handle_call() should accept the slot field state "
+                "as the first argument, handle_call(self, nodelist, ...) is deprecated",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+
     @classmethod
     def initialize_fields(cls):
         cls.header = RendersOneField()
         cls.main = RendersOneField()
         cls.footer = RendersOneField()
 
+    @property
+    def required(self):
+        return self._required
+
+    @property
+    def types(self):
+        return self._types
+
     @property
     def value(self):
         return self._value
@@ -124,61 +207,279 @@ class BaseSlotField:
     def filled(self):
         return self._filled
 
+    def create_state(self, parent_component):
+        if self._legacy_handle_call:
+            return LegacySlotFieldState(self, parent_component)
+        return SlotFieldState(self, parent_component)
+
+    def create_value(
+        self,
+        state,
+        nodelist,
+        context,
+        target_var,
+        polymorphic_type,
+        **kwargs,
+    ):
+        return FieldValue(
+            nodelist=nodelist,
+            field_context=context,
+            target_var=target_var,
+            polymorphic_type=polymorphic_type,
+            polymorphic_types=self.types,
+            dict_data={**kwargs},
+            component=self._component,
+            parent_component=state.parent_component,
+        )
+
+    def handle_call(
+        self,
+        state,
+        nodelist,
+        context,
+        target_var,
+        polymorphic_type,
+        **kwargs,
+    ):
+        raise NotImplementedError("You must implement the `handle_call` method.")
+
+    async def ahandle_call(
+        self,
+        state,
+        nodelist,
+        context,
+        target_var,
+        polymorphic_type,
+        **kwargs,
+    ):
+        """
+        Async version of handle_call, by default handle_call is called in a thread
+        """
+        return await sync_to_async(self.handle_call)(
+            state,
+            nodelist,
+            context,
+            target_var,
+            polymorphic_type,
+            **kwargs,
+        )
+
+
+class SlotFieldState:
+    """
+    Per-render state of a slot field, created for each component instance
+    """
+
+    __slots__ = ("field", "parent_component", "value", "filled")
+
+    def __init__(self, field, parent_component):
+        self.field = field
+        self.parent_component = parent_component
+        self.value = None
+        self.filled = False
+
     @property
     def required(self):
-        return self._required
+        return self.field.required
 
     @property
     def types(self):
-        return self._types
+        return self.field.types
 
     def handle_call(self, nodelist, context, target_var, polymorphic_type, **kwargs):
-        raise NotImplementedError("You must implement the `handle_call` method.")
+        return self.field.handle_call(
+            self,
+            nodelist,
+            context,
+            target_var,
+            polymorphic_type,
+            **kwargs,
+        )
 
+    async def ahandle_call(
+        self,
+        nodelist,
+        context,
+        target_var,
+        polymorphic_type,
+        **kwargs,
+    ):
+        return await self.field.ahandle_call(
+            self,
+            nodelist,
+            context,
+            target_var,
+            polymorphic_type,
+            **kwargs,
+        )
+
+
+class LegacySlotFieldState:
+    """
+    State of a slot field with the deprecated `handle_call(self, nodelist, ...)`,
+    which stores the value on a copy of the field
+    """
+
+    __slots__ = ("field",)
+
+    def __init__(self, field, parent_component):
+        self.field = copy.deepcopy(field)
+        self.field.parent_component = parent_component
+
+    @property
+    def parent_component(self):
+        return self.field.parent_component
+
+    @property
+    def value(self):
+        return self.field.value
+
+    @property
+    def filled(self):
+        return self.field.filled
+
+    @property
+    def required(self):
+        return self.field.required
+
+    @property
+    def types(self):
+        return self.field.types
 
-class RendersOneField(BaseSlotField):
     def handle_call(self, nodelist, context, target_var, polymorphic_type, **kwargs):
-        value_instance = FieldValue(
-            nodelist=nodelist,
-            field_context=context,
-            target_var=target_var,
-            polymorphic_type=polymorphic_type,
-            polymorphic_types=self.types,
-            dict_data={**kwargs},
-            component=self._component,
-            parent_component=self.parent_component,
+        return self.field.handle_call(
+            nodelist,
+            context,
+            target_var,
+            polymorphic_type,
+            **kwargs,
         )
 
-        self._value = value_instance.render()
-        self._filled = True
+    async def ahandle_call(
+        self,
+        nodelist,
+        context,
+        target_var,
+        polymorphic_type,
+        **kwargs,
+    ):
+        return await sync_to_async(self.handle_call)(
+            nodelist,
+            context,
+            target_var,
+            polymorphic_type,
+            **kwargs,
+        )
+
+
+class RendersOneField(BaseSlotField):
+    def handle_call(
+        self,
+        state,
+        nodelist,
+        context,
+        target_var,
+        polymorphic_type,
+        **kwargs,
+    ):
+        value_instance = self.create_value(
+            state,
+            nodelist,
+            context,
+            target_var,
+            polymorphic_type,
+            **kwargs,
+        )
+
+        state.value = value_instance.render()
+        state.filled = True
+
+    async def ahandle_call(
+        self,
+        state,
+        nodelist,
+        context,
+        target_var,
+        polymorphic_type,
+        **kwargs,
+    ):
+        value_instance = self.create_value(
+            state,
+            nodelist,
+            context,
+            target_var,
+            polymorphic_type,
+            **kwargs,
+        )
+
+        state.value = await value_instance.arender()
+        state.filled = True
 
 
 class FieldValueListWrapper:
     def __init__(self):
         self.data = []
+        self._positions = []
 
-    def append(self, value):
-        self.data.append(value)
+    def append(self, value, position=()):
+        """
+        Add the value in the order of the position of the call in the document,
+        the calls of sibling components rendered concurrently can finish in any order
+        """
+        index = bisect.bisect_right(self._positions, position)
+        self._positions.insert(index, position)
+        self.data.insert(index, value)
 
     def __iter__(self):
         yield from self.data
 
 
 class RendersManyField(BaseSlotField):
-    def handle_call(self, nodelist, context, target_var, polymorphic_type, **kwargs):
-        value_instance = FieldValue(
-            nodelist=nodelist,
-            field_context=context,
-            target_var=target_var,
-            polymorphic_type=polymorphic_type,
-            polymorphic_types=self.types,
-            dict_data={**kwargs},
-            component=self._component,
-            parent_component=self.parent_component,
+    def handle_call(
+        self,
+        state,
+        nodelist,
+        context,
+        target_var,
+        polymorphic_type,
+        **kwargs,
+    ):
+        value_instance = self.create_value(
+            state,
+            nodelist,
+            context,
+            target_var,
+            polymorphic_type,
+            **kwargs,
+        )
+
+        if state.value is None:
+            state.value = FieldValueListWrapper()
+
+        state.value.append(value_instance.render(), get_render_position())
+        state.filled = True
+
+    async def ahandle_call(
+        self,
+        state,
+        nodelist,
+        context,
+        target_var,
+        polymorphic_type,
+        **kwargs,
+    ):
+        value_instance = self.create_value(
+            state,
+            nodelist,
+            context,
+            target_var,
+            polymorphic_type,
+            **kwargs,
         )
 
-        if self._value is None:
-            self._value = FieldValueListWrapper()
+        if state.value is None:
+            state.value = FieldValueListWrapper()
 
-        self._value.append(value_instance.render())
-        self._filled = True
+        position = get_render_position()
+        state.value.append(await value_instance.arender(), position)
+        state.filled = True
@@ -0,0 +1,207 @@
+"""
+Render-time instrumentation of components.
+
+`component_render_started` and `component_render_finished` signals are sent around
+each component render, when any receiver is connected. `RenderStats` aggregates
+the timings, per process and per request (see `ComponentRenderStatsMiddleware`).
+"""
+
+import threading
+import time
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+from django_viewcomponent.component_registry import registry as component_registry
+from django_viewcomponent.signals import (
+    component_render_finished,
+    component_render_started,
+)
+
+_render_depth: ContextVar[int] = ContextVar("viewcomponent_render_depth", default=0)
+
+
+def is_enabled() -> bool:
+    return bool(
+        component_render_started.receivers or component_render_finished.receivers,
+    )
+
+
+def get_component_name(component) -> str:
+    component_cls = type(component)
+    return component_registry.get_name(component_cls) or component_cls.__qualname__
+
+
+class _RenderEvent:
+    def __init__(self, component):
+        self.component = component
+        self.name = get_component_name(component)
+        self.depth = _render_depth.get()
+        self.size = 0
+
+    def start(self):
+        self._depth_token = _render_depth.set(self.depth + 1)
+        component_render_started.send(
+            sender=type(self.component),
+            component=self.component,
+            name=self.name,
+            depth=self.depth,
+        )
+        self._start = time.perf_counter()
+
+    def finish(self):
+        duration = time.perf_counter() - self._start
+        # the generator of stream() might be advanced in another context
+        with suppress(ValueError):
+            _render_depth.reset(self._depth_token)
+        component_render_finished.send(
+            sender=type(self.component),
+            component=self.component,
+            name=self.name,
+            depth=self.depth,
+            duration=duration,
+            size=self.size,
+        )
+
+
+def render_instrumented(component, render) -> str:
+    if not is_enabled():
+        return render()
+
+    event = _RenderEvent(component)
+    event.start()
+    try:
+        html = render()
+        event.size = len(html)
+        return html
+    finally:
+        event.finish()
+
+
+async def arender_instrumented(component, coroutine) -> str:
+    if not is_enabled():
+        return await coroutine
+
+    event = _RenderEvent(component)
+    event.start()
+    try:
+        html = await coroutine
+        event.size = len(html)
+        return html
+    finally:
+        event.finish()
+
+
+def iter_instrumented(component, iterator):
+    if not is_enabled():
+        yield from iterator
+        return
+
+    event = _RenderEvent(component)
+    event.start()
+    try:
+        for chunk in iterator:
+            event.size += len(chunk)
+            yield chunk
+    finally:
+        event.finish()
+
+
+class RenderStats:
+    """
+    Aggregate render timings by component name
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def record(self, name, duration, size):
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = {
+                    "count": 0,
+                    "total_time": 0.0,
+                    "max_time": 0.0,
+                    "total_size": 0,
+                }
+            stats["count"] += 1
+            stats["total_time"] += duration
+            stats["max_time"] = max(stats["max_time"], duration)
+            stats["total_size"] += size
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {name: dict(stats) for name, stats in self._stats.items()}
+
+    def reset(self):
+        with self._lock:
+            self._stats = {}
+
+
+# render stats of the whole process, collected while ComponentRenderStatsMiddleware handles a request
+process_stats = RenderStats()
+
+_request_stats: ContextVar[Optional[RenderStats]] = ContextVar(
+    "viewcomponent_request_stats",
+    default=None,
+)
+
+
+def collect_render_stats(sender, name, duration, size, **kwargs):
+    process_stats.record(name, duration, size)
+    request_stats = _request_stats.get()
+    if request_stats is not None:
+        request_stats.record(name, duration, size)
+
+
+class _StatsReceiver:
+    """
+    Connect `collect_render_stats` while at least one block collects stats
+    """
+
+    dispatch_uid = "viewcomponent_collect_render_stats"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._active = 0
+
+    def activate(self):
+        with self._lock:
+            if self._active == 0:
+                component_render_finished.connect(
+                    collect_render_stats,
+                    dispatch_uid=self.dispatch_uid,
+                )
+            self._active += 1
+
+    def deactivate(self):
+        with self._lock:
+            self._active -= 1
+            if self._active == 0:
+                component_render_finished.disconnect(dispatch_uid=self.dispatch_uid)
+
+
+_stats_receiver = _StatsReceiver()
+
+
+@contextmanager
+def collect_request_stats():
+    """
+    Collect the render stats of the components rendered in the block
+
+    with collect_request_stats() as stats:
+        html = template.render(context)
+    print(stats.snapshot())
+
+    The receiver is only connected while a block is active, so there is no overhead otherwise.
+    """
+    stats = RenderStats()
+    _stats_receiver.activate()
+    token = _request_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _request_stats.reset(token)
+        _stats_receiver.deactivate()
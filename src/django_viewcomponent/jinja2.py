@@ -0,0 +1,205 @@
+"""
+Jinja2 integration.
+
+Use the environment in settings.py
+
+TEMPLATES = [
+    {
+        "BACKEND": "django.template.backends.jinja2.Jinja2",
+        "DIRS": [],
+        "APP_DIRS": True,
+        "OPTIONS": {
+            "environment": "django_viewcomponent.jinja2.environment",
+        },
+    },
+]
+
+Then components can be used in Jinja2 templates
+
+{% component "card" title="Hello" as card %}
+  {% callslot card.header %}<h1>Header</h1>{% endcallslot %}
+  content
+{% endcomponent %}
+"""
+
+from django.template.base import Node, NodeList
+from django.template.context import Context
+from jinja2 import ChoiceLoader, Environment, FileSystemLoader, nodes
+from jinja2.ext import Extension
+from markupsafe import Markup
+
+from django_viewcomponent.component_registry import registry as component_registry
+from django_viewcomponent.loaders import get_component_dirs
+from django_viewcomponent.signals import slot_called
+
+
+class CallerNode(Node):
+    """
+    Render the body of the Jinja2 tag, the component (or slot field) instance is
+    passed to the body as the target variable
+    """
+
+    def __init__(self, caller, target_var=None):
+        self.caller = caller
+        self.target_var = target_var
+
+    def render_annotated(self, context):
+        # errors are raised by Jinja2 with the location in the Jinja2 template
+        return self.render(context)
+
+    def render(self, context):
+        if self.target_var:
+            return str(self.caller(context.get(self.target_var)))
+        return str(self.caller())
+
+
+def caller_nodelist(caller, target_var=None) -> NodeList:
+    return NodeList([CallerNode(caller, target_var)])
+
+
+class ComponentLoader(FileSystemLoader):
+    """
+    Jinja2 loader that loads templates from the "components" directories
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(get_component_dirs(), **kwargs)
+
+
+class ComponentExtension(Extension):
+    """
+    Add {% component %} and {% callslot %} tags, which work like {% component %}
+    and {% call %} tags of the Django template language.
+    """
+
+    tags = {"component", "callslot"}
+
+    def parse(self, parser):
+        token = next(parser.stream)
+        if token.value == "component":
+            return self.parse_component(parser, token.lineno)
+        return self.parse_callslot(parser, token.lineno)
+
+    def parse_kwargs(self, parser):
+        kwargs = []
+        target_var = None
+        while parser.stream.current.type != "block_end":
+            if parser.stream.skip_if("name:as"):
+                target_var = parser.stream.expect("name").value
+                continue
+            key = parser.stream.expect("name")
+            parser.stream.expect("assign")
+            value = parser.parse_expression()
+            kwargs.append(nodes.Pair(nodes.Const(key.value), value, lineno=key.lineno))
+            parser.stream.skip_if("comma")
+        return nodes.Dict(kwargs), target_var
+
+    def make_call_block(self, method, args, target_var, body, lineno):
+        caller_args = [nodes.Name(target_var, "param")] if target_var else []
+        call = self.call_method(
+            method,
+            [nodes.ContextReference(), *args, nodes.Const(target_var)],
+        )
+        return nodes.CallBlock(call, caller_args, [], body).set_lineno(lineno)
+
+    def parse_component(self, parser, lineno):
+        component_name = parser.parse_expression()
+        kwargs, target_var = self.parse_kwargs(parser)
+        body = parser.parse_statements(("name:endcomponent",), drop_needle=True)
+        return self.make_call_block(
+            "_render_component",
+            [component_name, kwargs],
+            target_var,
+            body,
+            lineno,
+        )
+
+    def parse_callslot(self, parser, lineno):
+        component_var = parser.stream.expect("name")
+        parser.stream.expect("dot")
+        field_token = parser.stream.expect("name").value
+        kwargs, target_var = self.parse_kwargs(parser)
+        body = parser.parse_statements(("name:endcallslot",), drop_needle=True)
+        return self.make_call_block(
+            "_call_slot",
+            [
+                nodes.Name(component_var.value, "load"),
+                nodes.Const(component_var.value),
+                nodes.Const(field_token),
+                kwargs,
+            ],
+            target_var,
+            body,
+            lineno,
+        )
+
+    def _render_component(
+        self,
+        jinja_context,
+        component_name,
+        kwargs,
+        target_var,
+        caller,
+    ):
+        component_cls = component_registry.get(component_name)
+        component = component_cls(**kwargs)
+        context = Context(jinja_context.get_all())
+        return Markup(
+            component.render_from_nodelist(
+                caller_nodelist(caller, target_var),
+                context,
+                target_var,
+            ),
+        )
+
+    def _call_slot(
+        self,
+        jinja_context,
+        component,
+        component_var,
+        field_token,
+        kwargs,
+        target_var,
+        caller,
+    ):
+        if not component:
+            raise ValueError(f"Component {component_var} not found in context")
+
+        slot_dispatch = getattr(component, "_slot_dispatch", {})
+        if field_token not in slot_dispatch:
+            raise ValueError(
+                f"Field {field_token} not found in component {component_var}",
+            )
+
+        field_name, polymorphic_type = slot_dispatch[field_token]
+        field = getattr(component, field_name)
+        if slot_called.receivers:
+            slot_called.send(
+                sender=type(component),
+                component=component,
+                field_name=field_token,
+            )
+        field.handle_call(
+            nodelist=caller_nodelist(caller, target_var),
+            context=component.component_context,
+            target_var=target_var,
+            polymorphic_type=polymorphic_type,
+            **kwargs,
+        )
+        return ""
+
+
+def environment(**options):
+    """
+    Jinja2 environment with the component extension, templates in the "components"
+    directories can be loaded too
+    """
+    extensions = list(options.pop("extensions", []))
+    if ComponentExtension not in extensions:
+        extensions.append(ComponentExtension)
+
+    loader = options.pop("loader", None)
+    options["loader"] = (
+        ChoiceLoader([loader, ComponentLoader()]) if loader else ComponentLoader()
+    )
+    return Environment(extensions=extensions, **options)
@@ -2,34 +2,131 @@
 Template loader that loads templates from each Django app's "components" directory.
 """
 
+import os
+import posixpath
+import threading
+import weakref
 from pathlib import Path
+from typing import Dict, List
 
 from django.conf import settings
+from django.dispatch import receiver
+from django.template import Origin
 from django.template.loaders.filesystem import Loader as FilesystemLoader
 from django.template.utils import get_app_template_dirs
+from django.utils.autoreload import file_changed
+
+# files in the "components" directories which are not templates
+IGNORED_SUFFIXES = (".py", ".pyc")
+IGNORED_DIRS = ("__pycache__",)
+
+
+def get_component_dirs() -> List[Path]:
+    """
+    Return the "components" directories of the Django apps and the project, in search
+    order: the apps in INSTALLED_APPS order, BASE_DIR, then the parents of the settings module
+    """
+    component_dir = "components"
+    # dict keeps the insertion order, and removes the duplicates
+    directories: Dict[Path, None] = dict.fromkeys(
+        Path(path).resolve() for path in get_app_template_dirs(component_dir)
+    )
+
+    if hasattr(settings, "BASE_DIR"):
+        path = (Path(settings.BASE_DIR) / component_dir).resolve()
+        if path.is_dir():
+            directories[path] = None
+
+    if settings.SETTINGS_MODULE:
+        module_parts = settings.SETTINGS_MODULE.split(".")
+        module_path = Path(*module_parts)
+
+        if len(module_parts) > 2:
+            module_path = Path(*module_parts[:-1])
+
+        # Use list() for < Python 3.9
+        for parent in list(module_path.parents)[:2]:
+            path = (parent / component_dir).resolve()
+            if path.is_dir():
+                directories[path] = None
+
+    return list(directories)
+
+
+def build_template_index(directories) -> Dict[str, str]:
+    """
+    Map the name of every template in the directories to its absolute path,
+    if a name exists in several directories, the first directory wins
+    """
+    index: Dict[str, str] = {}
+    for directory in directories:
+        for root, dirs, files in os.walk(directory, followlinks=True):
+            dirs[:] = sorted(d for d in dirs if d not in IGNORED_DIRS)
+            relative_root = os.path.relpath(root, directory)
+            for filename in files:
+                if filename.endswith(IGNORED_SUFFIXES):
+                    continue
+                name = os.path.normpath(os.path.join(relative_root, filename))
+                index.setdefault(
+                    name.replace(os.sep, "/"),
+                    os.path.join(root, filename),
+                )
+    return index
+
+
+# loaders with an index, reset when a file of their directories changes under runserver
+_loaders: "weakref.WeakSet[ComponentLoader]" = weakref.WeakSet()
 
 
 class ComponentLoader(FilesystemLoader):
+    """
+    Load templates from the "components" directories.
+
+    The directories are computed once, and the templates are found in an index of
+    name -> path built on the first lookup, instead of checking each directory.
+    Call `reset()` to rebuild them, it is done automatically when a file of the
+    directories changes under runserver.
+    """
+
+    def __init__(self, engine, dirs=None):
+        super().__init__(engine, dirs)
+        self._component_dirs = None
+        self._index = None
+        self._lock = threading.Lock()
+        _loaders.add(self)
+
     def get_dirs(self):
-        component_dir = "components"
-        directories = set(get_app_template_dirs(component_dir))
+        if self.dirs is not None:
+            return self.dirs
+        component_dirs = self._component_dirs
+        if component_dirs is None:
+            component_dirs = self._component_dirs = get_component_dirs()
+        return component_dirs
 
-        if hasattr(settings, "BASE_DIR"):
-            path = (Path(settings.BASE_DIR) / component_dir).resolve()
-            if path.is_dir():
-                directories.add(path)
+    def get_index(self) -> Dict[str, str]:
+        index = self._index
+        if index is None:
+            with self._lock:
+                index = self._index
+                if index is None:
+                    index = self._index = build_template_index(self.get_dirs())
+        return index
 
-        if settings.SETTINGS_MODULE:
-            module_parts = settings.SETTINGS_MODULE.split(".")
-            module_path = Path(*module_parts)
+    def get_template_sources(self, template_name):
+        path = self.get_index().get(template_name)
+        if path is not None:
+            yield Origin(name=path, template_name=template_name, loader=self)
+        elif posixpath.normpath(template_name) != template_name:
+            # names like "./card.html" are not in the index
+            yield from super().get_template_sources(template_name)
 
-            if len(module_parts) > 2:
-                module_path = Path(*module_parts[:-1])
+    def reset(self):
+        self._component_dirs = None
+        self._index = None
 
-            # Use list() for < Python 3.9
-            for parent in list(module_path.parents)[:2]:
-                path = (parent / component_dir).resolve()
-                if path.is_dir():
-                    directories.add(path)
 
-        return list(directories)
+@receiver(file_changed, dispatch_uid="viewcomponent_component_loader_file_changed")
+def reset_component_loaders(sender, file_path, **kwargs):
+    for loader in list(_loaders):
+        if any(Path(directory) in file_path.parents for directory in loader.get_dirs()):
+            loader.reset()
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from django_viewcomponent.manifest import build_manifest, write_manifest
+
+
+class Command(BaseCommand):
+    help = "Write the manifest of components, which is used by lazy autodiscovery"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            help="Path of the manifest file, default is the `component_manifest` setting",
+        )
+
+    def handle(self, *args, **options):
+        from django_viewcomponent.app_settings import app_settings
+
+        output = options["output"] or app_settings.COMPONENT_MANIFEST
+        if output is None:
+            raise CommandError(
+                "Please set the `component_manifest` setting or pass --output",
+            )
+
+        manifest = build_manifest()
+        write_manifest(output, manifest)
+        self.stdout.write(
+            self.style.SUCCESS(f"Wrote {len(manifest)} components to {output}"),
+        )
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from django_viewcomponent.warmup import warmup_components
+
+
+class Command(BaseCommand):
+    help = (
+        "Compile the templates of all the registered components, and report the timings"
+    )
+
+    def handle(self, *args, **options):
+        results = warmup_components()
+        results.sort(key=lambda result: result.duration, reverse=True)
+
+        for result in results:
+            duration = f"{result.duration * 1000:8.2f}ms"
+            if result.error is not None:
+                self.stdout.write(
+                    self.style.ERROR(f"{duration}  {result.name}  {result.error!r}"),
+                )
+            elif result.skipped:
+                self.stdout.write(
+                    f"{duration}  {result.name}  (skipped, the template depends on the instance)",
+                )
+            else:
+                self.stdout.write(f"{duration}  {result.name}  {result.template}")
+
+        errors = [result for result in results if result.error is not None]
+        total = sum(result.duration for result in results) * 1000
+        if errors:
+            raise CommandError(
+                f"Failed to compile {len(errors)} of {len(results)} component templates",
+            )
+        compiled = sum(1 for result in results if not result.skipped)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Compiled {compiled} component templates in {total:.2f}ms",
+            ),
+        )
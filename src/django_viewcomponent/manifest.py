@@ -0,0 +1,87 @@
+"""
+Manifest of the components in the components directories.
+
+The manifest maps each registered component name to the file which defines it,
+so the files can be imported on first use instead of at startup.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, Optional
+
+from django_viewcomponent.component_registry import registry as component_registry
+
+MANIFEST_VERSION = 1
+
+
+def build_manifest() -> Dict[str, str]:
+    """
+    Import all component files, and return the mapping of component name -> file path
+    """
+    from django_viewcomponent import import_component_file, iter_component_files
+
+    paths = set()
+    for file_path in iter_component_files():
+        path = os.path.abspath(file_path)
+        import_component_file(path)
+        paths.add(path)
+
+    manifest = {}
+    # skip all(), which would import the components of a stale manifest
+    for name, component_cls in component_registry._registry.items():
+        module = sys.modules.get(component_cls.__module__)
+        path = getattr(module, "__file__", None)
+        if path and os.path.abspath(path) in paths:
+            manifest[name] = os.path.abspath(path)
+    return dict(sorted(manifest.items()))
+
+
+def write_manifest(path, manifest: Dict[str, str]):
+    """
+    Write the manifest as JSON, the file paths are relative to the manifest file,
+    so the project can be moved together with the manifest.
+    """
+    base = Path(path).resolve().parent
+    data = {
+        "version": MANIFEST_VERSION,
+        "components": {
+            name: os.path.relpath(file_path, base)
+            for name, file_path in manifest.items()
+        },
+    }
+    Path(path).write_text(json.dumps(data, indent=2, sort_keys=True) + "\n")
+
+
+def read_manifest(path) -> Optional[Dict[str, str]]:
+    """
+    Return the mapping of component name -> absolute file path, or None if the
+    manifest does not exist
+    """
+    if path is None or not Path(path).is_file():
+        return None
+
+    data = json.loads(Path(path).read_text())
+    if data.get("version") != MANIFEST_VERSION:
+        return None
+
+    base = Path(path).resolve().parent
+    return {
+        name: str((base / file_path).resolve())
+        for name, file_path in data["components"].items()
+    }
+
+
+def register_manifest(path) -> bool:
+    """
+    Register the components of the manifest lazily, return False if the manifest
+    can not be read
+    """
+    manifest = read_manifest(path)
+    if manifest is None:
+        return False
+
+    for name, file_path in manifest.items():
+        component_registry.register_lazy(name, file_path)
+    return True
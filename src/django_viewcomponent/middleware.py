@@ -0,0 +1,36 @@
+from django_viewcomponent.dataloader import render_pass
+from django_viewcomponent.instrumentation import collect_request_stats
+
+
+class ComponentRenderStatsMiddleware:
+    """
+    Collect the render stats of components, per request and per process
+
+    The stats of the current request are available as `request.component_render_stats`,
+    the stats of the process as `django_viewcomponent.instrumentation.process_stats`
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with collect_request_stats() as stats:
+            request.component_render_stats = stats
+            return self.get_response(request)
+
+
+class RenderPassMiddleware:
+    """
+    Render all the components of the request in one render pass, the batch loaders
+    and the HTML of pure components are shared by the whole request
+
+    The render pass is available as `request.component_render_pass`
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with render_pass() as current:
+            request.component_render_pass = current
+            return self.get_response(request)
@@ -0,0 +1,145 @@
+"""
+Compile the component templates in the master process of a pre-fork server.
+
+With `preload_app = True`, gunicorn loads the application in the master process and
+forks the workers, the memory pages of the master are shared by the workers until
+they are written. `preload_components` compiles the templates of all the components
+in the master, and freezes the garbage collector, so the reference counting and the
+collections of the workers do not touch (and copy) the pages of the compiled templates.
+
+# gunicorn.conf.py
+preload_app = True
+
+
+def when_ready(server):
+    from django_viewcomponent.preload import preload_components
+
+    server.log.info(preload_components().format(workers=server.num_workers))
+
+
+def post_fork(server, worker):
+    from django_viewcomponent.preload import memory_usage
+
+    server.log.info("worker %s: %s", worker.pid, memory_usage().format())
+"""
+
+import gc
+import sys
+import time
+from typing import List, NamedTuple, Optional
+
+from django_viewcomponent.warmup import WarmupResult, warmup_components
+
+
+class MemoryUsage(NamedTuple):
+    """
+    Memory of the current process in bytes, `shared` and `private` are None
+    if the platform does not report them (only Linux does)
+    """
+
+    rss: int
+    shared: Optional[int] = None
+    private: Optional[int] = None
+
+    def format(self) -> str:
+        text = f"rss={self.rss / 1024 / 1024:.1f}MB"
+        if self.shared is not None and self.private is not None:
+            text += (
+                f" shared={self.shared / 1024 / 1024:.1f}MB"
+                f" private={self.private / 1024 / 1024:.1f}MB"
+            )
+        return text
+
+
+def memory_usage() -> MemoryUsage:
+    """
+    Return the memory usage of the current process, read from /proc on Linux
+    """
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            values = {}
+            for line in f:
+                key, _, value = line.partition(":")
+                if value.strip().endswith("kB"):
+                    values[key] = int(value.split()[0]) * 1024
+        return MemoryUsage(
+            rss=values["Rss"],
+            shared=values.get("Shared_Clean", 0) + values.get("Shared_Dirty", 0),
+            private=values.get("Private_Clean", 0) + values.get("Private_Dirty", 0),
+        )
+    except (OSError, KeyError, ValueError):
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        # Windows
+        return MemoryUsage(rss=0)
+
+    # the peak RSS, in kilobytes on Linux and bytes on macOS
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return MemoryUsage(rss=max_rss if sys.platform == "darwin" else max_rss * 1024)
+
+
+class PreloadReport(NamedTuple):
+    results: List[WarmupResult]
+    duration: float
+    # RSS of the master before and after the templates are compiled
+    rss_before: int
+    rss_after: int
+    frozen: bool
+
+    @property
+    def compiled(self) -> int:
+        return sum(1 for result in self.results if result.template and not result.error)
+
+    @property
+    def errors(self) -> List[WarmupResult]:
+        return [result for result in self.results if result.error is not None]
+
+    @property
+    def saved_per_worker(self) -> int:
+        """
+        Memory of the compiled templates, which each worker would allocate
+        if the templates were compiled lazily in the worker
+        """
+        return max(self.rss_after - self.rss_before, 0)
+
+    def format(self, workers: Optional[int] = None) -> str:
+        text = (
+            f"compiled {self.compiled} component templates in {self.duration * 1000:.1f}ms, "
+            f"{self.saved_per_worker / 1024:.0f}KB shared with each worker"
+        )
+        if workers:
+            text += f" ({self.saved_per_worker * workers / 1024:.0f}KB for {workers} workers)"
+        if self.errors:
+            text += f", {len(self.errors)} errors"
+        return text
+
+
+def preload_components(freeze: bool = True) -> PreloadReport:
+    """
+    Compile the templates of all the registered components, and freeze the objects
+    tracked by the garbage collector (`gc.freeze`), call it in the master process
+    before the workers are forked
+    """
+    rss_before = memory_usage().rss
+    start = time.perf_counter()
+    results = warmup_components()
+    duration = time.perf_counter() - start
+    rss_after = memory_usage().rss
+
+    frozen = False
+    if freeze:
+        # collect first, so the garbage is not frozen
+        gc.collect()
+        gc.freeze()
+        frozen = True
+
+    return PreloadReport(
+        results=results,
+        duration=duration,
+        rss_before=rss_before,
+        rss_after=rss_after,
+        frozen=frozen,
+    )
@@ -0,0 +1,332 @@
+"""
+Per-request profiler of the component render tree.
+
+The profiler listens to the render signals (see `django_viewcomponent.signals`),
+and builds a tree of the rendered components, with the self time and total time,
+the number of slot calls and template compiles of each component.
+"""
+
+import json
+import logging
+import random
+import threading
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+from django.template.loader import render_to_string
+
+from django_viewcomponent.signals import (
+    component_render_finished,
+    component_render_started,
+    slot_called,
+    template_compiled,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ProfileNode:
+    """
+    A rendered component in the render tree
+    """
+
+    def __init__(self, component, name, depth, parent=None):
+        self.component = component
+        self.name = name
+        self.depth = depth
+        self.parent = parent
+        self.children: List[ProfileNode] = []
+        self.total_time = 0.0
+        self.size = 0
+        self.slot_calls = 0
+        self.template_compiles = 0
+
+    @property
+    def component_class(self) -> str:
+        component_cls = type(self.component)
+        return f"{component_cls.__module__}.{component_cls.__qualname__}"
+
+    @property
+    def self_time(self) -> float:
+        return max(self.total_time - sum(c.total_time for c in self.children), 0.0)
+
+    @property
+    def template_cached(self) -> Optional[bool]:
+        """
+        Whether the template came from the template cache (inline template) or was
+        pinned on the class (`template_name`), None if the template is loaded by
+        `get_template` or another template engine
+        """
+        from django_viewcomponent.component import Component
+
+        component = self.component
+        if type(component).get_template is not Component.get_template or (
+            component.template_engine is not None
+            and component.get_template_string() is None
+        ):
+            return None
+        return self.template_compiles == 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "component_class": self.component_class,
+            "depth": self.depth,
+            "total_time": self.total_time,
+            "self_time": self.self_time,
+            "size": self.size,
+            "slot_calls": self.slot_calls,
+            "template_compiles": self.template_compiles,
+            "template_cached": self.template_cached,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+
+class Profile:
+    """
+    Component render tree of a request
+    """
+
+    def __init__(self):
+        self.roots: List[ProfileNode] = []
+        self._lock = threading.Lock()
+
+    def add(self, node: ProfileNode):
+        # children of the same parent can be rendered concurrently by the async API
+        with self._lock:
+            if node.parent is None:
+                self.roots.append(node)
+            else:
+                node.parent.children.append(node)
+
+    def walk(self):
+        stack = list(reversed(self.roots))
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Aggregate the nodes by component name, a big count of the same component
+        under one parent usually means an N+1 pattern
+        """
+        summary: Dict[str, Dict[str, Any]] = {}
+        for node in self.walk():
+            stats = summary.setdefault(
+                node.name,
+                {
+                    "count": 0,
+                    "total_time": 0.0,
+                    "self_time": 0.0,
+                    "slot_calls": 0,
+                    "template_compiles": 0,
+                    "max_siblings": 0,
+                },
+            )
+            stats["count"] += 1
+            stats["total_time"] += node.total_time
+            stats["self_time"] += node.self_time
+            stats["slot_calls"] += node.slot_calls
+            stats["template_compiles"] += node.template_compiles
+
+            siblings = node.parent.children if node.parent else self.roots
+            stats["max_siblings"] = max(
+                stats["max_siblings"],
+                sum(1 for sibling in siblings if sibling.name == node.name),
+            )
+        return summary
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "tree": [node.to_dict() for node in self.roots],
+            "summary": self.summary(),
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+
+
+_current_profile: ContextVar[Optional[Profile]] = ContextVar(
+    "viewcomponent_profile",
+    default=None,
+)
+_current_node: ContextVar[Optional[ProfileNode]] = ContextVar(
+    "viewcomponent_profile_node",
+    default=None,
+)
+
+
+def _on_render_started(sender, component, name, depth, **kwargs):
+    profile = _current_profile.get()
+    if profile is None:
+        return
+    node = ProfileNode(component, name, depth, parent=_current_node.get())
+    node._token = _current_node.set(node)
+    profile.add(node)
+
+
+def _on_render_finished(sender, component, duration, size, **kwargs):
+    if _current_profile.get() is None:
+        return
+    node = _current_node.get()
+    if node is None or node.component is not component:
+        return
+    node.total_time = duration
+    node.size = size
+    # the generator might be finalized in another context, whose node stack
+    # is not ours to change
+    with suppress(ValueError):
+        _current_node.reset(node._token)
+
+
+def _on_slot_called(sender, component, **kwargs):
+    node = _current_node.get()
+    if node is not None and _current_profile.get() is not None:
+        node.slot_calls += 1
+
+
+def _on_template_compiled(sender, **kwargs):
+    node = _current_node.get()
+    if node is not None and _current_profile.get() is not None:
+        node.template_compiles += 1
+
+
+class _Receivers:
+    """
+    Connect the receivers while at least one profile is active
+    """
+
+    receivers = (
+        (component_render_started, _on_render_started),
+        (component_render_finished, _on_render_finished),
+        (slot_called, _on_slot_called),
+        (template_compiled, _on_template_compiled),
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._active = 0
+
+    def activate(self):
+        with self._lock:
+            if self._active == 0:
+                for signal, receiver in self.receivers:
+                    signal.connect(
+                        receiver,
+                        dispatch_uid=f"{__name__}.{receiver.__name__}",
+                    )
+            self._active += 1
+
+    def deactivate(self):
+        with self._lock:
+            self._active -= 1
+            if self._active == 0:
+                for signal, receiver in self.receivers:
+                    signal.disconnect(dispatch_uid=f"{__name__}.{receiver.__name__}")
+
+
+_receivers = _Receivers()
+
+
+@contextmanager
+def profile_components():
+    """
+    Profile the components rendered in the block
+
+    with profile_components() as profile:
+        html = template.render(context)
+    print(profile.to_json())
+
+    The receivers are only connected while a block is active, so there is no overhead otherwise.
+    """
+    profile = Profile()
+    _receivers.activate()
+    profile_token = _current_profile.set(profile)
+    node_token = _current_node.set(None)
+    try:
+        yield profile
+    finally:
+        _current_node.reset(node_token)
+        _current_profile.reset(profile_token)
+        _receivers.deactivate()
+
+
+def render_panel(profile: Profile) -> str:
+    rows = [
+        {
+            "node": node,
+            "indent": node.depth * 16,
+            "total_ms": node.total_time * 1000,
+            "self_ms": node.self_time * 1000,
+        }
+        for node in profile.walk()
+    ]
+    summary = [
+        dict(
+            stats,
+            name=name,
+            total_ms=stats["total_time"] * 1000,
+            self_ms=stats["self_time"] * 1000,
+        )
+        for name, stats in profile.summary().items()
+    ]
+    summary.sort(key=lambda stats: stats["total_ms"], reverse=True)
+    return render_to_string(
+        "django_viewcomponent/profiler_panel.html",
+        {"rows": rows, "summary": summary},
+    )
+
+
+class ComponentProfilerMiddleware:
+    """
+    Profile the component render tree of the sampled requests
+
+    The profile is available as `request.component_profile`, dumped as JSON to the
+    `django_viewcomponent.profiler` logger, and injected as an HTML panel before `</body>`
+    when `profiler_show_panel` is enabled.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        from django_viewcomponent.app_settings import app_settings
+
+        sample_rate = app_settings.PROFILER_SAMPLE_RATE
+        if sample_rate <= 0 or random.random() >= sample_rate:
+            return self.get_response(request)
+
+        with profile_components() as profile:
+            request.component_profile = profile
+            response = self.get_response(request)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "component profile %s %s",
+                request.path,
+                profile.to_json(),
+            )
+
+        if app_settings.PROFILER_SHOW_PANEL:
+            self.inject_panel(response, profile)
+        return response
+
+    def inject_panel(self, response, profile):
+        content_type = response.get("Content-Type", "")
+        if (
+            getattr(response, "streaming", False)
+            or "html" not in content_type
+            or response.get("Content-Encoding", "")
+        ):
+            return
+
+        content = response.content.decode(response.charset)
+        index = content.lower().rfind("</body>")
+        if index == -1:
+            return
+
+        response.content = content[:index] + render_panel(profile) + content[index:]
+        if response.has_header("Content-Length"):
+            response["Content-Length"] = len(response.content)
@@ -0,0 +1,137 @@
+"""
+Helpers to render templates in chunks or asynchronously, instead of building
+the whole string in one pass.
+"""
+
+import asyncio
+from contextvars import ContextVar
+from copy import copy
+from typing import Iterator, List, Tuple
+
+from asgiref.sync import sync_to_async
+from django.template.base import Node, Template, TextNode
+from django.template.context import Context
+from django.utils.safestring import SafeString
+
+# indexes of the nodes being rendered, from the outermost nodelist, set by arender_nodelist
+_render_position: ContextVar[Tuple[int, ...]] = ContextVar(
+    "viewcomponent_render_position",
+    default=(),
+)
+
+
+def get_render_position() -> Tuple[int, ...]:
+    """
+    Return the position of the node being rendered in the document, nodes rendered
+    concurrently use it to keep the document order (for example, the items of
+    RendersManyField). It is always () in sync rendering.
+    """
+    return _render_position.get()
+
+
+def iter_nodelist(nodelist, context: Context) -> Iterator[str]:
+    """
+    Same as NodeList.render, but yield the output in chunks, the output of
+    nodes which support streaming ({% component %} tag) is yielded as it is rendered,
+    the output of other nodes between them is joined into one chunk.
+    """
+    bits: List[str] = []
+    for node in nodelist:
+        if hasattr(node, "render_iter"):
+            if bits:
+                yield "".join(bits)
+                bits = []
+            yield from node.render_iter(context)
+        else:
+            bits.append(str(node.render_annotated(context)))
+    if bits:
+        yield "".join(bits)
+
+
+def iter_template(template: Template, context: Context) -> Iterator[str]:
+    """
+    Same as Template.render, but yield the output in chunks
+    """
+    with context.render_context.push_state(template):
+        if context.template is None:
+            with context.bind_template(template):
+                context.template_name = template.name
+                yield from iter_nodelist(template.nodelist, context)
+        else:
+            yield from iter_nodelist(template.nodelist, context)
+
+
+def _render_nodes(nodes, context: Context) -> str:
+    return "".join([str(node.render_annotated(context)) for node in nodes])
+
+
+async def arender_nodelist(nodelist, context: Context) -> str:
+    """
+    Async version of NodeList.render
+
+    Nodes which can be rendered concurrently ({% component %} tag) are started as tasks,
+    each of them gets a copy of the context, so they can not see the changes of each other.
+
+    Other nodes are rendered in order, nodes which support async rendering ({% call %} tag)
+    are awaited, the rest are rendered in a thread, since they might access the database.
+    """
+    bits = []
+    tasks = []
+    sync_nodes: List[Tuple[int, Node]] = []
+    base_position = _render_position.get()
+
+    async def flush_sync_nodes():
+        if sync_nodes:
+            index, nodes = sync_nodes[0][0], [node for _, node in sync_nodes]
+            sync_nodes.clear()
+            token = _render_position.set(base_position + (index,))
+            try:
+                bits.append(await sync_to_async(_render_nodes)(nodes, context))
+            finally:
+                _render_position.reset(token)
+
+    try:
+        for index, node in enumerate(nodelist):
+            if isinstance(node, TextNode) and not sync_nodes:
+                bits.append(node.s)
+            elif getattr(node, "render_concurrently", False):
+                await flush_sync_nodes()
+                # the task copies the current context, with the position of the node
+                token = _render_position.set(base_position + (index,))
+                task = asyncio.ensure_future(node.arender(copy(context)))
+                _render_position.reset(token)
+                tasks.append((len(bits), task))
+                bits.append("")
+            elif hasattr(node, "arender"):
+                await flush_sync_nodes()
+                token = _render_position.set(base_position + (index,))
+                try:
+                    bits.append(await node.arender(context))
+                finally:
+                    _render_position.reset(token)
+            else:
+                sync_nodes.append((index, node))
+        await flush_sync_nodes()
+
+        results = await asyncio.gather(*[task for _, task in tasks])
+    except BaseException:
+        for _, task in tasks:
+            task.cancel()
+        raise
+
+    for (index, _), result in zip(tasks, results):
+        bits[index] = result
+    return SafeString("".join([str(bit) for bit in bits]))
+
+
+async def arender_template(template: Template, context: Context) -> str:
+    """
+    Async version of Template.render
+    """
+    with context.render_context.push_state(template):
+        if context.template is None:
+            with context.bind_template(template):
+                context.template_name = template.name
+                return await arender_nodelist(template.nodelist, context)
+        else:
+            return await arender_nodelist(template.nodelist, context)
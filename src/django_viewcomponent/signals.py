@@ -0,0 +1,19 @@
+from django.dispatch import Signal
+
+# Sent before a component is rendered.
+# Arguments: sender (component class), component, name, depth
+component_render_started = Signal()
+
+# Sent after a component is rendered.
+# Arguments: sender (component class), component, name, depth, duration (seconds), size
+component_render_finished = Signal()
+
+# Sent when a {% call %} tag fills a slot field of a component.
+# Arguments: sender (component class), component, field_name
+slot_called = Signal()
+
+# Sent when a component template is compiled, an inline template on a template cache
+# miss, a template file when it is pinned on the component class.
+# Arguments: sender (component class), template_name (None for inline templates),
+# template_string
+template_compiled = Signal()
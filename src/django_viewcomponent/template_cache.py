@@ -0,0 +1,98 @@
+"""
+Process-wide cache of compiled inline component templates.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+
+from django.template import engines
+from django.template.base import Template
+
+from django_viewcomponent.signals import template_compiled
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class TemplateCache:
+    """
+    LRU cache of compiled `Template` objects, keyed by component class and template source.
+
+    The entry keeps a reference to the component class which compiled it, if the class
+    is redefined (for example, the module is executed again after code change in DEBUG mode),
+    the entry is considered stale and the template is compiled again.
+    """
+
+    def __init__(self, maxsize=None):
+        self._maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self):
+        if self._maxsize is None:
+            from django_viewcomponent.app_settings import app_settings
+
+            return app_settings.TEMPLATE_CACHE_SIZE
+        return self._maxsize
+
+    def get(self, component_cls, template_string, engine=None) -> Template:
+        """
+        Return the compiled template, `engine` is the alias of the template backend
+        which compiles the template, None means the Django template language
+        """
+        key = (
+            component_cls.__module__,
+            component_cls.__qualname__,
+            engine,
+            template_string,
+        )
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] is component_cls:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        # compile outside the lock, two threads compiling the same template is harmless
+        if engine is None:
+            template = Template(template_string)
+        else:
+            template = engines[engine].from_string(template_string)
+        if template_compiled.receivers:
+            template_compiled.send(
+                sender=component_cls,
+                template_name=None,
+                template_string=template_string,
+            )
+
+        maxsize = self.maxsize
+        if maxsize:
+            with self._lock:
+                self._data[key] = (component_cls, template)
+                self._data.move_to_end(key)
+                while len(self._data) > maxsize:
+                    self._data.popitem(last=False)
+        return template
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# This variable represents the global template cache
+template_cache = TemplateCache()
@@ -1,4 +1,4 @@
-from typing import Type
+from typing import Optional, Tuple, Type
 
 import django.template
 from django.template import Context
@@ -8,7 +8,12 @@ from django.template.library import parse_bits
 
 from django_viewcomponent.component import Component
 from django_viewcomponent.component_registry import registry as component_registry
-from django_viewcomponent.fields import BaseSlotField
+from django_viewcomponent.signals import slot_called
+from django_viewcomponent.tree import (
+    create_component,
+    get_component_tree,
+    render_nodelist_two_phase,
+)
 
 register = django.template.Library()
 
@@ -38,20 +43,27 @@ def do_call(parser, token):
     )
 
     if len(tag_args) > 1:
-        # At least one position arg, so take the first as the component name
-        args = tag_args[1:]
+        # At least one position arg, so take the first as the component slot field
+        slot_token = tag_args[1].token
         kwargs = tag_kwargs
     else:
         raise TemplateSyntaxError(f"Syntax error in '{tag_name}' tag")
 
+    try:
+        component_token, field_token = slot_token.split(".")
+    except ValueError:
+        raise TemplateSyntaxError(
+            f"The '{tag_name}' tag expects '<component>.<slot field>', got '{slot_token}'",
+        )
+
     nodelist = parser.parse(parse_until=["endcall"])
     parser.delete_first_token()
 
     return CallNode(
-        parser=parser,
         nodelist=nodelist,
         target_var=target_var,
-        args=args,
+        component_fexp=FilterExpression(component_token, parser),
+        field_token=field_token,
         kwargs=kwargs,
     )
 
@@ -59,22 +71,44 @@ def do_call(parser, token):
 class CallNode(Node):
     def __init__(
         self,
-        parser,
         nodelist: NodeList,
         target_var,
-        args,
+        component_fexp: FilterExpression,
+        field_token,
         kwargs,
     ):
-        self.parser = parser
         self.nodelist: NodeList = nodelist
         self.target_var = target_var
-        self.args = args
+        self.component_fexp = component_fexp
+        self.field_token = field_token
         self.kwargs = kwargs
 
     def __repr__(self):
         raise NotImplementedError
 
     def render(self, context):
+        field, call_kwargs = self.prepare_call(context)
+        self.send_slot_called(field)
+        return field.handle_call(**call_kwargs) or ""
+
+    async def arender(self, context):
+        field, call_kwargs = self.prepare_call(context)
+        self.send_slot_called(field)
+        return await field.ahandle_call(**call_kwargs) or ""
+
+    def send_slot_called(self, field):
+        if slot_called.receivers:
+            component_instance = field.parent_component
+            slot_called.send(
+                sender=type(component_instance),
+                component=component_instance,
+                field_name=self.field_token,
+            )
+
+    def prepare_call(self, context):
+        """
+        Find the slot field state of the component and build kwargs for handle_call
+        """
         resolved_kwargs = {
             key: safe_resolve(kwarg, context) for key, kwarg in self.kwargs.items()
         }
@@ -88,39 +122,28 @@ class CallNode(Node):
         resolved_kwargs["context"] = context
         resolved_kwargs["target_var"] = self.target_var
 
-        component_token, field_token = self.args[0].token.split(".")
-        component_instance = FilterExpression(component_token, self.parser).resolve(
-            context,
-        )
+        component_instance = self.component_fexp.resolve(context)
         if not component_instance:
-            raise ValueError(f"Component {component_token} not found in context")
-
-        available_slot_fields_map = {}
-        # iterate all attributes of the component instance and add the BaseSlotField to the list
-        for field_name in dir(component_instance):
-            field = getattr(component_instance, field_name)
-            if isinstance(field, BaseSlotField):
-                types = field.types
-                if types:
-                    for polymorphic_type in types:
-                        available_slot_fields_map[
-                            f"{field_name}_{polymorphic_type}"
-                        ] = [field, polymorphic_type]
-                else:
-                    available_slot_fields_map[field_name] = [field, None]
-
-        if field_token not in available_slot_fields_map:
             raise ValueError(
-                f"Field {field_token} not found in component {component_token}",
+                f"Component {self.component_fexp.token} not found in context",
             )
 
-        field, polymorphic_type = available_slot_fields_map[field_token]
+        slot_dispatch = getattr(component_instance, "_slot_dispatch", {})
+        if self.field_token not in slot_dispatch:
+            raise ValueError(
+                f"Field {self.field_token} not found in component {self.component_fexp.token}",
+            )
+
+        field_name, polymorphic_type = slot_dispatch[self.field_token]
         resolved_kwargs["polymorphic_type"] = polymorphic_type
 
-        return field.handle_call(**resolved_kwargs) or ""
+        return getattr(component_instance, field_name), resolved_kwargs
 
 
 class ComponentNode(Node):
+    # sibling component nodes are rendered concurrently in async rendering
+    render_concurrently = True
+
     def __init__(
         self,
         name_fexp: FilterExpression,
@@ -128,12 +151,17 @@ class ComponentNode(Node):
         context_kwargs,
         nodelist: NodeList,
         target_var=None,
+        literal_name=None,
     ):
         self.name_fexp = name_fexp
         self.context_args = context_args or []
         self.context_kwargs = context_kwargs or {}
         self.nodelist = nodelist
         self.target_var = target_var
+        # the component name if it is a quoted string, the class is looked up once
+        # and cached with the version of the registry
+        self.literal_name = literal_name
+        self._component_class: Tuple[Optional[Type[Component]], int] = (None, -1)
 
     def __repr__(self):
         return "<ComponentNode: %s. Contents: %r>" % (
@@ -146,10 +174,65 @@ class ComponentNode(Node):
         )
 
     def render(self, context: Context):
-        resolved_component_name = self.name_fexp.resolve(context)
+        from django_viewcomponent.app_settings import app_settings
+
+        if app_settings.TWO_PHASE_RENDER and get_component_tree() is None:
+            # collect the components of this node first, see django_viewcomponent.tree
+            return render_nodelist_two_phase(NodeList([self]), context)
 
-        # get component class
-        component_cls: Type[Component] = component_registry.get(resolved_component_name)
+        component_cls, args, kwargs = self.resolve_component(context)
+
+        def render():
+            component = create_component(component_cls, args, kwargs)
+            return component.render_from_nodelist(
+                self.nodelist,
+                context,
+                self.target_var,
+            )
+
+        if component_cls.pure:
+            # the HTML is reused if the same component was rendered in the render pass
+            return component_cls.render_memoized(args, kwargs, self.nodelist, render)
+        return render()
+
+    def render_iter(self, context: Context):
+        component = self.create_component(context)
+        yield from component.render_iter_from_nodelist(
+            self.nodelist,
+            context,
+            self.target_var,
+        )
+
+    async def arender(self, context: Context):
+        component = self.create_component(context)
+        return await component.arender_from_nodelist(
+            self.nodelist,
+            context,
+            self.target_var,
+        )
+
+    def create_component(self, context: Context) -> Component:
+        # create component, or take the component created in phase one of two-phase rendering
+        return create_component(*self.resolve_component(context))
+
+    def get_component_class(self, context: Context) -> Type[Component]:
+        if self.literal_name is None:
+            return component_registry.get(self.name_fexp.resolve(context))
+
+        cached_cls, cached_version = self._component_class
+        if cached_cls is not None and cached_version == component_registry.version:
+            return cached_cls
+
+        version = component_registry.version
+        component_cls = component_registry.get(self.literal_name)
+        self._component_class = (component_cls, version)
+        return component_cls
+
+    def resolve_component(self, context: Context):
+        """
+        Return the component class, and the resolved args and kwargs
+        """
+        component_cls = self.get_component_class(context)
 
         # Resolve FilterExpressions and Variables that were passed as args to the
         # component, then call component's context method
@@ -162,28 +245,7 @@ class ComponentNode(Node):
             for key, kwarg in self.context_kwargs.items()
         }
 
-        # create component
-        component: Component = component_cls(
-            *resolved_component_args,
-            **resolved_component_kwargs,
-        )
-        component.component_target_var = self.target_var
-        component.component_context = context
-
-        # https://docs.djangoproject.com/en/5.1/ref/templates/api/#django.template.Context.push
-        with component.component_context.push():
-            # developer can add extra context data in this method
-            updated_context = component.get_context_data()
-
-            # create slot fields
-            component.create_slot_fields()
-
-            # render children nodelist
-            component.content = self.nodelist.render(updated_context)
-
-            component.check_slot_fields()
-
-            return component.render(updated_context)
+        return component_cls, resolved_component_args, resolved_component_kwargs
 
 
 @register.tag(name="component")
@@ -217,17 +279,72 @@ def do_component(parser, token):
     nodelist: NodeList = parser.parse(parse_until=["endcomponent"])
     parser.delete_first_token()
 
+    name_fexp = FilterExpression(component_name, parser)
     component_node = ComponentNode(
-        name_fexp=FilterExpression(component_name, parser),
+        name_fexp=name_fexp,
         context_args=context_args,
         context_kwargs=context_kwargs,
         nodelist=nodelist,
         target_var=target_var,
+        literal_name=get_literal(name_fexp),
     )
 
     return component_node
 
 
+class ComponentCollectionNode(Node):
+    def __init__(
+        self,
+        name_fexp: FilterExpression,
+        items_fexp: FilterExpression,
+        context_kwargs,
+    ):
+        self.name_fexp = name_fexp
+        self.items_fexp = items_fexp
+        self.context_kwargs = context_kwargs
+
+    def __repr__(self):
+        return "<ComponentCollectionNode: %s>" % self.name_fexp
+
+    def render(self, context: Context):
+        component_cls: Type[Component] = component_registry.get(
+            self.name_fexp.resolve(context),
+        )
+        items = self.items_fexp.resolve(context) or []
+        resolved_kwargs = {
+            key: safe_resolve(kwarg, context)
+            for key, kwarg in self.context_kwargs.items()
+        }
+        return component_cls.render_collection(items, context, **resolved_kwargs)
+
+
+@register.tag(name="component_collection")
+def do_component_collection(parser, token):
+    """
+    Render the component for each item of the collection:
+        {% component_collection "name" items keyword_arg=value ... %}
+
+    The item is passed to the component as `as_var`, which can be changed:
+        {% component_collection "name" items as_var="row" %}
+    """
+    bits = token.split_contents()
+    component_name, context_args, context_kwargs = parse_component_with_arguments(
+        parser,
+        bits,
+        "component_collection",
+    )
+    if len(context_args) != 1:
+        raise TemplateSyntaxError(
+            "Call the 'component_collection' tag with a component name and the collection",
+        )
+
+    return ComponentCollectionNode(
+        name_fexp=FilterExpression(component_name, parser),
+        items_fexp=context_args[0],
+        context_kwargs=context_kwargs,
+    )
+
+
 def parse_component_with_arguments(parser, bits, tag_name):
     tag_args, tag_kwargs = parse_bits(
         parser=parser,
@@ -259,6 +376,15 @@ def parse_component_with_arguments(parser, bits, tag_name):
     return component_name, context_args, context_kwargs
 
 
+def get_literal(fexp: FilterExpression):
+    """
+    Return the value of a quoted string without filters, None for the other expressions
+    """
+    if not fexp.filters and isinstance(fexp.var, str):
+        return str(fexp.var)
+    return None
+
+
 def safe_resolve(context_item, context):
     """Resolve FilterExpressions and Variables in context if possible.  Return other items unchanged."""
 
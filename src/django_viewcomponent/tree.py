@@ -0,0 +1,463 @@
+"""
+Two-phase rendering: collect the component tree, then render.
+
+Phase one walks the nodelist of the template, creates the components of the
+`{% component %}` tags and of the slot fields with the resolved arguments, and calls
+their `prefetch` hook. Phase two renders the template as usual, the `{% component %}`
+tags and the slot fields take the components created in phase one, so the data
+registered by all the components is loaded together (see `django_viewcomponent.dataloader`).
+
+In phase one, the template variables are resolved with the context of the template,
+plus `self` (and the `as` variable) in the content and the template of a component.
+Variables added by `get_context_data` are not available, the components which
+depend on them are created in phase two.
+"""
+
+import json
+from collections import defaultdict
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
+from decimal import Decimal
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple, Type, Union
+
+from django.template.base import NodeList, VariableDoesNotExist
+from django.template.context import Context
+from django.template.defaulttags import ForNode, IfNode, WithNode
+from django.utils.safestring import SafeString
+
+from django_viewcomponent.component_registry import registry as component_registry
+from django_viewcomponent.dataloader import render_pass
+
+# arguments of these types are compared by value when the components of phase one
+# are matched in phase two, other arguments must be the same object
+_VALUE_TYPES = (str, SafeString, int, float, bool, Decimal, type(None))
+
+
+def _same_value(a, b) -> bool:
+    return a is b or (type(a) is type(b) and type(a) in _VALUE_TYPES and a == b)
+
+
+def _same_arguments(node: "TreeNode", args, kwargs) -> bool:
+    return (
+        len(node.args) == len(args)
+        and node.kwargs.keys() == kwargs.keys()
+        and all(_same_value(a, b) for a, b in zip(node.args, args))
+        and all(_same_value(node.kwargs[key], kwargs[key]) for key in kwargs)
+    )
+
+
+class SlotCall:
+    """
+    A `{% call %}` tag of a component, `node` is the component of the slot
+    if the slot field renders a component
+    """
+
+    def __init__(self, field_name: str, kwargs: Dict[str, Any], node=None):
+        self.field_name = field_name
+        self.kwargs = kwargs
+        self.node: Optional[TreeNode] = node
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "field_name": self.field_name,
+            "kwargs": {key: repr(value) for key, value in self.kwargs.items()},
+            "component": self.node.name if self.node else None,
+        }
+
+
+class TreeNode:
+    """
+    A component created in phase one
+    """
+
+    def __init__(self, component, args, kwargs, parent=None, slot=None):
+        self.component = component
+        self.args: Tuple[Any, ...] = tuple(args)
+        self.kwargs: Dict[str, Any] = kwargs
+        self.parent: Optional[TreeNode] = parent
+        # name of the slot field if the component is rendered by a slot field
+        self.slot: Optional[str] = slot
+        self.children: List[TreeNode] = []
+        self.slot_calls: List[SlotCall] = []
+
+    @property
+    def component_class(self):
+        return type(self.component)
+
+    @property
+    def name(self) -> str:
+        return component_registry.get_name(self.component_class) or (
+            self.component_class.__qualname__
+        )
+
+    @property
+    def depth(self) -> int:
+        depth, parent = 0, self.parent
+        while parent is not None:
+            depth, parent = depth + 1, parent.parent
+        return depth
+
+    @property
+    def signature(self) -> Optional[Hashable]:
+        """
+        Class and arguments of the component, None if the arguments are not hashable
+        """
+        try:
+            signature = (
+                self.component_class,
+                self.args,
+                tuple(sorted(self.kwargs.items())),
+            )
+            hash(signature)
+        except TypeError:
+            return None
+        return signature
+
+    def walk(self) -> Iterator["TreeNode"]:
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    def to_dict(self) -> Dict[str, Any]:
+        component_cls = self.component_class
+        return {
+            "name": self.name,
+            "component_class": f"{component_cls.__module__}.{component_cls.__qualname__}",
+            "args": [repr(arg) for arg in self.args],
+            "kwargs": {key: repr(value) for key, value in self.kwargs.items()},
+            "slot": self.slot,
+            "slot_calls": [call.to_dict() for call in self.slot_calls],
+            "children": [child.to_dict() for child in self.children],
+        }
+
+
+class ComponentTree:
+    """
+    Components collected in phase one, the components which are not rendered yet
+    are taken by `take` in phase two
+    """
+
+    def __init__(self):
+        self.roots: List[TreeNode] = []
+        self._pending: Dict[type, List[TreeNode]] = defaultdict(list)
+
+    def add(self, node: TreeNode):
+        if node.parent is None:
+            self.roots.append(node)
+        else:
+            node.parent.children.append(node)
+        self._pending[node.component_class].append(node)
+
+    def take(self, component_cls, args, kwargs):
+        """
+        Return the component created in phase one with the same class and arguments,
+        None if there is no such component
+        """
+        pending = self._pending.get(component_cls)
+        if not pending:
+            return None
+        for index, node in enumerate(pending):
+            if _same_arguments(node, args, kwargs):
+                del pending[index]
+                return node.component
+        return None
+
+    def walk(self) -> Iterator[TreeNode]:
+        for root in self.roots:
+            yield from root.walk()
+
+    def find(self, component: Union[str, Type[Any]]) -> List[TreeNode]:
+        """
+        Return the nodes of the component, by registered name or class
+        """
+        if isinstance(component, str):
+            return [node for node in self.walk() if node.name == component]
+        return [node for node in self.walk() if node.component_class is component]
+
+    def count(self) -> Dict[str, int]:
+        counts: Dict[str, int] = defaultdict(int)
+        for node in self.walk():
+            counts[node.name] += 1
+        return dict(counts)
+
+    def duplicates(self) -> List[List[TreeNode]]:
+        """
+        Groups of the components created more than once with the same arguments
+        """
+        groups: Dict[Hashable, List[TreeNode]] = defaultdict(list)
+        for node in self.walk():
+            signature = node.signature
+            if signature is not None:
+                groups[signature].append(node)
+        return [nodes for nodes in groups.values() if len(nodes) > 1]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "tree": [node.to_dict() for node in self.roots],
+            "count": self.count(),
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+
+
+class TreeBuilder:
+    """
+    Walk the nodelist and collect the components into the tree (phase one)
+    """
+
+    def __init__(self, tree: ComponentTree):
+        from django_viewcomponent.templatetags.viewcomponent_tags import (
+            CallNode,
+            ComponentNode,
+        )
+
+        self.tree = tree
+        self.component_node_type = ComponentNode
+        self.call_node_type = CallNode
+
+    def visit_nodelist(self, nodelist, context: Context, parent=None):
+        for node in nodelist or ():
+            self.visit(node, context, parent)
+
+    def visit(self, node, context: Context, parent=None):
+        try:
+            self.visit_node(node, context, parent)
+        except Exception:
+            # for example a filter or a method in the template raised, the subtree
+            # of the node is skipped, the error is raised when it is rendered in phase two
+            return
+
+    def visit_node(self, node, context: Context, parent=None):
+        node_type = type(node)
+        if isinstance(node, self.component_node_type):
+            self.visit_component_node(node, context, parent)
+        elif isinstance(node, self.call_node_type):
+            self.visit_call_node(node, context, parent)
+        elif node_type is IfNode:
+            self.visit_if_node(node, context, parent)
+        elif node_type is ForNode:
+            self.visit_for_node(node, context, parent)
+        elif node_type is WithNode:
+            values = {
+                key: value.resolve(context) for key, value in node.extra_context.items()
+            }
+            with context.push(**values):
+                self.visit_nodelist(node.nodelist, context, parent)
+        else:
+            # for example {% block %}, the nested nodes are visited with the same context
+            for attr in node.child_nodelists:
+                self.visit_nodelist(getattr(node, attr, None), context, parent)
+
+    def visit_component_node(self, node, context, parent):
+        from django_viewcomponent.templatetags.viewcomponent_tags import safe_resolve
+
+        try:
+            component_cls = node.get_component_class(context)
+            args = [safe_resolve(arg, context) for arg in node.context_args]
+            kwargs = {
+                key: safe_resolve(kwarg, context)
+                for key, kwarg in node.context_kwargs.items()
+            }
+            component = component_cls(*args, **kwargs)
+        except Exception:
+            # the component is created (and the error is raised) in phase two
+            return
+        tree_node = TreeNode(component, args, kwargs, parent=parent)
+        self.add(tree_node, node.nodelist, context, node.target_var)
+
+    def visit_call_node(self, node, context, parent):
+        from django_viewcomponent.component import Component
+        from django_viewcomponent.templatetags.viewcomponent_tags import safe_resolve
+
+        component = node.component_fexp.resolve(context)
+        slot_dispatch = getattr(component, "_slot_dispatch", {})
+        if parent is None or node.field_token not in slot_dispatch:
+            self.visit_nodelist(node.nodelist, context, parent)
+            return
+
+        field_name, polymorphic_type = slot_dispatch[node.field_token]
+        field = type(component)._slot_fields[field_name]
+        target = field.types[polymorphic_type] if field.types else field._component
+        try:
+            kwargs = {
+                key: safe_resolve(kwarg, context) for key, kwarg in node.kwargs.items()
+            }
+            if isinstance(target, str):
+                target = component_registry.get(target)
+        except Exception:
+            return
+
+        slot_call = SlotCall(node.field_token, kwargs)
+        parent.slot_calls.append(slot_call)
+
+        if not (isinstance(target, type) and issubclass(target, Component)):
+            # the nodelist is rendered in the context of the parent component
+            self.visit_nodelist(node.nodelist, context, parent)
+            return
+
+        try:
+            slot_component = target(**kwargs)
+        except Exception:
+            return
+        slot_call.node = TreeNode(
+            slot_component,
+            (),
+            kwargs,
+            parent=parent,
+            slot=node.field_token,
+        )
+        self.add(slot_call.node, node.nodelist, context, node.target_var)
+
+    def add(self, tree_node: TreeNode, nodelist, context, target_var):
+        """
+        Add the component to the tree, and visit its content and template
+        """
+        self.tree.add(tree_node)
+        component = tree_node.component
+        component._ensure_prefetched()
+
+        values = {"self": component}
+        if target_var:
+            values[target_var] = component
+        with context.push(values):
+            self.visit_nodelist(nodelist, context, tree_node)
+            if component.template_engine is None:
+                try:
+                    template = component.get_template()
+                except Exception:
+                    return
+                self.visit_nodelist(template.nodelist, context, tree_node)
+
+    def visit_if_node(self, node, context, parent):
+        for condition, nodelist in node.conditions_nodelists:
+            if condition is not None:
+                try:
+                    match = condition.eval(context)
+                except VariableDoesNotExist:
+                    match = None
+            else:
+                match = True
+            if match:
+                self.visit_nodelist(nodelist, context, parent)
+                return
+
+    def visit_for_node(self, node, context, parent):
+        values = node.sequence.resolve(context, ignore_failures=True)
+        if values is None:
+            values = []
+        if not hasattr(values, "__len__"):
+            # the sequence (a generator) can only be iterated once, by phase two
+            return
+        if not values:
+            self.visit_nodelist(node.nodelist_empty, context, parent)
+            return
+        length = len(values)
+        if node.is_reversed:
+            values = reversed(values)
+
+        parentloop = context.get("forloop", {})
+        with context.push():
+            loop_dict = context["forloop"] = {"parentloop": parentloop}
+            for index, item in enumerate(values):
+                loop_dict.update(
+                    counter0=index,
+                    counter=index + 1,
+                    revcounter=length - index,
+                    revcounter0=length - index - 1,
+                    first=index == 0,
+                    last=index == length - 1,
+                )
+                if len(node.loopvars) > 1:
+                    try:
+                        if len(item) != len(node.loopvars):
+                            continue
+                    except TypeError:
+                        continue
+                    unpacked = dict(zip(node.loopvars, item))
+                else:
+                    unpacked = {node.loopvars[0]: item}
+                with context.push(unpacked):
+                    self.visit_nodelist(node.nodelist_loop, context, parent)
+
+
+def build_tree(nodelist, context: Context) -> ComponentTree:
+    """
+    Collect the components of the nodelist (phase one), the context must be bound to a template
+    """
+    tree = ComponentTree()
+    TreeBuilder(tree).visit_nodelist(nodelist, context)
+    return tree
+
+
+_current_tree: ContextVar[Optional[ComponentTree]] = ContextVar(
+    "viewcomponent_component_tree",
+    default=None,
+)
+
+
+def get_component_tree() -> Optional[ComponentTree]:
+    return _current_tree.get()
+
+
+@contextmanager
+def use_tree(tree: ComponentTree):
+    """
+    Render with the components of the tree (phase two)
+    """
+    token = _current_tree.set(tree)
+    try:
+        yield tree
+    finally:
+        # the generator might be finalized in another context, which can have its
+        # own tree, drop the token without touching the variable
+        with suppress(ValueError):
+            _current_tree.reset(token)
+
+
+def create_component(component_cls, args=(), kwargs=None):
+    """
+    Take the component from the tree in phase two, or create it
+    """
+    kwargs = kwargs or {}
+    tree = _current_tree.get()
+    if tree is not None:
+        component = tree.take(component_cls, args, kwargs)
+        if component is not None:
+            return component
+    return component_cls(*args, **kwargs)
+
+
+def render_nodelist_two_phase(nodelist: NodeList, context: Context) -> str:
+    """
+    Render the nodelist in two phases, the context must be bound to a template
+    """
+    with render_pass():
+        tree = build_tree(nodelist, context)
+        with use_tree(tree):
+            return nodelist.render(context)
+
+
+def render_two_phase(template, context: Union[Dict[str, Any], Context, None] = None):
+    """
+    Render the template in two phases, `template` is a Django template
+    (django.template.Template or the template returned by `get_template`)
+
+    render_two_phase(get_template("users.html"), {"users": users})
+    """
+    template = getattr(template, "template", template)
+    if not isinstance(context, Context):
+        context = Context(context or {})
+
+    with render_pass():
+        if context.template is None:
+            with context.render_context.push_state(template), context.bind_template(
+                template,
+            ):
+                tree = build_tree(template.nodelist, context)
+        else:
+            tree = build_tree(template.nodelist, context)
+        with use_tree(tree):
+            return template.render(context)
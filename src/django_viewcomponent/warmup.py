@@ -0,0 +1,107 @@
+"""
+Compile the templates of the registered components before the first request.
+
+The first render of a component parses its template, after a deploy, every worker
+pays the cost on the first requests. `warmup_components` resolves and compiles the
+templates of all the components, which fills the template cache, the templates pinned
+on the component classes and the caches of the template loaders.
+"""
+
+import logging
+import time
+from typing import List, NamedTuple, Optional
+
+from django_viewcomponent.compiler import get_compiled_render
+from django_viewcomponent.component_registry import registry as component_registry
+from django_viewcomponent.template_cache import template_cache
+
+logger = logging.getLogger(__name__)
+
+
+class WarmupResult(NamedTuple):
+    name: str
+    component_cls: type
+    # template_name, "<inline>", or None if the template can not be resolved without an instance
+    template: Optional[str]
+    duration: float
+    error: Optional[BaseException] = None
+
+    @property
+    def skipped(self) -> bool:
+        return self.template is None and self.error is None
+
+
+def warmup_component(component_cls) -> Optional[str]:
+    """
+    Compile the template of the component class, and return the template name
+    (or "<inline>"). Return None if the template depends on the instance.
+    """
+    if not component_cls._has_static_template():
+        return None
+
+    if component_cls.template is not None:
+        template = template_cache.get(
+            component_cls,
+            component_cls.template,
+            engine=component_cls.template_engine,
+        )
+        label = "<inline>"
+    elif component_cls.template_name is not None:
+        if component_cls.template_engine is not None:
+            from django.template.loader import get_template
+
+            template = get_template(
+                component_cls.template_name,
+                using=component_cls.template_engine,
+            )
+        else:
+            template = component_cls._get_pinned_template(component_cls.template_name)
+        label = component_cls.template_name
+    else:
+        return None
+
+    if component_cls.compile_template and component_cls.template_engine is None:
+        get_compiled_render(template)
+    return label
+
+
+def warmup_components() -> List[WarmupResult]:
+    """
+    Compile the templates of all the registered components, the lazy components
+    of the manifest are imported
+    """
+    results = []
+    for name, component_cls in list(component_registry.all().items()):
+        start = time.perf_counter()
+        try:
+            template = warmup_component(component_cls)
+        except Exception as e:
+            results.append(
+                WarmupResult(name, component_cls, None, time.perf_counter() - start, e),
+            )
+        else:
+            results.append(
+                WarmupResult(
+                    name,
+                    component_cls,
+                    template,
+                    time.perf_counter() - start,
+                ),
+            )
+    return results
+
+
+def log_results(results: List[WarmupResult]):
+    compiled = [result for result in results if result.template and not result.error]
+    logger.info(
+        "compiled %d component templates in %.1fms",
+        len(compiled),
+        sum(result.duration for result in results) * 1000,
+    )
+    for result in results:
+        if result.error is not None:
+            logger.warning(
+                "failed to compile the template of component %s: %r",
+                result.name,
+                result.error,
+            )
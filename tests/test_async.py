@@ -0,0 +1,194 @@
+import asyncio
+
+import pytest
+from django.template import Context, Template
+
+from django_viewcomponent import component
+from django_viewcomponent.fields import RendersManyField, RendersOneField
+from django_viewcomponent.rendering import arender_template
+from tests.utils import assert_dom_equal
+
+
+class UserCardComponent(component.Component):
+    running = 0
+    max_running = 0
+
+    template = "<div>{{ self.name }} {{ score }}</div>"
+
+    def __init__(self, name, **kwargs):
+        self.name = name
+
+    async def aget_context_data(self, **kwargs):
+        context = await super().aget_context_data(**kwargs)
+
+        cls = UserCardComponent
+        cls.running += 1
+        cls.max_running = max(cls.max_running, cls.running)
+        await asyncio.sleep(0.01)
+        cls.running -= 1
+
+        context["score"] = len(self.name)
+        return context
+
+
+class TitleComponent(component.Component):
+    template = "<h1>{{ title }}</h1>"
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["title"] = "Users"
+        return context
+
+
+class BlogComponent(component.Component):
+    header = RendersOneField(required=True)
+    posts = RendersManyField(component="user_card")
+
+    template = """
+    <header>{{ self.header.value }}</header>
+    {% for post in self.posts.value %}{{ post }}{% endfor %}
+    """
+
+
+class TestAsyncRender:
+    @pytest.fixture(autouse=True)
+    def register_component(self):
+        component.registry.register("user_card", UserCardComponent)
+        component.registry.register("title", TitleComponent)
+        component.registry.register("blog", BlogComponent)
+        UserCardComponent.running = 0
+        UserCardComponent.max_running = 0
+
+    def test_sibling_components_load_data_concurrently(self):
+        class PageComponent(component.Component):
+            template = """
+            {% load viewcomponent_tags %}
+            {% component "title" %}{% endcomponent %}
+            {% component "user_card" name="foo" %}{% endcomponent %}
+            {% component "user_card" name="foobar" %}{% endcomponent %}
+            """
+
+        rendered = asyncio.run(PageComponent().arender_from_parent_context())
+
+        assert_dom_equal(
+            "<h1>Users</h1><div>foo 3</div><div>foobar 6</div>",
+            rendered,
+        )
+        assert UserCardComponent.max_running == 2
+
+    def test_slot_fields(self):
+        template = Template(
+            """
+            {% load viewcomponent_tags %}
+            {% component "blog" as blog %}
+                {% call blog.header %}{{ title }}{% endcall %}
+                {% for name in names %}
+                    {% call blog.posts name=name %}{% endcall %}
+                {% endfor %}
+            {% endcomponent %}
+            """,
+        )
+
+        class PageComponent(component.Component):
+            def get_template(self):
+                return template
+
+        context = {"title": "Blog", "names": ["foo", "foobar"]}
+        expected = "<header>Blog</header><div>foo 3</div><div>foobar 6</div>"
+        assert_dom_equal(
+            expected,
+            asyncio.run(PageComponent().arender_from_parent_context(context)),
+        )
+
+    def test_call_tags_in_order(self):
+        class PageComponent(component.Component):
+            template = """
+            {% load viewcomponent_tags %}
+            {% component "blog" as blog %}
+                {% call blog.header %}Blog{% endcall %}
+                {% call blog.posts name="foo" %}{% endcall %}
+                {% call blog.posts name="foobar" %}{% endcall %}
+                {% call blog.posts name="baz" %}{% endcall %}
+            {% endcomponent %}
+            """
+
+        assert_dom_equal(
+            "<header>Blog</header><div>foo 3</div><div>foobar 6</div><div>baz 3</div>",
+            asyncio.run(PageComponent().arender_from_parent_context()),
+        )
+
+    def test_call_tags_in_concurrent_siblings_in_order(self):
+        class LayoutComponent(component.Component):
+            items = RendersManyField()
+
+            template = "{% for item in self.items.value %}{{ item }}{% endfor %}|{{ self.content }}"
+
+        class CardComponent(component.Component):
+            template = "[{{ self.content|striptags|cut:' ' }}]"
+
+            def __init__(self, delay, **kwargs):
+                self.delay = delay
+
+            async def aget_context_data(self, **kwargs):
+                context = await super().aget_context_data(**kwargs)
+                await asyncio.sleep(self.delay)
+                return context
+
+        component.registry.register("layout", LayoutComponent)
+        component.registry.register("card", CardComponent)
+        template = Template(
+            "{% load viewcomponent_tags %}"
+            '{% component "layout" as layout %}'
+            '{% component "card" delay=0.02 %}{% call layout.items %}A{% endcall %}{% endcomponent %}'
+            '{% component "card" delay=0 %}{% call layout.items %}B{% endcall %}{% endcomponent %}'
+            "{% endcomponent %}",
+        )
+
+        assert template.render(Context()) == "AB|[][]"
+        assert asyncio.run(arender_template(template, Context())) == "AB|[][]"
+
+    def test_sync_api_unchanged(self):
+        template = Template(
+            """
+            {% load viewcomponent_tags %}
+            {% component "title" %}{% endcomponent %}
+            """,
+        )
+        assert_dom_equal("<h1>Users</h1>", template.render(Context()))
+
+    def test_concurrent_components_do_not_share_context(self):
+        class PushComponent(component.Component):
+            template = "<span>{{ value }}</span>"
+
+            def __init__(self, value, **kwargs):
+                self.value = value
+
+            async def aget_context_data(self, **kwargs):
+                context = await super().aget_context_data(**kwargs)
+                context["value"] = self.value
+                await asyncio.sleep(0.01)
+                return context
+
+        component.registry.register("push", PushComponent)
+
+        class PageComponent(component.Component):
+            template = """
+            {% load viewcomponent_tags %}
+            {% component "push" value=1 %}{% endcomponent %}
+            {% component "push" value=2 %}{% endcomponent %}
+            <p>{{ value }}</p>
+            """
+
+        assert_dom_equal(
+            "<span>1</span><span>2</span><p></p>",
+            asyncio.run(PageComponent().arender_from_parent_context()),
+        )
+
+    def test_async_only_component_in_sync_render(self):
+        template = Template(
+            """
+            {% load viewcomponent_tags %}
+            {% component "user_card" name="foo" %}{% endcomponent %}
+            """,
+        )
+        assert_dom_equal("<div>foo 3</div>", template.render(Context()))
@@ -0,0 +1,70 @@
+import pytest
+from django.core.cache import cache
+from django.template import Context, Template
+
+from django_viewcomponent import component
+
+
+class CardComponent(component.Component):
+    rendered = 0
+    cache_vary_on = ("request_user",)
+
+    template = "<div>{{ self.title }} {{ request_user }} {{ self.content }}</div>"
+
+    def __init__(self, title, cached=True, **kwargs):
+        self.title = title
+        self.cached = cached
+
+    def cache_key(self):
+        if self.cached:
+            return f"card-{self.title}"
+        return None
+
+    def get_context_data(self, **kwargs):
+        CardComponent.rendered += 1
+        return super().get_context_data(**kwargs)
+
+
+class TestFragmentCache:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        component.registry.register("card", CardComponent)
+        CardComponent.rendered = 0
+        cache.clear()
+
+    def render(self, title, cached=True, **context):
+        template = Template(
+            """
+            {% load viewcomponent_tags %}
+            {% component "card" title=title cached=cached %}{{ content }}{% endcomponent %}
+            """,
+        )
+        return template.render(
+            Context({"title": title, "cached": cached, **context}),
+        ).strip()
+
+    def test_cached_html_is_served(self):
+        assert self.render("a", content="first") == "<div>a  first</div>"
+        assert self.render("a", content="second") == "<div>a  first</div>"
+        assert CardComponent.rendered == 1
+
+        assert self.render("b", content="second") == "<div>b  second</div>"
+        assert CardComponent.rendered == 2
+
+    def test_vary_on(self):
+        assert self.render("a", request_user="foo") == "<div>a foo </div>"
+        assert self.render("a", request_user="bar") == "<div>a bar </div>"
+        assert self.render("a", request_user="foo") == "<div>a foo </div>"
+        assert CardComponent.rendered == 2
+
+    def test_cache_disabled(self):
+        assert self.render("a", cached=False, content="first") == "<div>a  first</div>"
+        assert (
+            self.render("a", cached=False, content="second") == "<div>a  second</div>"
+        )
+        assert CardComponent.rendered == 2
+
+    def test_render_from_parent_context(self):
+        assert CardComponent("a").render_from_parent_context() == "<div>a  </div>"
+        assert CardComponent("a").render_from_parent_context() == "<div>a  </div>"
+        assert CardComponent.rendered == 1
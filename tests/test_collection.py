@@ -0,0 +1,146 @@
+import pytest
+from django.template import Context, Template
+from django.template.exceptions import TemplateSyntaxError
+
+from django_viewcomponent import component
+from django_viewcomponent.fields import RendersOneField
+from tests.utils import assert_dom_equal
+
+
+class PostRowComponent(component.Component):
+    template = """
+    <tr class="{% if self.post_iteration.first %}first{% endif %}{% if self.post_iteration.last %}last{% endif %}">
+      <td>{{ self.post_counter }}</td><td>{{ self.post }}</td><td>{{ self.label }}{{ suffix }}</td>
+    </tr>
+    """
+
+    def __init__(self, post, post_counter, post_iteration, label="", **kwargs):
+        self.post = post
+        self.post_counter = post_counter
+        self.post_iteration = post_iteration
+        self.label = label
+
+
+class ItemComponent(component.Component):
+    collection_parameter = "entry"
+
+    template = "<li>{{ self.entry }}</li>"
+
+    def __init__(self, entry):
+        self.entry = entry
+
+
+class CardComponent(component.Component):
+    header = RendersOneField()
+
+    template = "<div>{{ self.card }}{% if self.header.filled %}{{ self.header.value }}{% endif %}</div>"
+
+    def __init__(self, card, **kwargs):
+        self.card = card
+
+
+class DynamicTemplateComponent(component.Component):
+    def __init__(self, dynamic, **kwargs):
+        self.dynamic = dynamic
+
+    def get_template_string(self):
+        return f"<i>{self.dynamic}</i>"
+
+
+def test_collection_parameter():
+    assert PostRowComponent.get_collection_parameter() == "post_row"
+    assert ItemComponent.get_collection_parameter() == "entry"
+
+
+def test_render_collection():
+    rendered = PostRowComponent.render_collection(
+        ["a", "b", "c"],
+        {"suffix": "!"},
+        as_var="post",
+        label="x",
+    )
+    expected = """
+    <tr class="first"><td>1</td><td>a</td><td>x!</td></tr>
+    <tr class=""><td>2</td><td>b</td><td>x!</td></tr>
+    <tr class="last"><td>3</td><td>c</td><td>x!</td></tr>
+    """
+    assert_dom_equal(expected, rendered)
+
+
+def test_counter_only_passed_when_accepted():
+    rendered = ItemComponent.render_collection(iter(["a", "b"]))
+    assert rendered == "<li>a</li><li>b</li>"
+
+
+def test_empty_collection():
+    assert ItemComponent.render_collection([]) == ""
+
+
+def test_slot_fields_are_empty():
+    assert CardComponent.render_collection(["a"]) == "<div>a</div>"
+
+
+def test_required_slot_field():
+    class RequiredHeaderComponent(CardComponent):
+        header = RendersOneField(required=True)
+
+    with pytest.raises(ValueError, match="Field header is required"):
+        RequiredHeaderComponent.render_collection(["a"], as_var="card")
+
+
+def test_template_fetched_once(monkeypatch):
+    calls = []
+    get_template = CardComponent.get_template
+
+    def spy(self):
+        calls.append(self)
+        return get_template(self)
+
+    monkeypatch.setattr(component.Component, "get_template", spy)
+    CardComponent.render_collection(["a", "b", "c"])
+    assert len(calls) == 1
+
+
+def test_dynamic_template():
+    rendered = DynamicTemplateComponent.render_collection(["a", "b"], as_var="dynamic")
+    assert rendered == "<i>a</i><i>b</i>"
+
+
+def test_context_is_not_leaked():
+    context = Context({"suffix": "!"})
+    PostRowComponent.render_collection(["a"], context, as_var="post")
+    assert "self" not in context
+    assert len(context.dicts) == 2
+
+
+class TestCollectionTag:
+    @pytest.fixture(autouse=True)
+    def register_component(self):
+        component.registry.register("post_row", PostRowComponent)
+        component.registry.register("item", ItemComponent)
+
+    def test_tag(self):
+        template = Template(
+            """
+            {% load viewcomponent_tags %}
+            <ul>{% component_collection "item" items %}</ul>
+            <table>{% component_collection "post_row" posts as_var="post" label=label %}</table>
+            """,
+        )
+        rendered = template.render(
+            Context({"items": ["a", "b"], "posts": ["p"], "label": "x"}),
+        )
+        expected = """
+        <ul><li>a</li><li>b</li></ul>
+        <table><tr class="firstlast"><td>1</td><td>p</td><td>x</td></tr></table>
+        """
+        assert_dom_equal(expected, rendered)
+
+    def test_tag_without_collection(self):
+        with pytest.raises(TemplateSyntaxError):
+            Template(
+                """
+                {% load viewcomponent_tags %}
+                {% component_collection "item" %}
+                """,
+            )
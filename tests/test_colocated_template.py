@@ -0,0 +1,107 @@
+import importlib
+import os
+import sys
+import textwrap
+
+import pytest
+from django.template import Context
+from django.test import override_settings
+
+from django_viewcomponent import component
+
+CARD_MODULE = textwrap.dedent(
+    """
+    from django_viewcomponent import component
+
+
+    class CardComponent(component.Component):
+        template_name = "card/card.html"
+    """,
+)
+
+
+@pytest.fixture
+def card_component(tmp_path, monkeypatch):
+    package = tmp_path / "colocated_cards" / "card"
+    package.mkdir(parents=True)
+    (package / "card.py").write_text(CARD_MODULE)
+    (package / "card.html").write_text("<div>card</div>")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    module = importlib.import_module("colocated_cards.card.card")
+    yield module.CardComponent, package / "card.html"
+    for name in (
+        "colocated_cards.card.card",
+        "colocated_cards.card",
+        "colocated_cards",
+    ):
+        sys.modules.pop(name, None)
+
+
+def render(component_cls):
+    return component_cls().render_from_parent_context(Context())
+
+
+def test_colocated_template_skips_loaders(card_component, monkeypatch):
+    component_cls, path = card_component
+    # the template name is not found by the loaders
+    monkeypatch.setattr(
+        "django_viewcomponent.component.get_template",
+        lambda name: pytest.fail("loaders should not be used"),
+    )
+    assert render(component_cls) == "<div>card</div>"
+
+    template = component_cls().get_template()
+    assert template.origin.name == str(path)
+    assert component_cls().get_template() is template
+
+
+def test_template_is_not_reloaded(card_component):
+    component_cls, path = card_component
+    assert render(component_cls) == "<div>card</div>"
+
+    path.write_text("<div>changed</div>")
+    os.utime(path, (0, 1))
+    assert render(component_cls) == "<div>card</div>"
+
+
+@override_settings(DEBUG=True)
+def test_template_is_reloaded_in_debug(card_component):
+    component_cls, path = card_component
+    assert render(component_cls) == "<div>card</div>"
+
+    path.write_text("<div>changed</div>")
+    os.utime(path, (0, 1))
+    assert render(component_cls) == "<div>changed</div>"
+
+
+def test_template_name_of_other_directory(tmp_path):
+    class OtherComponent(component.Component):
+        template_name = "simple_template.html"
+
+    # tests/templates/simple_template.html is found by the loaders, once
+    template = OtherComponent().get_template()
+    assert template.origin.name.endswith(
+        os.path.join("templates", "simple_template.html"),
+    )
+    assert OtherComponent().get_template() is template
+
+
+def test_pinned_templates_are_per_class():
+    class ParentComponent(component.Component):
+        template_name = "simple_template.html"
+
+    class ChildComponent(ParentComponent):
+        pass
+
+    ParentComponent().get_template()
+    assert "simple_template.html" in ParentComponent._pinned_templates
+    assert ChildComponent._pinned_templates == {}
+
+
+def test_colocated_path_must_match_template_name(card_component):
+    component_cls, path = card_component
+    assert component_cls._get_colocated_template_path("card.html") == str(path)
+    assert component_cls._get_colocated_template_path("card/card.html") == str(path)
+    assert component_cls._get_colocated_template_path("other/card.html") is None
+    assert component_cls._get_colocated_template_path("missing.html") is None
@@ -0,0 +1,128 @@
+import pytest
+from django.template import Context, Template
+
+from django_viewcomponent import component
+from django_viewcomponent.compiler import (
+    CompiledNodeList,
+    compile_nodelist,
+    render_compiled,
+)
+from django_viewcomponent.fields import RendersManyField, RendersOneField
+from django_viewcomponent.template_cache import template_cache
+from tests.utils import assert_dom_equal
+
+
+@pytest.mark.parametrize(
+    "template_string",
+    [
+        "plain text",
+        "{{ name }} {{ missing }} {{ html }} {{ html|safe }} {{ name|upper|default:'x' }}",
+        "{% if name == 'a' %}A{% elif name %}B{% else %}C{% endif %}",
+        "{% if missing.attr > 1 %}yes{% else %}no{% endif %}",
+        "{% for item in items reversed %}{{ forloop.counter }}/{{ forloop.revcounter0 }}"
+        "{% if forloop.first %}F{% endif %}{% if forloop.last %}L{% endif %}{{ item }}"
+        "{% endfor %}",
+        "{% for item in missing %}{{ item }}{% empty %}empty{% endfor %}",
+        "{% for key, value in pairs %}{{ key }}={{ value }}{% endfor %}",
+        "{% for row in rows %}{% for item in row %}{{ forloop.parentloop.counter }}"
+        "{{ item }}{% endfor %}{% endfor %}",
+        "{% with greeting='hi' name=name|upper %}{{ greeting }} {{ name }}{% endwith %}",
+        "{% spaceless %} <b> {{ name }} </b> {% endspaceless %}{% now 'Y' as year %}",
+    ],
+)
+def test_compiled_output_is_same(template_string):
+    data = {
+        "name": "a",
+        "html": "<b>",
+        "items": [1, 2, 3],
+        "pairs": [("x", 1), ("y", 2)],
+        "rows": [[1, 2], [3]],
+    }
+    template = Template(template_string)
+    expected = template.render(Context(data))
+
+    assert render_compiled(template, Context(data)) == expected
+    assert isinstance(template._viewcomponent_compiled, CompiledNodeList)
+
+
+def test_for_unpack_error():
+    template = Template("{% for a, b in items %}{{ a }}{% endfor %}")
+    with pytest.raises(ValueError):
+        render_compiled(template, Context({"items": [(1, 2, 3)]}))
+
+
+def test_compile_nodelist_once():
+    nodelist = compile_nodelist(Template("{{ name }}").nodelist)
+    assert compile_nodelist(nodelist) is nodelist
+
+
+class BadgeComponent(component.Component):
+    compile_template = True
+
+    template = """<span class="badge {% if self.pill %}pill{% endif %}">{{ self.label }}</span>"""
+
+    def __init__(self, label, pill=False, **kwargs):
+        self.label = label
+        self.pill = pill
+
+
+class CardComponent(component.Component):
+    compile_template = True
+
+    header = RendersOneField()
+    badges = RendersManyField(component="badge")
+
+    template = """
+    <div class="card">
+      {{ self.header.value }}
+      {% for badge in self.badges.value %}{{ badge }}{% endfor %}
+      {{ self.content }}
+    </div>
+    """
+
+
+class TestCompiledComponent:
+    @pytest.fixture(autouse=True)
+    def register_component(self):
+        component.registry.register("badge", BadgeComponent)
+        component.registry.register("card", CardComponent)
+        template_cache.clear()
+
+    def test_render(self):
+        template = Template(
+            """
+            {% load viewcomponent_tags %}
+            {% component "card" as card %}
+              {% call card.header %}<h1>{{ title }}</h1>{% endcall %}
+              {% for label in labels %}
+                {% call card.badges label=label pill=forloop.first %}{% endcall %}
+              {% endfor %}
+              content
+            {% endcomponent %}
+            """,
+        )
+        expected = """
+        <div class="card">
+          <h1>Title</h1>
+          <span class="badge pill">a</span><span class="badge ">b</span>
+          content
+        </div>
+        """
+        for _ in range(2):
+            rendered = template.render(
+                Context({"title": "Title", "labels": ["a", "b"]}),
+            )
+            assert_dom_equal(expected, rendered)
+
+    def test_render_from_parent_context(self):
+        html = BadgeComponent(label="new").render_from_parent_context()
+        assert html == '<span class="badge ">new</span>'
+
+    def test_debug_falls_back(self, monkeypatch):
+        template = BadgeComponent(label="x").get_template()
+        monkeypatch.setattr(template.engine, "debug", True)
+
+        assert BadgeComponent(label="x").render_from_parent_context() == (
+            '<span class="badge ">x</span>'
+        )
+        assert not hasattr(template, "_viewcomponent_compiled")
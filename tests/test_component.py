@@ -1,8 +1,15 @@
 import pytest
 from django.core.exceptions import ImproperlyConfigured
-from django.template import Context
+from django.template import Context, Template
 
 from django_viewcomponent import component
+from django_viewcomponent.fields import (
+    BaseSlotField,
+    RendersManyField,
+    RendersOneField,
+    SlotFieldState,
+)
+from django_viewcomponent.template_cache import CacheInfo, TemplateCache, template_cache
 from tests.utils import assert_dom_equal
 
 
@@ -90,3 +97,162 @@ class TestComponentContext:
             "<div>test</div><div>test</div><div>test</div>",
             comp.render(comp.get_context_data()),
         )
+
+
+class TestTemplateCache:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        template_cache.clear()
+
+    def test_inline_template_compiled_once(self):
+        class SimpleComponent(component.Component):
+            template = "<div>{{ self.size }}</div>"
+
+            def __init__(self, size):
+                self.size = size
+
+        assert (
+            SimpleComponent(size="sm").get_template()
+            is SimpleComponent(
+                size="lg",
+            ).get_template()
+        )
+        assert template_cache.info().misses == 1
+        assert template_cache.info().hits == 1
+
+        comp = SimpleComponent(size="lg")
+        assert_dom_equal("<div>lg</div>", comp.render(comp.get_context_data()))
+
+    def test_redefined_class_invalidates_entry(self):
+        def define():
+            class SimpleComponent(component.Component):
+                template = "<div></div>"
+
+            return SimpleComponent
+
+        old_cls, new_cls = define(), define()
+        old_template = old_cls().get_template()
+
+        assert new_cls().get_template() is not old_template
+        assert template_cache.info().currsize == 1
+
+    def test_lru_eviction(self):
+        class SimpleComponent(component.Component):
+            pass
+
+        cache = TemplateCache(maxsize=2)
+        first = cache.get(SimpleComponent, "first")
+        cache.get(SimpleComponent, "second")
+        # refresh "first" so "second" is the least recently used one
+        assert cache.get(SimpleComponent, "first") is first
+        cache.get(SimpleComponent, "third")
+
+        assert cache.info() == CacheInfo(hits=1, misses=3, maxsize=2, currsize=2)
+        assert cache.get(SimpleComponent, "first") is first
+        assert cache.info().misses == 3
+
+
+class TestSlotFieldsTable:
+    def test_slot_fields_collected_at_class_creation(self):
+        class BlogComponent(component.Component):
+            header = RendersOneField()
+            posts = RendersManyField()
+
+        assert dict(BlogComponent._slot_fields) == {
+            "header": BlogComponent.__dict__["header"],
+            "posts": BlogComponent.__dict__["posts"],
+        }
+        assert component.Component._slot_fields == {}
+
+        with pytest.raises(TypeError):
+            BlogComponent._slot_fields["footer"] = RendersOneField()
+
+    def test_slot_fields_inheritance(self):
+        class BaseComponent(component.Component):
+            header = RendersOneField()
+            footer = RendersOneField()
+
+        class ChildComponent(BaseComponent):
+            header = RendersOneField(required=True)
+            footer = None
+            posts = RendersManyField()
+
+        assert set(BaseComponent._slot_fields) == {"header", "footer"}
+        assert set(ChildComponent._slot_fields) == {"header", "posts"}
+        assert ChildComponent._slot_fields["header"].required
+
+    def test_slot_field_state_per_instance(self):
+        class BlogComponent(component.Component):
+            header = RendersOneField(required=True)
+
+        first, second = BlogComponent(), BlogComponent()
+        first.create_slot_fields()
+        second.create_slot_fields()
+
+        assert isinstance(first.header, SlotFieldState)
+        assert first.header is not second.header
+        assert first.header.field is second.header.field is BlogComponent.header
+        assert first.header.parent_component is first
+        assert first.header.required
+        assert first.header.value is None
+        assert not first.header.filled
+
+        first.header.value = "header"
+        first.header.filled = True
+        assert second.header.value is None
+        assert not second.header.filled
+
+    def test_legacy_handle_call(self):
+        with pytest.deprecated_call():
+
+            class UpperField(BaseSlotField):
+                def handle_call(
+                    self,
+                    nodelist,
+                    context,
+                    target_var,
+                    polymorphic_type,
+                    **kwargs,
+                ):
+                    self._value = nodelist.render(context).upper()
+                    self._filled = True
+
+        class BlogComponent(component.Component):
+            header = UpperField(required=True)
+
+            template = """
+            <h1>{{ self.header.value }}</h1>
+            <p>{{ self.header.parent_component.title }}</p>
+            """
+
+            def __init__(self, title, **kwargs):
+                self.title = title
+
+        component.registry.register("blog", BlogComponent)
+        template = Template(
+            """
+            {% load viewcomponent_tags %}
+            {% component "blog" title="first" as blog %}
+              {% call blog.header %}hello{% endcall %}
+            {% endcomponent %}
+            {% component "blog" title="second" as blog %}
+              {% call blog.header %}world{% endcall %}
+            {% endcomponent %}
+            """,
+        )
+        assert_dom_equal(
+            "<h1>HELLO</h1><p>first</p><h1>WORLD</h1><p>second</p>",
+            template.render(Context({})),
+        )
+        assert BlogComponent.header.value is None
+
+    def test_slot_dispatch_table(self):
+        class ListItemComponent(component.Component):
+            header = RendersOneField()
+            item = RendersOneField(types={"avatar": "avatar", "span": "span"})
+
+        assert dict(ListItemComponent._slot_dispatch) == {
+            "header": ("header", None),
+            "item_avatar": ("item", "avatar"),
+            "item_span": ("item", "span"),
+        }
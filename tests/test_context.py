@@ -1,3 +1,5 @@
+import threading
+
 import pytest
 from django.template import Context, Template
 
@@ -74,3 +76,56 @@ class TestContextBehavior:
         <div>test456</div>
         """
         assert_dom_equal(rendered, expected)
+
+
+class ValueComponent(component.Component):
+    template = "{{ self.value }}"
+
+    def __init__(self, value, **kwargs):
+        self.value = value
+
+
+class TestContextOwnership:
+    def test_no_shared_class_context(self):
+        first, second = ValueComponent(1), ValueComponent(2)
+        first_context = first.get_context_data()
+        second_context = second.get_context_data()
+
+        assert first_context is not second_context
+        assert first_context["self"] is first
+        assert second_context["self"] is second
+        assert component.Component.component_context is None
+
+    def test_context_released_after_render(self):
+        comp = ValueComponent(1)
+        assert comp.render_from_parent_context({"variable": "test"}) == "1"
+        assert comp.component_context is None
+
+        context = Context({"variable": "test"})
+        with comp.bind_context(context):
+            assert comp.component_context is context
+        assert comp.component_context is None
+
+    def test_thread_safety(self):
+        errors = []
+
+        def render(thread_index):
+            for i in range(200):
+                value = f"{thread_index}-{i}"
+                comp = ValueComponent(value)
+                if i % 2:
+                    rendered = comp.render(comp.get_context_data())
+                else:
+                    rendered = comp.render_from_parent_context()
+                if rendered != value:
+                    errors.append((value, rendered))
+
+        threads = [threading.Thread(target=render, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert component.Component.component_context is None
+        assert ValueComponent.component_context is None
@@ -0,0 +1,152 @@
+import contextvars
+
+import pytest
+from django.template import Context, Template
+
+from django_viewcomponent import component
+from django_viewcomponent.dataloader import (
+    BatchLoader,
+    get_render_pass,
+    load,
+    render_pass,
+)
+
+
+class UserLoader(BatchLoader):
+    default = "anonymous"
+    calls: list = []
+
+    def batch_load(self, keys):
+        self.calls.append(list(keys))
+        return {key: f"user{key}" for key in keys if key != 0}
+
+
+class ListLoader(BatchLoader):
+    def batch_load(self, keys):
+        return [key * 2 for key in keys]
+
+
+class BrokenLoader(BatchLoader):
+    def batch_load(self, keys):
+        return []
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    UserLoader.calls = []
+
+
+class UserCardComponent(component.Component):
+    template = "<li>{{ self.user }}</li>"
+
+    def __init__(self, user_id, **kwargs):
+        self.user_id = user_id
+
+    def prefetch(self):
+        self.user = self.load(UserLoader, self.user_id)
+
+
+class UserListComponent(component.Component):
+    template = "<ul>{{ self.content }}</ul>"
+
+
+def test_keys_are_loaded_in_one_batch():
+    rendered = UserCardComponent.render_collection(range(1, 201), as_var="user_id")
+    assert rendered.startswith("<li>user1</li><li>user2</li>")
+    assert UserLoader.calls == [list(range(1, 201))]
+
+
+def test_collection_tag():
+    component.registry.register("user_card", UserCardComponent)
+    template = Template(
+        """{% component_collection "user_card" ids as_var="user_id" %}""",
+    )
+    rendered = template.render(Context({"ids": [1, 2, 3]}))
+    assert rendered == "<li>user1</li><li>user2</li><li>user3</li>"
+    assert UserLoader.calls == [[1, 2, 3]]
+
+
+def test_render_children():
+    parent = UserListComponent()
+    children = [UserCardComponent(user_id=i) for i in (1, 2, 1)]
+    assert parent.render_children(children) == [
+        "<li>user1</li>",
+        "<li>user2</li>",
+        "<li>user1</li>",
+    ]
+    assert UserLoader.calls == [[1, 2]]
+
+
+def test_nested_components_share_the_render_pass():
+    component.registry.register("user_card", UserCardComponent)
+    component.registry.register("user_list", UserListComponent)
+    template = Template(
+        """
+        {% component "user_list" %}
+          {% component "user_card" user_id=1 %}{% endcomponent %}
+          {% component "user_card" user_id=1 %}{% endcomponent %}
+        {% endcomponent %}
+        """,
+    )
+    template.render(Context({}))
+    # the second card uses the value loaded in the render pass
+    assert UserLoader.calls == [[1]]
+
+
+def test_missing_key_gets_default():
+    with render_pass():
+        assert load(UserLoader, 0) == "anonymous"
+    assert UserLoader.calls == [[0]]
+
+
+def test_sequence_result():
+    with render_pass():
+        values = [load(ListLoader, key) for key in (1, 2, 3)]
+        assert values == [2, 4, 6]
+
+
+def test_sequence_result_length_is_checked():
+    with render_pass(), pytest.raises(ValueError):
+        str(load(BrokenLoader, 1))
+
+
+def test_load_without_render_pass():
+    assert get_render_pass() is None
+    assert load(UserLoader, 1) == "user1"
+    assert UserLoader.calls == [[1]]
+
+
+def test_render_pass_is_reused():
+    with render_pass() as outer:
+        with render_pass() as inner:
+            assert inner is outer
+        assert get_render_pass() is outer
+    assert get_render_pass() is None
+
+
+def test_render_pass_closed_in_another_context():
+    manager = render_pass()
+    contextvars.Context().run(manager.__enter__)
+
+    def close():
+        with render_pass() as other:
+            manager.__exit__(None, None, None)
+            return get_render_pass() is other
+
+    # the render pass of the other context is kept
+    assert contextvars.Context().run(close)
+
+
+def test_prefetch_is_called_once():
+    calls = []
+
+    class PrefetchComponent(component.Component):
+        template = "<span></span>"
+
+        def prefetch(self):
+            calls.append(self)
+
+    instance = PrefetchComponent()
+    instance.render_from_parent_context()
+    instance.render_from_parent_context()
+    assert calls == [instance]
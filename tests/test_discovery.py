@@ -0,0 +1,145 @@
+import importlib.util
+import os
+import sys
+
+import pytest
+
+from django_viewcomponent import (
+    component,
+    import_component_file,
+    import_component_files,
+    iter_unique_files,
+)
+from django_viewcomponent.app_settings import app_settings
+from django_viewcomponent.discovery import get_module_name, precompile_files
+
+COMPONENT_SOURCE = """
+from django_viewcomponent import component
+
+EXECUTED = globals().get("EXECUTED", 0) + 1
+
+
+@component.register("{name}")
+class ExampleComponent(component.Component):
+    template = "{name}"
+"""
+
+
+@pytest.fixture
+def components_dir(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for namespace in ("blog", "shop"):
+        directory = tmp_path / "myapp" / "components" / namespace / "example"
+        directory.mkdir(parents=True)
+        (directory / "example.py").write_text(
+            COMPONENT_SOURCE.format(name=f"{namespace}.example"),
+        )
+    yield tmp_path / "myapp" / "components"
+    for name in list(sys.modules):
+        if name.startswith("myapp."):
+            del sys.modules[name]
+
+
+def test_package_qualified_module_name(components_dir):
+    path = components_dir / "blog" / "example" / "example.py"
+    assert get_module_name(path) == "myapp.components.blog.example.example"
+
+
+def test_module_name_outside_sys_path(tmp_path):
+    name = get_module_name(tmp_path / "some-dir" / "example.py")
+    assert name.startswith("django_viewcomponent.discovered.example_")
+
+
+def test_same_stem_in_different_namespaces(components_dir):
+    import_component_files(iter_unique_files([components_dir]))
+
+    assert component.registry.get("blog.example").template == "blog.example"
+    assert component.registry.get("shop.example").template == "shop.example"
+    assert component.registry.get("blog.example") is not component.registry.get(
+        "shop.example",
+    )
+
+
+def test_overlapping_dirs_are_deduped(components_dir):
+    paths = list(iter_unique_files([components_dir, components_dir / "blog"]))
+    assert len(paths) == 2
+
+
+def test_file_is_executed_once(components_dir):
+    path = str(components_dir / "blog" / "example" / "example.py")
+    module = import_component_file(path)
+    assert import_component_file(path) is module
+    assert module.EXECUTED == 1
+
+    # the registry is restored without executing the module again
+    component.registry.clear()
+    import_component_file(path)
+    assert component.registry.get("blog.example") is module.ExampleComponent
+
+
+def test_unregistered_component_is_not_restored(components_dir):
+    path = str(components_dir / "blog" / "example" / "example.py")
+    import_component_file(path)
+
+    component.registry.unregister("blog.example")
+    import_component_file(path)
+    with pytest.raises(component.NotRegistered):
+        component.registry.get("blog.example")
+
+
+def test_failed_import_is_not_cached(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    path = tmp_path / "broken_component.py"
+    path.write_text("raise ValueError('broken')")
+
+    with pytest.raises(ValueError):
+        import_component_file(str(path))
+    assert "broken_component" not in sys.modules
+
+
+def test_precompile_files(components_dir, monkeypatch):
+    monkeypatch.setattr(sys, "dont_write_bytecode", False)
+    paths = list(iter_unique_files([components_dir]))
+
+    compiled = precompile_files(paths, workers=2, threshold=0)
+
+    assert sorted(compiled) == sorted(paths)
+    for path in paths:
+        assert os.path.exists(importlib.util.cache_from_source(path))
+
+    # bytecode is fresh now
+    assert precompile_files(paths, workers=2, threshold=0) == []
+
+
+def test_precompile_below_threshold(components_dir, monkeypatch):
+    monkeypatch.setattr(sys, "dont_write_bytecode", False)
+    paths = list(iter_unique_files([components_dir]))
+
+    assert precompile_files(paths, workers=2) == []
+
+
+def test_precompile_disabled(components_dir, monkeypatch):
+    monkeypatch.setattr(sys, "dont_write_bytecode", False)
+    monkeypatch.setattr(
+        "django_viewcomponent.discovery.ProcessPoolExecutor",
+        lambda **kwargs: pytest.fail("worker processes should not be started"),
+    )
+    paths = list(iter_unique_files([components_dir]))
+
+    assert app_settings.PRECOMPILE_WORKERS == 0
+    assert precompile_files(paths, workers=0, threshold=0) == []
+
+
+def test_precompile_skips_read_only_cache(components_dir, monkeypatch):
+    monkeypatch.setattr(sys, "dont_write_bytecode", False)
+    monkeypatch.setattr(
+        "django_viewcomponent.discovery.ProcessPoolExecutor",
+        lambda **kwargs: pytest.fail("worker processes should not be started"),
+    )
+    monkeypatch.setattr(
+        "django_viewcomponent.discovery.os.access",
+        lambda path, mode: False,
+    )
+    paths = list(iter_unique_files([components_dir]))
+
+    assert precompile_files(paths, workers=2, threshold=0) == []
@@ -0,0 +1,184 @@
+import asyncio
+import contextvars
+
+import pytest
+from django.http import HttpResponse
+from django.template import Context, Template
+from django.test import RequestFactory
+
+from django_viewcomponent import component
+from django_viewcomponent.fields import RendersManyField
+from django_viewcomponent.instrumentation import (
+    RenderStats,
+    collect_request_stats,
+    process_stats,
+)
+from django_viewcomponent.middleware import ComponentRenderStatsMiddleware
+from django_viewcomponent.signals import (
+    component_render_finished,
+    component_render_started,
+)
+
+
+class ItemComponent(component.Component):
+    template = "<li>{{ self.title }}</li>"
+
+    def __init__(self, title=None, **kwargs):
+        self.title = title
+
+
+class ListComponent(component.Component):
+    items = RendersManyField(required=True, component="item")
+
+    template = """<ul>{% for item in self.items.value %}{{ item }}{% endfor %}</ul>"""
+
+
+TEMPLATE = """
+{% load viewcomponent_tags %}
+{% component "list" as component %}
+  {% call component.items title="a" %}{% endcall %}
+  {% call component.items title="b" %}{% endcall %}
+{% endcomponent %}
+"""
+
+
+@pytest.fixture
+def events():
+    events = []
+
+    def on_started(sender, **kwargs):
+        events.append(("started", sender, kwargs))
+
+    def on_finished(sender, **kwargs):
+        events.append(("finished", sender, kwargs))
+
+    component_render_started.connect(on_started)
+    component_render_finished.connect(on_finished)
+    yield events
+    component_render_started.disconnect(on_started)
+    component_render_finished.disconnect(on_finished)
+
+
+class TestRenderSignals:
+    @pytest.fixture(autouse=True)
+    def register_component(self):
+        component.registry.register("list", ListComponent)
+        component.registry.register("item", ItemComponent)
+
+    def test_nested_render(self, events):
+        Template(TEMPLATE).render(Context())
+
+        assert [
+            (event, kwargs["name"], kwargs["depth"]) for event, _, kwargs in events
+        ] == [
+            ("started", "list", 0),
+            ("started", "item", 1),
+            ("finished", "item", 1),
+            ("started", "item", 1),
+            ("finished", "item", 1),
+            ("finished", "list", 0),
+        ]
+
+        event, sender, kwargs = events[-1]
+        assert sender is ListComponent
+        assert isinstance(kwargs["component"], ListComponent)
+        assert kwargs["duration"] >= 0
+        assert kwargs["size"] == len("<ul><li>a</li><li>b</li></ul>")
+
+    def test_render_from_parent_context(self, events):
+        ItemComponent(title="a").render_from_parent_context()
+
+        assert [event for event, _, _ in events] == ["started", "finished"]
+        assert events[1][2]["size"] == len("<li>a</li>")
+
+    def test_unregistered_component_name(self, events):
+        class Local(component.Component):
+            template = "local"
+
+        Local().render_from_parent_context()
+        assert events[0][2]["name"] == Local.__qualname__
+
+    def test_stream(self, events):
+        chunks = list(ItemComponent(title="a").stream())
+
+        assert events[-1][0] == "finished"
+        assert events[-1][2]["size"] == len("".join(chunks))
+
+    def test_arender(self, events):
+        html = asyncio.run(ItemComponent(title="a").arender_from_parent_context())
+
+        assert [event for event, _, _ in events] == ["started", "finished"]
+        assert events[1][2]["size"] == len(html)
+
+    def test_no_receivers(self):
+        assert not component_render_started.receivers
+        assert ItemComponent(title="a").render_from_parent_context() == "<li>a</li>"
+
+
+class TestRenderStats:
+    @pytest.fixture(autouse=True)
+    def register_component(self):
+        component.registry.register("list", ListComponent)
+        component.registry.register("item", ItemComponent)
+
+    def test_record(self):
+        stats = RenderStats()
+        stats.record("item", 0.5, 10)
+        stats.record("item", 1.5, 20)
+
+        assert stats.snapshot() == {
+            "item": {
+                "count": 2,
+                "total_time": 2.0,
+                "max_time": 1.5,
+                "total_size": 30,
+            },
+        }
+        stats.reset()
+        assert stats.snapshot() == {}
+
+    def test_collect_request_stats(self):
+        with collect_request_stats() as stats:
+            Template(TEMPLATE).render(Context())
+
+        snapshot = stats.snapshot()
+        assert snapshot["list"]["count"] == 1
+        assert snapshot["item"]["count"] == 2
+
+        # not collected outside the block, the receiver is disconnected
+        assert not component_render_finished.receivers
+        Template(TEMPLATE).render(Context())
+        assert stats.snapshot() == snapshot
+
+    def test_nested_collect_request_stats(self):
+        with collect_request_stats() as outer:
+            with collect_request_stats() as inner:
+                Template(TEMPLATE).render(Context())
+            assert component_render_finished.receivers
+            Template(TEMPLATE).render(Context())
+
+        assert inner.snapshot()["item"]["count"] == 2
+        assert outer.snapshot()["item"]["count"] == 2
+        assert not component_render_finished.receivers
+
+    def test_stream_in_another_context(self):
+        with collect_request_stats() as stats:
+            chunks = ItemComponent(title="a").stream()
+            # a streaming response can advance the generator in different contexts
+            first = contextvars.copy_context().run(next, chunks)
+            rest = contextvars.copy_context().run(list, chunks)
+
+        assert "".join([first, *rest]) == "<li>a</li>"
+        assert stats.snapshot()["item"]["count"] == 1
+
+    def test_middleware(self):
+        process_stats.reset()
+
+        def view(request):
+            return HttpResponse(Template(TEMPLATE).render(Context()))
+
+        request = RequestFactory().get("/")
+        ComponentRenderStatsMiddleware(view)(request)
+
+        assert request.component_render_stats.snapshot()["item"]["count"] == 2
+        assert process_stats.snapshot()["item"]["count"] == 2
@@ -0,0 +1,172 @@
+import pathlib
+from typing import ClassVar, Optional
+
+import pytest
+from django.template import Context, Template, engines
+from django.test import override_settings
+
+from django_viewcomponent import component
+from django_viewcomponent.fields import RendersManyField, RendersOneField
+from django_viewcomponent.template_cache import template_cache
+from tests.utils import assert_dom_equal
+
+pytest.importorskip("jinja2")
+
+TEMPLATES = [
+    {
+        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "DIRS": [pathlib.Path(__file__).parent.absolute() / "templates"],
+        "APP_DIRS": False,
+        "OPTIONS": {
+            "loaders": [
+                "django.template.loaders.filesystem.Loader",
+                "django_viewcomponent.loaders.ComponentLoader",
+            ],
+            "builtins": [
+                "django_viewcomponent.templatetags.viewcomponent_tags",
+            ],
+        },
+    },
+    {
+        "BACKEND": "django.template.backends.jinja2.Jinja2",
+        "DIRS": [pathlib.Path(__file__).parent.absolute() / "templates" / "jinja2"],
+        "APP_DIRS": False,
+        "OPTIONS": {
+            "environment": "django_viewcomponent.jinja2.environment",
+        },
+    },
+]
+
+
+class BadgeComponent(component.Component):
+    template_engine = "jinja2"
+    # FileBadgeComponent unsets it
+    template: ClassVar[
+        Optional[str]
+    ] = """<span>{{ component.label }}{{ suffix }}</span>"""
+
+    def __init__(self, label, **kwargs):
+        self.label = label
+
+
+class CardComponent(component.Component):
+    template_engine = "jinja2"
+
+    header = RendersOneField(required=True)
+    badges = RendersManyField(component="badge")
+
+    template = """
+    <div class="card">
+      {{ component.header.value }}
+      {% for badge in component.badges.value %}{{ badge }}{% endfor %}
+      <p>{{ component.content }}</p>
+    </div>
+    """
+
+
+class DjangoListComponent(component.Component):
+    items = RendersManyField()
+
+    template = """
+    <ul>{% for item in self.items.value %}<li>{{ item }}</li>{% endfor %}</ul>
+    """
+
+
+class FileBadgeComponent(BadgeComponent):
+    template = None
+    template_name = "badge.html"
+
+
+@pytest.fixture(autouse=True)
+def jinja_settings():
+    with override_settings(TEMPLATES=TEMPLATES):
+        template_cache.clear()
+        component.registry.register("badge", BadgeComponent)
+        component.registry.register("card", CardComponent)
+        component.registry.register("django_list", DjangoListComponent)
+        yield
+    template_cache.clear()
+
+
+def render_jinja(template_string, **context):
+    return engines["jinja2"].from_string(template_string).render(context)
+
+
+def test_jinja_component_in_django_template():
+    template = Template(
+        """
+        {% load viewcomponent_tags %}
+        {% with suffix="!" %}
+          {% component "badge" label=label %}{% endcomponent %}
+        {% endwith %}
+        """,
+    )
+    rendered = template.render(Context({"label": "<new>"}))
+    assert_dom_equal("<span>&lt;new&gt;!</span>", rendered)
+
+
+def test_component_tag_in_jinja_template():
+    rendered = render_jinja(
+        """
+        {% component "card" as card %}
+          {% callslot card.header %}<h1>{{ title }}</h1>{% endcallslot %}
+          {% for label in labels %}
+            {% callslot card.badges label=label %}{% endcallslot %}
+          {% endfor %}
+          content
+        {% endcomponent %}
+        """,
+        title="<Title>",
+        labels=["a", "b"],
+        suffix="?",
+    )
+    expected = """
+    <div class="card">
+      <h1>&lt;Title&gt;</h1>
+      <span>a?</span><span>b?</span>
+      <p>content</p>
+    </div>
+    """
+    assert_dom_equal(expected, rendered)
+
+
+def test_django_component_in_jinja_template():
+    rendered = render_jinja(
+        """
+        {% component "django_list" as list %}
+          {% for i in range(2) %}
+            {% callslot list.items %}item {{ i }}{% endcallslot %}
+          {% endfor %}
+        {% endcomponent %}
+        """,
+    )
+    assert_dom_equal("<ul><li>item 0</li><li>item 1</li></ul>", rendered)
+
+
+def test_callslot_unknown_field():
+    with pytest.raises(ValueError, match="Field missing not found"):
+        render_jinja(
+            """
+            {% component "card" as card %}
+              {% callslot card.missing %}{% endcallslot %}
+            {% endcomponent %}
+            """,
+        )
+
+
+def test_component_loader():
+    template = engines["jinja2"].get_template("testapp/example/example.html")
+    assert template.render({"self": None}) == "<h1>Hello, !</h1>"
+
+
+def test_template_name():
+    rendered = FileBadgeComponent(label="<a>").render_from_parent_context()
+    assert rendered == "<b>&lt;a&gt;</b>"
+
+
+def test_render_iter_and_arender():
+    import asyncio
+
+    badge = BadgeComponent(label="a")
+    assert "".join(badge.render_iter({"suffix": "!"})) == "<span>a!</span>"
+    assert asyncio.run(badge.arender({"suffix": "?"})) == "<span>a?</span>"
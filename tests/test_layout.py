@@ -1,3 +1,8 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.template import Context
+
 from tests.testapp.layout import HTML, Button, Div
 
 from .utils import assert_select
@@ -41,3 +46,47 @@ class TestLayoutComponents:
         assert_select(html, "button.btn")
         assert_select(html, "button[type=button]")
         assert "world" in html
+
+    def test_render_children_in_order(self):
+        html = Div(
+            HTML("first"),
+            HTML("second"),
+            HTML("third"),
+        ).render_from_parent_context()
+        assert html.index("first") < html.index("second") < html.index("third")
+
+    def test_render_children_context_isolation(self):
+        class Push(HTML):
+            def get_context_data(self):
+                context = super().get_context_data()
+                context["pushed"] = "child"
+                return context
+
+        parent = Div()
+        context = Context({"pushed": "parent"})
+        html = parent.render_children(
+            [Push("{{ pushed }}"), HTML("{{ pushed }}")],
+            context,
+        )
+        assert html == ["child", "parent"]
+        assert context["pushed"] == "parent"
+
+    def test_render_io_bound_children_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        class IOBoundHTML(HTML):
+            io_bound = True
+
+            def get_context_data(self):
+                context = super().get_context_data()
+                # both children must be running at the same time to pass the barrier
+                barrier.wait()
+                return context
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            html = Div().render_children(
+                [IOBoundHTML("first"), HTML("second"), IOBoundHTML("third")],
+                Context({}),
+                executor=executor,
+            )
+        assert html == ["first", "second", "third"]
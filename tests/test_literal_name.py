@@ -0,0 +1,67 @@
+import pytest
+from django.template import Context, Template
+
+from django_viewcomponent import component
+
+
+class HelloComponent(component.Component):
+    template = "hello"
+
+
+class ByeComponent(component.Component):
+    template = "bye"
+
+
+@pytest.fixture(autouse=True)
+def register_components():
+    component.registry.register("greeting", HelloComponent)
+
+
+def get_node(template):
+    return template.nodelist[0]
+
+
+@pytest.mark.parametrize(
+    ("tag", "literal_name"),
+    [
+        ('{% component "greeting" %}{% endcomponent %}', "greeting"),
+        ("{% component 'greeting' %}{% endcomponent %}", "greeting"),
+        ("{% component name %}{% endcomponent %}", None),
+        ('{% component "greeting"|lower %}{% endcomponent %}', None),
+    ],
+)
+def test_literal_name(tag, literal_name):
+    assert get_node(Template(tag)).literal_name == literal_name
+
+
+def test_class_is_looked_up_once(monkeypatch):
+    template = Template('{% component "greeting" %}{% endcomponent %}')
+    calls = []
+    get = component.registry.get
+    monkeypatch.setattr(
+        component.registry,
+        "get",
+        lambda name: calls.append(name) or get(name),
+    )
+    assert template.render(Context()) == "hello"
+    assert template.render(Context()) == "hello"
+    assert calls == ["greeting"]
+
+
+def test_dynamic_name():
+    template = Template("{% component name %}{% endcomponent %}")
+    component.registry.register("farewell", ByeComponent)
+    assert template.render(Context({"name": "greeting"})) == "hello"
+    assert template.render(Context({"name": "farewell"})) == "bye"
+
+
+def test_invalidated_when_registry_changes():
+    template = Template('{% component "greeting" %}{% endcomponent %}')
+    assert template.render(Context()) == "hello"
+
+    component.registry.unregister("greeting")
+    with pytest.raises(component.NotRegistered):
+        template.render(Context())
+
+    component.registry.register("greeting", ByeComponent)
+    assert template.render(Context()) == "bye"
@@ -0,0 +1,81 @@
+from pathlib import Path
+
+import pytest
+from django.template import Context, TemplateDoesNotExist, engines
+from django.utils.autoreload import file_changed
+
+from django_viewcomponent.loaders import ComponentLoader, get_component_dirs
+
+TESTAPP_COMPONENTS = Path(__file__).parent.resolve() / "testapp" / "components"
+
+
+def get_engine():
+    return engines["django"].engine
+
+
+def test_component_dirs():
+    directories = get_component_dirs()
+    assert directories == [TESTAPP_COMPONENTS]
+    assert get_component_dirs() == directories
+
+
+def test_dirs_are_computed_once(monkeypatch):
+    loader = ComponentLoader(get_engine())
+    calls = []
+    monkeypatch.setattr(
+        "django_viewcomponent.loaders.get_component_dirs",
+        lambda: calls.append(1) or [TESTAPP_COMPONENTS],
+    )
+    loader.get_dirs()
+    loader.get_dirs()
+    assert calls == [1]
+
+
+def test_index():
+    index = ComponentLoader(get_engine()).get_index()
+    assert index == {
+        "testapp/example/example.html": str(
+            TESTAPP_COMPONENTS / "testapp" / "example" / "example.html",
+        ),
+    }
+
+
+def test_get_template():
+    loader = ComponentLoader(get_engine())
+    template = loader.get_template("testapp/example/example.html")
+    assert template.origin.name == str(
+        TESTAPP_COMPONENTS / "testapp" / "example" / "example.html",
+    )
+    assert template.origin.loader is loader
+
+    assert list(loader.get_template_sources("missing.html")) == []
+    with pytest.raises(TemplateDoesNotExist):
+        loader.get_template("missing.html")
+
+
+def test_first_directory_wins(tmp_path):
+    first, second = tmp_path / "first", tmp_path / "second"
+    for directory in (first, second):
+        (directory / "card").mkdir(parents=True)
+        (directory / "card" / "card.html").write_text(directory.name)
+    (second / "card" / "card.py").write_text("")
+
+    loader = ComponentLoader(get_engine(), dirs=[first, second])
+    assert loader.get_index() == {"card/card.html": str(first / "card" / "card.html")}
+    assert loader.get_template("card/card.html").render(Context()) == "first"
+
+
+def test_name_which_is_not_normalized(tmp_path):
+    (tmp_path / "card.html").write_text("card")
+    loader = ComponentLoader(get_engine(), dirs=[tmp_path])
+    assert loader.get_template("./card.html").render(Context()) == "card"
+
+
+def test_reset_on_file_change(tmp_path):
+    loader = ComponentLoader(get_engine(), dirs=[tmp_path])
+    assert loader.get_index() == {}
+
+    path = tmp_path / "new.html"
+    path.write_text("new")
+    file_changed.send(sender=None, file_path=path)
+    assert loader.get_template("new.html").render(Context()) == "new"
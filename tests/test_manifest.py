@@ -0,0 +1,98 @@
+import json
+
+import pytest
+from django.core.management import call_command
+from django.template import Context, Template
+
+from django_viewcomponent import autodiscover_components, component
+from django_viewcomponent.app_settings import app_settings
+from django_viewcomponent.manifest import (
+    build_manifest,
+    read_manifest,
+    register_manifest,
+    write_manifest,
+)
+from tests.utils import assert_dom_equal
+
+
+@pytest.fixture
+def manifest_path(tmp_path):
+    path = tmp_path / "viewcomponent_manifest.json"
+    write_manifest(path, build_manifest())
+    component.registry.clear()
+    return path
+
+
+def test_build_manifest():
+    manifest = build_manifest()
+    assert manifest["testapp.example"].endswith("testapp/example/example.py")
+
+
+def test_manifest_paths_are_relative(manifest_path):
+    data = json.loads(manifest_path.read_text())
+    assert data["version"] == 1
+    assert not data["components"]["testapp.example"].startswith("/")
+
+    manifest = read_manifest(manifest_path)
+    assert manifest["testapp.example"].endswith("testapp/example/example.py")
+
+
+def test_read_missing_manifest(tmp_path):
+    assert read_manifest(tmp_path / "missing.json") is None
+    assert read_manifest(None) is None
+
+
+def test_lazy_registry(manifest_path):
+    assert register_manifest(manifest_path)
+    assert "testapp.example" not in component.registry._registry
+
+    template = Template(
+        """
+        {% load viewcomponent_tags %}
+        {% component 'testapp.example' %}{% endcomponent %}
+        """,
+    )
+    assert_dom_equal("<h1>Hello, World!</h1>", template.render(Context({})))
+    assert "testapp.example" in component.registry._registry
+
+
+def test_lazy_entry_not_registered(tmp_path):
+    component.registry.register_lazy("missing", str(tmp_path / "missing.py"))
+    (tmp_path / "missing.py").write_text("")
+
+    with pytest.raises(component.NotRegistered):
+        component.registry.get("missing")
+
+
+def test_all_loads_lazy_entries(manifest_path):
+    register_manifest(manifest_path)
+    assert "testapp.example" in component.registry.all()
+
+
+def test_autodiscover_lazy(manifest_path, monkeypatch):
+    monkeypatch.setitem(app_settings.settings, "lazy_autodiscover", True)
+    monkeypatch.setitem(app_settings.settings, "component_manifest", manifest_path)
+
+    autodiscover_components()
+    assert component.registry._registry == {}
+    assert component.registry.get("testapp.example").__name__ == "ExampleComponent"
+
+
+def test_autodiscover_lazy_without_manifest(tmp_path, monkeypatch):
+    monkeypatch.setitem(app_settings.settings, "lazy_autodiscover", True)
+    monkeypatch.setitem(
+        app_settings.settings,
+        "component_manifest",
+        tmp_path / "missing.json",
+    )
+
+    with pytest.warns(RuntimeWarning):
+        autodiscover_components()
+    assert "testapp.example" in component.registry._registry
+
+
+def test_manifest_command(tmp_path):
+    output = tmp_path / "manifest.json"
+    call_command("viewcomponent_manifest", output=str(output))
+
+    assert "testapp.example" in read_manifest(output)
@@ -0,0 +1,168 @@
+import pytest
+from django.http import HttpResponse
+from django.template import Context, Template
+
+from django_viewcomponent import component
+from django_viewcomponent.dataloader import get_render_pass, render_pass
+from django_viewcomponent.fields import RendersManyField
+from django_viewcomponent.middleware import RenderPassMiddleware
+
+
+class IconComponent(component.Component):
+    pure = True
+
+    template = '<i class="icon-{{ self.name }}">{{ self.content }}</i>'
+
+    renders = 0
+
+    def __init__(self, name, **kwargs):
+        self.name = name
+
+    def get_context_data(self, **kwargs):
+        IconComponent.renders += 1
+        return super().get_context_data(**kwargs)
+
+
+class TableComponent(component.Component):
+    rows = RendersManyField(component="icon")
+
+    template = "{% for row in self.rows.value %}{{ row }}{% endfor %}"
+
+
+@pytest.fixture(autouse=True)
+def register_components():
+    IconComponent.renders = 0
+    component.registry.register("icon", IconComponent)
+    component.registry.register("table", TableComponent)
+
+
+def render(template_string, context=None):
+    with render_pass():
+        return Template(template_string).render(Context(context or {}))
+
+
+def test_same_arguments_are_rendered_once():
+    rendered = render(
+        """{% for i in rows %}{% component "icon" name="check" %}{% endcomponent %}{% endfor %}""",
+        {"rows": range(3)},
+    )
+    assert rendered == '<i class="icon-check"></i>' * 3
+    assert IconComponent.renders == 1
+
+
+def test_different_arguments():
+    rendered = render(
+        """
+        {% component "icon" name="check" %}{% endcomponent %}
+        {% component "icon" name="cross" %}{% endcomponent %}
+        {% component "icon" name=name %}{% endcomponent %}
+        """,
+        {"name": "check"},
+    )
+    assert [line.strip() for line in rendered.strip().splitlines()] == [
+        '<i class="icon-check"></i>',
+        '<i class="icon-cross"></i>',
+        '<i class="icon-check"></i>',
+    ]
+    # literals are SafeString, they are not escaped like the str from the context
+    assert IconComponent.renders == 3
+
+
+def test_argument_types_are_compared():
+    render(
+        """
+        {% component "icon" name=1 %}{% endcomponent %}
+        {% component "icon" name=True %}{% endcomponent %}
+        """,
+        {"True": True},
+    )
+    assert IconComponent.renders == 2
+
+
+def test_static_content_is_part_of_the_key():
+    rendered = render(
+        """
+        {% component "icon" name="a" %}x{% endcomponent %}
+        {% component "icon" name="a" %}x{% endcomponent %}
+        {% component "icon" name="a" %}y{% endcomponent %}
+        """,
+    )
+    assert [line.strip() for line in rendered.strip().splitlines()] == [
+        '<i class="icon-a">x</i>',
+        '<i class="icon-a">x</i>',
+        '<i class="icon-a">y</i>',
+    ]
+    assert IconComponent.renders == 2
+
+
+def test_dynamic_content_is_not_memoized():
+    rendered = render(
+        """{% for i in rows %}{% component "icon" name="a" %}{{ i }}{% endcomponent %}{% endfor %}""",
+        {"rows": range(3)},
+    )
+    assert rendered == "".join(f'<i class="icon-a">{i}</i>' for i in range(3))
+    assert IconComponent.renders == 3
+
+
+def test_unhashable_arguments_are_not_memoized():
+    render(
+        """
+        {% component "icon" name=names %}{% endcomponent %}
+        {% component "icon" name=names %}{% endcomponent %}
+        """,
+        {"names": ["a"]},
+    )
+    assert IconComponent.renders == 2
+
+
+def test_without_render_pass():
+    template = Template(
+        """
+        {% component "icon" name="a" %}{% endcomponent %}
+        {% component "icon" name="a" %}{% endcomponent %}
+        """,
+    )
+    template.render(Context({}))
+    assert IconComponent.renders == 2
+
+
+def test_memoized_in_the_render_pass_of_the_parent():
+    component.registry.register("list", ListComponent)
+    Template("""{% component "list" %}{% endcomponent %}""").render(Context({}))
+    assert IconComponent.renders == 1
+
+
+class ListComponent(component.Component):
+    template = """
+    {% component "icon" name="a" %}{% endcomponent %}
+    {% component "icon" name="a" %}{% endcomponent %}
+    """
+
+
+def test_slot_fields():
+    rendered = render(
+        """
+        {% component "table" as table %}
+          {% for i in rows %}{% call table.rows name="check" %}{% endcall %}{% endfor %}
+        {% endcomponent %}
+        """,
+        {"rows": range(3)},
+    )
+    assert rendered.strip() == '<i class="icon-check"></i>' * 3
+    assert IconComponent.renders == 1
+
+
+def test_middleware(rf):
+    def view(request):
+        html = Template(
+            """
+            {% component "icon" name="a" %}{% endcomponent %}
+            {% component "icon" name="a" %}{% endcomponent %}
+            """,
+        ).render(Context({}))
+        assert get_render_pass() is request.component_render_pass
+        return HttpResponse(html)
+
+    RenderPassMiddleware(view)(rf.get("/"))
+    assert IconComponent.renders == 1
+    assert get_render_pass() is None
@@ -0,0 +1,83 @@
+import gc
+
+import pytest
+
+from django_viewcomponent import component
+from django_viewcomponent.preload import (
+    MemoryUsage,
+    PreloadReport,
+    memory_usage,
+    preload_components,
+)
+from django_viewcomponent.template_cache import TemplateCache
+
+
+class InlineComponent(component.Component):
+    template = "<b>{{ self.content }}</b>"
+
+
+class BrokenComponent(component.Component):
+    template = "{% if %}"
+
+
+@pytest.fixture
+def frozen(monkeypatch):
+    calls = []
+    monkeypatch.setattr(gc, "freeze", lambda: calls.append("freeze"))
+    return calls
+
+
+@pytest.fixture(autouse=True)
+def cache(monkeypatch):
+    cache = TemplateCache(maxsize=16)
+    monkeypatch.setattr("django_viewcomponent.warmup.template_cache", cache)
+    return cache
+
+
+def test_preload_components(frozen, cache):
+    component.registry.register("inline", InlineComponent)
+    component.registry.register("broken", BrokenComponent)
+
+    report = preload_components()
+    assert report.compiled == 1
+    assert [result.name for result in report.errors] == ["broken"]
+    assert report.frozen
+    assert frozen == ["freeze"]
+    assert cache.info().currsize == 1
+    assert report.rss_after > 0
+
+
+def test_preload_without_freeze(frozen):
+    report = preload_components(freeze=False)
+    assert not report.frozen
+    assert frozen == []
+
+
+def test_report_format():
+    report = PreloadReport(
+        results=[],
+        duration=0.5,
+        rss_before=10 * 1024 * 1024,
+        rss_after=12 * 1024 * 1024,
+        frozen=True,
+    )
+    assert report.saved_per_worker == 2 * 1024 * 1024
+    assert report.format(workers=4) == (
+        "compiled 0 component templates in 500.0ms, 2048KB shared with each worker "
+        "(8192KB for 4 workers)"
+    )
+
+
+def test_memory_usage():
+    usage = memory_usage()
+    assert usage.rss > 0
+    assert usage.format().startswith("rss=")
+
+
+def test_memory_usage_format():
+    usage = MemoryUsage(
+        rss=3 * 1024 * 1024,
+        shared=1024 * 1024,
+        private=2 * 1024 * 1024,
+    )
+    assert usage.format() == "rss=3.0MB shared=1.0MB private=2.0MB"
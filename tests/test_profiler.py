@@ -0,0 +1,119 @@
+import json
+
+import pytest
+from django.http import HttpResponse
+from django.template import Context, Template
+from django.test import RequestFactory
+
+from django_viewcomponent import component
+from django_viewcomponent.app_settings import app_settings
+from django_viewcomponent.fields import RendersManyField
+from django_viewcomponent.profiler import (
+    ComponentProfilerMiddleware,
+    profile_components,
+)
+from django_viewcomponent.signals import component_render_started
+from django_viewcomponent.template_cache import template_cache
+
+
+class ItemComponent(component.Component):
+    template = "<li>{{ self.title }}</li>"
+
+    def __init__(self, title=None, **kwargs):
+        self.title = title
+
+
+class ListComponent(component.Component):
+    items = RendersManyField(required=True, component="item")
+
+    template = """<ul>{% for item in self.items.value %}{{ item }}{% endfor %}</ul>"""
+
+
+TEMPLATE = """
+{% load viewcomponent_tags %}
+{% component "list" as component %}
+  {% call component.items title="a" %}{% endcall %}
+  {% call component.items title="b" %}{% endcall %}
+  {% call component.items title="c" %}{% endcall %}
+{% endcomponent %}
+"""
+
+
+class TestProfiler:
+    @pytest.fixture(autouse=True)
+    def register_component(self):
+        component.registry.register("list", ListComponent)
+        component.registry.register("item", ItemComponent)
+        template_cache.clear()
+
+    def test_render_tree(self):
+        with profile_components() as profile:
+            Template(TEMPLATE).render(Context())
+
+        assert len(profile.roots) == 1
+        root = profile.roots[0]
+        assert root.name == "list"
+        assert root.slot_calls == 3
+        assert root.template_compiles == 1
+        assert root.template_cached is False
+        assert [child.name for child in root.children] == ["item"] * 3
+        assert root.children[1].template_cached is True
+        assert root.self_time <= root.total_time
+
+        summary = profile.summary()
+        assert summary["item"]["count"] == 3
+        assert summary["item"]["max_siblings"] == 3
+        assert summary["list"]["slot_calls"] == 3
+
+        data = json.loads(profile.to_json())
+        assert data["tree"][0]["children"][0]["name"] == "item"
+
+    def test_template_name_compiled_once(self):
+        class FileComponent(component.Component):
+            template_name = "simple_template.html"
+
+        component.registry.register("file", FileComponent)
+        template = Template(
+            """
+            {% load viewcomponent_tags %}
+            {% component "file" %}{% endcomponent %}
+            {% component "file" %}{% endcomponent %}
+            """,
+        )
+        with profile_components() as profile:
+            template.render(Context())
+
+        first, second = profile.roots
+        assert first.template_compiles == 1
+        assert first.template_cached is False
+        assert second.template_compiles == 0
+        assert second.template_cached is True
+
+    def test_receivers_disconnected(self):
+        with profile_components():
+            assert component_render_started.receivers
+        assert not component_render_started.receivers
+
+    def test_middleware_panel(self, monkeypatch):
+        def view(request):
+            html = Template(TEMPLATE).render(Context())
+            return HttpResponse(f"<html><body>{html}</body></html>")
+
+        request = RequestFactory().get("/")
+        monkeypatch.setitem(app_settings.settings, "profiler_show_panel", True)
+        response = ComponentProfilerMiddleware(view)(request)
+
+        content = response.content.decode()
+        assert 'id="viewcomponent-profiler"' in content
+        assert content.index("viewcomponent-profiler") < content.index("</body>")
+        assert request.component_profile.summary()["item"]["count"] == 3
+
+    def test_middleware_sample_rate(self, monkeypatch):
+        def view(request):
+            return HttpResponse(Template(TEMPLATE).render(Context()))
+
+        request = RequestFactory().get("/")
+        monkeypatch.setitem(app_settings.settings, "profiler_sample_rate", 0)
+        ComponentProfilerMiddleware(view)(request)
+
+        assert not hasattr(request, "component_profile")
@@ -66,3 +66,23 @@ def test_simple_unregister(registry):
 def test_raises_on_failed_unregister(registry):
     with pytest.raises(component.NotRegistered):
         registry.unregister(name="testcomponent")
+
+
+def test_version_changes_with_the_registry(registry):
+    versions = [registry.version]
+    registry.register(name="testcomponent", component=MockComponent)
+    versions.append(registry.version)
+    registry.unregister(name="testcomponent")
+    versions.append(registry.version)
+    registry.clear()
+    versions.append(registry.version)
+    assert len(set(versions)) == 4
+
+
+def test_unregister_is_not_restored(registry):
+    registry.register(name="testcomponent", component=MockComponent)
+    registry.register(name="testcomponent2", component=MockComponent2)
+    registry.unregister(name="testcomponent")
+
+    registry.restore(MockComponent.__module__)
+    assert registry.all() == {"testcomponent2": MockComponent2}
@@ -0,0 +1,62 @@
+from django.http import StreamingHttpResponse
+from django.template import Context
+
+from django_viewcomponent import component
+from tests.utils import assert_dom_equal
+
+
+class ItemComponent(component.Component):
+    template = "<li>{{ self.name }}</li>"
+
+    def __init__(self, name, **kwargs):
+        self.name = name
+
+
+class DashboardComponent(component.Component):
+    template = """
+    {% load viewcomponent_tags %}
+    <h1>{{ title }}</h1>
+    <ul>
+    {% component "item" name="first" %}{% endcomponent %}
+    {% component "item" name="second" %}{% endcomponent %}
+    </ul>
+    """
+
+
+class TestStreaming:
+    def setup_method(self):
+        component.registry.register("item", ItemComponent)
+        component.registry.register("dashboard", DashboardComponent)
+
+    def test_stream_yields_chunks(self):
+        chunks = list(DashboardComponent().stream({"title": "Dashboard"}))
+
+        assert "<li>first</li>" in chunks
+        assert "<li>second</li>" in chunks
+        assert_dom_equal(
+            "<h1>Dashboard</h1><ul><li>first</li><li>second</li></ul>",
+            "".join(chunks),
+        )
+
+    def test_stream_same_as_render(self):
+        comp = DashboardComponent()
+        rendered = comp.render_from_parent_context({"title": "Dashboard"})
+        streamed = "".join(DashboardComponent().stream({"title": "Dashboard"}))
+        assert_dom_equal(rendered, streamed)
+
+    def test_render_iter(self):
+        comp = DashboardComponent()
+        context = comp.prepare_context(Context({"title": "Dashboard"}))
+        comp.component_context = context
+        chunks = list(comp.render_iter(comp.get_context_data()))
+        assert "<li>first</li>" in chunks
+
+    def test_streaming_http_response(self):
+        response = StreamingHttpResponse(
+            DashboardComponent().stream({"title": "Dashboard"}),
+        )
+        content = b"".join(response.streaming_content).decode()
+        assert_dom_equal(
+            "<h1>Dashboard</h1><ul><li>first</li><li>second</li></ul>",
+            content,
+        )
@@ -658,6 +658,17 @@ class TestTemplateSyntaxError:
             """,
             )
 
+    def test_call_without_slot_field_is_error(self):
+        with pytest.raises(TemplateSyntaxError):
+            Template(
+                """
+                {% load viewcomponent_tags %}
+                {% component "test" as component %}
+                    {% call component %}{% endcall %}
+                {% endcomponent %}
+            """,
+            )
+
     def test_fill_with_no_component_is_error(self):
         with pytest.raises(ValueError):
             Template(
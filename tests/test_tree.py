@@ -0,0 +1,225 @@
+import contextvars
+import json
+
+import pytest
+from django.template import Context, Template
+
+from django_viewcomponent import component
+from django_viewcomponent.app_settings import app_settings
+from django_viewcomponent.dataloader import BatchLoader
+from django_viewcomponent.fields import RendersManyField, RendersOneField
+from django_viewcomponent.tree import (
+    ComponentTree,
+    build_tree,
+    get_component_tree,
+    render_two_phase,
+    use_tree,
+)
+
+
+class UserLoader(BatchLoader):
+    calls: list = []
+
+    def batch_load(self, keys):
+        self.calls.append(list(keys))
+        return {key: f"user{key}" for key in keys}
+
+
+class UserCardComponent(component.Component):
+    template = "<li>{{ self.user }}</li>"
+
+    instances = 0
+
+    def __init__(self, user_id, **kwargs):
+        UserCardComponent.instances += 1
+        self.user_id = user_id
+
+    def prefetch(self):
+        self.user = self.load(UserLoader, self.user_id)
+
+
+class UserListComponent(component.Component):
+    template = """<ul>{% for id in self.user_ids %}{% component "user_card" user_id=id %}{% endcomponent %}{% endfor %}</ul>"""
+
+    def __init__(self, user_ids, **kwargs):
+        self.user_ids = user_ids
+
+
+class TableComponent(component.Component):
+    header = RendersOneField()
+    rows = RendersManyField(component="user_card")
+
+    template = """<table>{{ self.header.value }}{% for row in self.rows.value %}{{ row }}{% endfor %}</table>"""
+
+
+@pytest.fixture(autouse=True)
+def register_components():
+    UserLoader.calls = []
+    UserCardComponent.instances = 0
+    component.registry.register("user_card", UserCardComponent)
+    component.registry.register("user_list", UserListComponent)
+    component.registry.register("table", TableComponent)
+
+
+LOOP_TEMPLATE = """{% for id in ids %}{% component "user_card" user_id=id %}{% endcomponent %}{% endfor %}"""
+
+
+def test_loop_is_loaded_in_one_batch():
+    rendered = render_two_phase(Template(LOOP_TEMPLATE), {"ids": [1, 2, 3]})
+    assert rendered == "<li>user1</li><li>user2</li><li>user3</li>"
+    assert UserLoader.calls == [[1, 2, 3]]
+    # the components of phase one are rendered in phase two
+    assert UserCardComponent.instances == 3
+
+
+def test_reversed_loop():
+    template = Template(
+        """{% for id in ids reversed %}{% if forloop.last %}{% component "user_card" user_id=id %}{% endcomponent %}{% endif %}{% endfor %}""",
+    )
+    rendered = render_two_phase(template, {"ids": [1, 2, 3]})
+    assert rendered == "<li>user1</li>"
+    assert UserLoader.calls == [[1]]
+    assert UserCardComponent.instances == 1
+
+
+def test_loop_without_two_phase():
+    Template(LOOP_TEMPLATE).render(Context({"ids": [1, 2, 3]}))
+    assert UserLoader.calls == [[1], [2], [3]]
+
+
+def test_components_in_component_template():
+    template = Template(
+        """{% component "user_list" user_ids=ids %}{% endcomponent %}""",
+    )
+    rendered = render_two_phase(template, {"ids": [1, 2]})
+    assert rendered == "<ul><li>user1</li><li>user2</li></ul>"
+    assert UserLoader.calls == [[1, 2]]
+
+
+def test_slot_components():
+    template = Template(
+        """
+        {% component "table" as table %}
+          {% call table.header %}<tr><th>{{ title }}</th></tr>{% endcall %}
+          {% for id in ids %}{% call table.rows user_id=id %}{% endcall %}{% endfor %}
+        {% endcomponent %}
+        """,
+    )
+    rendered = render_two_phase(template, {"ids": [1, 2], "title": "Users"})
+    assert rendered.strip() == (
+        "<table><tr><th>Users</th></tr><li>user1</li><li>user2</li></table>"
+    )
+    assert UserLoader.calls == [[1, 2]]
+    assert UserCardComponent.instances == 2
+
+
+def test_setting(monkeypatch):
+    monkeypatch.setitem(app_settings.settings, "two_phase_render", True)
+    template = Template(
+        """{% component "user_list" user_ids=ids %}{% endcomponent %}""",
+    )
+    rendered = template.render(Context({"ids": [1, 2]}))
+    assert rendered == "<ul><li>user1</li><li>user2</li></ul>"
+    assert UserLoader.calls == [[1, 2]]
+
+
+def test_arguments_changed_in_phase_two():
+    class CounterComponent(component.Component):
+        template = "{{ self.value }}"
+
+        def __init__(self, value, **kwargs):
+            self.value = value
+
+    component.registry.register("counter", CounterComponent)
+    values = iter(range(10))
+    template = Template("""{% component "counter" value=next %}{% endcomponent %}""")
+    # the argument is resolved again in phase two, a new component is created
+    rendered = render_two_phase(template, {"next": lambda: next(values)})
+    assert rendered == "1"
+
+
+def test_introspection():
+    template = Template(
+        """
+        {% component "table" as table %}
+          {% call table.header %}{% component "user_card" user_id=1 %}{% endcomponent %}{% endcall %}
+          {% call table.rows user_id=1 %}{% endcall %}
+          {% call table.rows user_id=2 %}{% endcall %}
+        {% endcomponent %}
+        """,
+    )
+    context = Context({})
+    with context.bind_template(template):
+        tree = build_tree(template.nodelist, context)
+
+    (root,) = tree.roots
+    assert root.name == "table"
+    assert [call.field_name for call in root.slot_calls] == ["header", "rows", "rows"]
+    assert [child.slot for child in root.children] == [None, "rows", "rows"]
+    assert [node.kwargs for node in tree.find(UserCardComponent)] == [
+        {"user_id": 1},
+        {"user_id": 1},
+        {"user_id": 2},
+    ]
+    assert tree.find("user_card")[0].depth == 1
+    assert tree.count() == {"table": 1, "user_card": 3}
+    assert [len(group) for group in tree.duplicates()] == [2]
+
+    data = json.loads(tree.to_json())
+    assert data["tree"][0]["slot_calls"][1] == {
+        "field_name": "rows",
+        "kwargs": {"user_id": "1"},
+        "component": "user_card",
+    }
+
+
+def test_errors_are_raised_in_phase_two():
+    template = Template("""{% component "missing" %}{% endcomponent %}""")
+    with pytest.raises(component.NotRegistered):
+        render_two_phase(template)
+
+
+class FlakyUser:
+    """
+    Raise on the first call of `id`, in phase one
+    """
+
+    def __init__(self):
+        self.calls = 0
+
+    def id(self):
+        self.calls += 1
+        if self.calls == 1:
+            raise ValueError("flaky")
+        return 2
+
+    def ids(self):
+        return [self.id()]
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        """{% with id=user.id %}{% component "user_card" user_id=id %}{% endcomponent %}{% endwith %}""",
+        """{% for id in user.ids %}{% component "user_card" user_id=id %}{% endcomponent %}{% endfor %}""",
+    ],
+)
+def test_errors_of_phase_one_are_ignored(source):
+    user = FlakyUser()
+    rendered = render_two_phase(Template(source), {"user": user})
+    assert rendered == "<li>user2</li>"
+    assert user.calls == 2
+
+
+def test_use_tree_closed_in_another_context():
+    manager = use_tree(ComponentTree())
+    contextvars.Context().run(manager.__enter__)
+
+    def close():
+        other = ComponentTree()
+        with use_tree(other):
+            manager.__exit__(None, None, None)
+            return get_component_tree() is other
+
+    # the tree of the other context is kept
+    assert contextvars.Context().run(close)
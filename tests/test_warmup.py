@@ -0,0 +1,104 @@
+import io
+import logging
+
+import pytest
+from django.apps import apps
+from django.core.management import CommandError, call_command
+
+from django_viewcomponent import component
+from django_viewcomponent.app_settings import app_settings
+from django_viewcomponent.template_cache import TemplateCache
+from django_viewcomponent.warmup import warmup_component, warmup_components
+
+
+class InlineComponent(component.Component):
+    compile_template = True
+
+    template = "<b>{{ self.content }}</b>"
+
+
+class FileComponent(component.Component):
+    template_name = "simple_template.html"
+
+
+class DynamicComponent(component.Component):
+    def get_template_name(self):
+        return "simple_template.html"
+
+
+class BrokenComponent(component.Component):
+    template = "{% if %}"
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = TemplateCache(maxsize=16)
+    monkeypatch.setattr("django_viewcomponent.warmup.template_cache", cache)
+    monkeypatch.setattr("django_viewcomponent.component.template_cache", cache)
+    return cache
+
+
+def test_warmup_inline_template(cache):
+    assert warmup_component(InlineComponent) == "<inline>"
+    assert cache.info().misses == 1
+
+    template = InlineComponent().get_template()
+    assert cache.info().hits == 1
+    assert template._viewcomponent_compiled is not None
+
+
+def test_warmup_template_name():
+    assert warmup_component(FileComponent) == "simple_template.html"
+    assert "simple_template.html" in FileComponent._pinned_templates
+
+
+def test_dynamic_template_is_skipped():
+    assert warmup_component(DynamicComponent) is None
+
+
+def test_warmup_components(cache):
+    component.registry.register("inline", InlineComponent)
+    component.registry.register("dynamic", DynamicComponent)
+    component.registry.register("broken", BrokenComponent)
+
+    results = {result.name: result for result in warmup_components()}
+    assert results["inline"].template == "<inline>"
+    assert results["inline"].duration > 0
+    assert results["dynamic"].skipped
+    assert results["broken"].error is not None
+    assert not results["broken"].skipped
+
+
+def test_command(cache):
+    component.registry.register("inline", InlineComponent)
+    component.registry.register("file", FileComponent)
+    component.registry.register("dynamic", DynamicComponent)
+
+    stdout = io.StringIO()
+    call_command("viewcomponent_warmup", stdout=stdout)
+    output = stdout.getvalue()
+    assert "inline  <inline>" in output
+    assert "file  simple_template.html" in output
+    assert "dynamic  (skipped" in output
+    assert "Compiled 2 component templates" in output
+
+
+def test_command_fails_on_error(cache):
+    component.registry.register("broken", BrokenComponent)
+
+    stdout = io.StringIO()
+    with pytest.raises(CommandError):
+        call_command("viewcomponent_warmup", stdout=stdout)
+    assert "broken" in stdout.getvalue()
+
+
+def test_ready(cache, monkeypatch, caplog):
+    monkeypatch.setitem(app_settings.settings, "warmup_on_ready", True)
+    monkeypatch.setattr("django_viewcomponent.autodiscover_components", lambda: None)
+    monkeypatch.setattr("django_viewcomponent.autodiscover_previews", lambda: None)
+    component.registry.register("inline", InlineComponent)
+
+    with caplog.at_level(logging.INFO, logger="django_viewcomponent.warmup"):
+        apps.get_app_config("django_viewcomponent").ready()
+    assert cache.info().misses == 1
+    assert "compiled 1 component templates" in caplog.text
@@ -17,12 +17,7 @@ class Div(component.Component):
 
     def get_context_data(self):
         context = super().get_context_data()
-        self.fields_html = " ".join(
-            [
-                child_component.render_from_parent_context(context)
-                for child_component in self.fields
-            ],
-        )
+        self.fields_html = " ".join(self.render_children(self.fields, context))
         return context
 
 